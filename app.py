@@ -1,9 +1,37 @@
-from flask import Flask, Response, jsonify, render_template, request
+import time
+import uuid
+from functools import partial
+from typing import Callable
+
+from flask import Flask, Response, g, jsonify, render_template, request
 from flask.cli import load_dotenv
 
+from src.admission_controller import (
+    AdmissionController,
+    AdmissionRejectedError,
+)
+from src.alternative_optimizer import AlternativeOptimizer
+from src.batch_optimizer import BatchOptimizer
+from src.compiled_nutrition_model import CompiledModelRegistry
+from src.constraint import Constraint
+from src.food_catalog import FoodCatalog
+from src.food_information import FoodInformation
+from src.infeasibility_diagnoser import InfeasibilityDiagnoser
+from src.job_manager import JobManager
+from src.meal_plan_optimizer import MealPlanOptimizer
+from src.metrics import OptimizerMetrics
 from src.nutrition_optimizer import NutritionOptimizer
+from src.objective import Objective
+from src.pareto_optimizer import ParetoOptimizer
+from src.phase_timer import PhaseTimer
+from src.response_encoder import ResponseEncoder
+from src.single_flight import SingleFlight
 from src.singleton_logger import SingletonLogger
+from src.solve_cache import SolveCache
+from src.solver_settings import SolverSettings
 from src.utilities import Utilities
+from src.warm_start import WarmStart, WarmStartSessionStore
+from src.warm_up import WarmUp
 
 
 def create_app() -> Flask:
@@ -13,7 +41,108 @@ def create_app() -> Flask:
     return app
 
 
+_initialize_start = time.perf_counter()
 app = create_app()
+default_solver_settings = SolverSettings.from_environment()
+solve_cache = SolveCache.from_environment()
+food_catalog = FoodCatalog.from_environment()
+compiled_model_registry = CompiledModelRegistry.from_environment()
+batch_optimizer = BatchOptimizer.from_environment(
+    solve_cache, default_solver_settings, food_catalog
+)
+admission_controller = AdmissionController.from_environment()
+job_manager = JobManager.from_environment(solve_cache, admission_controller)
+pareto_optimizer = ParetoOptimizer.from_environment()
+alternative_optimizer = AlternativeOptimizer.from_environment()
+warm_start_sessions = WarmStartSessionStore.from_environment()
+optimizer_metrics = OptimizerMetrics()
+response_encoder = ResponseEncoder.from_environment()
+single_flight = SingleFlight()
+warm_up = WarmUp.from_environment()
+startup_durations = {"initialize": time.perf_counter() - _initialize_start}
+
+
+@app.before_request
+def _start_request_timer() -> None:
+    g.request_start = time.perf_counter()
+
+
+@app.after_request
+def _record_request_latency(response: Response) -> Response:
+    if request.path.startswith("/optimize") and "request_start" in g:
+        optimizer_metrics.record_request(time.perf_counter() - g.request_start)
+    return response
+
+
+def _solve_problem(
+    food_information: list[FoodInformation],
+    objective: Objective,
+    constraints: list[Constraint],
+    solver_settings: SolverSettings,
+    warm_start: WarmStart | None = None,
+    phase_timer: PhaseTimer | None = None,
+) -> dict:
+    with admission_controller.admit():
+        if (
+            compiled_model_registry is None
+            or solver_settings.solver in NutritionOptimizer.SOLVER_BACKENDS
+        ):
+            return NutritionOptimizer(
+                food_information,
+                objective,
+                constraints,
+                solver_settings,
+                warm_start=warm_start,
+                phase_timer=phase_timer,
+            ).solve()
+
+        with compiled_model_registry.acquire(
+            food_information
+        ) as compiled_model:
+            return NutritionOptimizer(
+                food_information,
+                objective,
+                constraints,
+                solver_settings,
+                compiled_model,
+                warm_start,
+                phase_timer,
+            ).solve()
+
+
+def _get_warm_start(data: dict, session_id: str | None) -> WarmStart | None:
+    if warm_start_sessions is not None and session_id is not None:
+        warm_start = warm_start_sessions.get(session_id)
+        if warm_start is not None:
+            return warm_start
+
+    return Utilities.parse_warm_start(data)
+
+
+def _save_warm_start_session(
+    session_id: str | None,
+    food_information: list[FoodInformation],
+    objective: Objective,
+    constraints: list[Constraint],
+    solver_settings: SolverSettings,
+    result: dict,
+) -> dict:
+    if (
+        warm_start_sessions is None
+        or result["status"] != "Optimal"
+        or not solver_settings.is_exact
+    ):
+        return result
+
+    session_id = session_id or uuid.uuid4().hex
+    warm_start_sessions.save(
+        session_id,
+        food_information,
+        objective,
+        constraints,
+        result["food_intakes"],
+    )
+    return {**result, "session_id": session_id}
 
 
 @app.route("/")
@@ -21,28 +150,426 @@ def index() -> str:
     return render_template("index.html")
 
 
+def _solve_with_cache(
+    food_information: list[FoodInformation],
+    objective: Objective,
+    constraints: list[Constraint],
+    solver_settings: SolverSettings,
+    solve: Callable[[], dict],
+    problem_hash: str,
+) -> dict:
+    if solve_cache is None:
+        return single_flight.do(problem_hash, solve)
+
+    return single_flight.do(
+        problem_hash,
+        partial(
+            solve_cache.get_or_solve,
+            food_information,
+            objective,
+            constraints,
+            solve,
+            solver_settings,
+            problem_hash,
+        ),
+    )
+
+
+_CONFLICTS_MESSAGE = (
+    "The listed constraints and intake bounds cannot be satisfied together."
+    " Relaxing one of them to its relaxed value makes the problem feasible."
+)
+
+
+def _diagnose_infeasibility(
+    food_information: list[FoodInformation],
+    constraints: list[Constraint],
+    solver_settings: SolverSettings,
+    phase_timer: PhaseTimer,
+    result: dict,
+) -> dict:
+    try:
+        with admission_controller.try_admit(), phase_timer.measure("diagnose"):
+            conflicts = InfeasibilityDiagnoser(
+                food_information, constraints, solver_settings
+            ).diagnose()
+    except RuntimeError as e:
+        SingletonLogger.get_logger().warning(
+            f"Error during infeasibility diagnosis: {str(e)}"
+        )
+        return result
+
+    if not conflicts:
+        return result
+    return {
+        **result,
+        "message": _CONFLICTS_MESSAGE,
+        "conflicts": conflicts,
+    }
+
+
+def _create_optimize_response(
+    result: dict, problem_hash: str, phase_timer: PhaseTimer
+) -> Response:
+    etag = (
+        problem_hash
+        if result["status"] in SolveCache.CACHEABLE_STATUSES
+        and "conflicts" not in result
+        else None
+    )
+    with phase_timer.measure("serialize"):
+        response = response_encoder.create_response(request, result, etag)
+    response.headers["Server-Timing"] = phase_timer.to_server_timing()
+    return response
+
+
+def _create_rejected_response(
+    e: AdmissionRejectedError,
+) -> tuple[Response, int, dict]:
+    SingletonLogger.get_logger().warning(f"Solve rejected: {str(e)}")
+    return (
+        jsonify({"status": "Error", "message": str(e)}),
+        e.status_code,
+        {"Retry-After": str(e.retry_after)},
+    )
+
+
 @app.route("/optimize", methods=["POST"])
-def optimize() -> Response:
+def optimize() -> Response | tuple[Response, int, dict]:
+    phase_timer = PhaseTimer()
     try:
         logger = SingletonLogger.get_logger()
-        food_information, objective, constraints = (
-            Utilities.parse_request_data(request)
-        )
+        with phase_timer.measure("parse"):
+            data = Utilities.load_request_json(request)
+            food_information, objective, constraints = (
+                Utilities.parse_problem_data(data, food_catalog)
+            )
+            solver_settings = Utilities.parse_solver_settings(
+                data, default_solver_settings
+            )
+            session_id = Utilities.parse_session_id(data)
+            diagnose = Utilities.parse_diagnose(data)
+            warm_start = _get_warm_start(data, session_id)
+            problem_hash = SolveCache.compute_key(
+                food_information, objective, constraints, solver_settings
+            )
 
-        nutrition_optimizer = NutritionOptimizer(
-            food_information, objective, constraints
+        if not diagnose and ResponseEncoder.is_not_modified(
+            request, problem_hash
+        ):
+            optimizer_metrics.record_status("NotModified")
+            return ResponseEncoder.create_not_modified_response(problem_hash)
+
+        solve = partial(
+            _solve_problem,
+            food_information,
+            objective,
+            constraints,
+            solver_settings,
+            warm_start,
+            phase_timer,
+        )
+        result = _solve_with_cache(
+            food_information,
+            objective,
+            constraints,
+            solver_settings,
+            solve,
+            problem_hash,
         )
-        result = nutrition_optimizer.solve()
+        result = _save_warm_start_session(
+            session_id,
+            food_information,
+            objective,
+            constraints,
+            solver_settings,
+            result,
+        )
+        if diagnose and result["status"] == "Infeasible":
+            result = _diagnose_infeasibility(
+                food_information,
+                constraints,
+                solver_settings,
+                phase_timer,
+                result,
+            )
 
-        parsed_result = Utilities.convert_keys_to_camel_case(result)
-        return jsonify(parsed_result)
+        response = _create_optimize_response(result, problem_hash, phase_timer)
+        optimizer_metrics.record_solve(
+            phase_timer.durations,
+            result["status"],
+            len(food_information),
+            len(constraints),
+        )
+        return response
+    except AdmissionRejectedError as e:
+        optimizer_metrics.record_status("Rejected")
+        return _create_rejected_response(e)
     except ValueError as e:
         logger.warning(f"Invalid request data: {str(e)}")
+        optimizer_metrics.record_status("Error")
         return jsonify({"status": "Error", "message": "Invalid request data"})
     except Exception as e:
         logger.warning(f"Error during optimization: {str(e)}")
+        optimizer_metrics.record_status("Error")
+        return jsonify({"status": "Error", "message": str(e)})
+
+
+@app.route("/optimize/batch", methods=["POST"])
+def optimize_batch() -> Response | tuple[Response, int, dict]:
+    try:
+        logger = SingletonLogger.get_logger()
+        problems = Utilities.parse_batch_request_data(request)
+
+        worker_count = batch_optimizer.get_worker_count(len(problems))
+        with admission_controller.admit(worker_count):
+            results = batch_optimizer.solve(problems)
+
+        return response_encoder.create_response(request, {"results": results})
+    except AdmissionRejectedError as e:
+        return _create_rejected_response(e)
+    except ValueError as e:
+        logger.warning(f"Invalid request data: {str(e)}")
+        return jsonify({"status": "Error", "message": "Invalid request data"})
+    except Exception as e:
+        logger.warning(f"Error during batch optimization: {str(e)}")
+        return jsonify({"status": "Error", "message": str(e)})
+
+
+@app.route("/optimize/pareto", methods=["POST"])
+def optimize_pareto() -> Response | tuple[Response, int, dict]:
+    try:
+        logger = SingletonLogger.get_logger()
+        data = Utilities.load_request_json(request)
+        food_information, objectives, constraints, point_count = (
+            Utilities.parse_pareto_problem_data(data, food_catalog)
+        )
+        solver_settings = Utilities.parse_solver_settings(
+            data, default_solver_settings
+        )
+
+        worker_count = pareto_optimizer.get_worker_count(point_count)
+        with admission_controller.admit(worker_count):
+            result = pareto_optimizer.solve(
+                food_information,
+                objectives,
+                constraints,
+                point_count,
+                solver_settings,
+            )
+        return response_encoder.create_response(request, result)
+    except AdmissionRejectedError as e:
+        return _create_rejected_response(e)
+    except ValueError as e:
+        logger.warning(f"Invalid request data: {str(e)}")
+        return jsonify({"status": "Error", "message": "Invalid request data"})
+    except Exception as e:
+        logger.warning(f"Error during Pareto optimization: {str(e)}")
+        return jsonify({"status": "Error", "message": str(e)})
+
+
+@app.route("/optimize/alternatives", methods=["POST"])
+def optimize_alternatives() -> Response | tuple[Response, int, dict]:
+    try:
+        logger = SingletonLogger.get_logger()
+        data = Utilities.load_request_json(request)
+        (
+            food_information,
+            objective,
+            constraints,
+            alternative_count,
+            min_difference,
+        ) = Utilities.parse_alternatives_problem_data(data, food_catalog)
+        solver_settings = Utilities.parse_solver_settings(
+            data, default_solver_settings
+        )
+
+        with admission_controller.admit():
+            result = alternative_optimizer.solve(
+                food_information,
+                objective,
+                constraints,
+                alternative_count,
+                min_difference,
+                solver_settings,
+            )
+        return response_encoder.create_response(request, result)
+    except AdmissionRejectedError as e:
+        return _create_rejected_response(e)
+    except ValueError as e:
+        logger.warning(f"Invalid request data: {str(e)}")
+        return jsonify({"status": "Error", "message": "Invalid request data"})
+    except Exception as e:
+        logger.warning(f"Error during alternative search: {str(e)}")
+        return jsonify({"status": "Error", "message": str(e)})
+
+
+@app.route("/optimize/meal-plan", methods=["POST"])
+def optimize_meal_plan() -> Response | tuple[Response, int, dict]:
+    try:
+        logger = SingletonLogger.get_logger()
+        data = Utilities.load_request_json(request)
+        (
+            food_information,
+            objective,
+            daily_constraints,
+            plan_constraints,
+            day_count,
+            max_days_per_food,
+        ) = Utilities.parse_meal_plan_data(data, food_catalog)
+        solver_settings = Utilities.parse_solver_settings(
+            data, default_solver_settings
+        )
+
+        with admission_controller.admit():
+            result = MealPlanOptimizer(
+                food_information,
+                objective,
+                daily_constraints,
+                plan_constraints,
+                day_count,
+                max_days_per_food,
+                solver_settings,
+            ).solve()
+        return response_encoder.create_response(request, result)
+    except AdmissionRejectedError as e:
+        return _create_rejected_response(e)
+    except ValueError as e:
+        logger.warning(f"Invalid request data: {str(e)}")
+        return jsonify({"status": "Error", "message": "Invalid request data"})
+    except Exception as e:
+        logger.warning(f"Error during meal plan optimization: {str(e)}")
         return jsonify({"status": "Error", "message": str(e)})
 
 
+def _get_startup_durations() -> dict[str, float]:
+    if warm_up.duration is None:
+        return startup_durations
+    return {**startup_durations, "warm_up": warm_up.duration}
+
+
+@app.route("/metrics", methods=["GET"])
+def metrics() -> Response:
+    solve_cache_stats = None if solve_cache is None else solve_cache.stats()
+    return Response(
+        optimizer_metrics.render(
+            solve_cache_stats,
+            SingletonLogger.get_dropped_record_count(),
+            single_flight.stats(),
+            _get_startup_durations(),
+        ),
+        content_type=OptimizerMetrics.CONTENT_TYPE,
+    )
+
+
+@app.route("/health", methods=["GET"])
+def health() -> tuple[Response, int]:
+    return jsonify({"status": "ok", **admission_controller.status()}), 200
+
+
+def _get_readiness() -> str:
+    if not warm_up.is_complete:
+        return "warming_up"
+    if admission_controller.is_saturated:
+        return "saturated"
+    return "ready"
+
+
+@app.route("/ready", methods=["GET"])
+def ready() -> tuple[Response, int] | tuple[Response, int, dict]:
+    readiness = _get_readiness()
+    status = {"status": readiness, **admission_controller.status()}
+    if readiness != "ready":
+        return (
+            jsonify(status),
+            503,
+            {"Retry-After": str(admission_controller.retry_after)},
+        )
+    return jsonify(status), 200
+
+
+_FOOD_CATALOG_NOT_CONFIGURED = {
+    "status": "Error",
+    "message": "Food catalog is not configured",
+}
+
+
+@app.route("/foods", methods=["GET"])
+def get_foods() -> tuple[Response, int]:
+    if food_catalog is None:
+        return jsonify(_FOOD_CATALOG_NOT_CONFIGURED), 404
+
+    foods = [
+        Utilities.convert_keys_to_camel_case(food)
+        for food in food_catalog.list_foods()
+    ]
+    return jsonify({"foods": foods}), 200
+
+
+@app.route("/foods", methods=["PUT"])
+def put_foods() -> tuple[Response, int]:
+    if food_catalog is None:
+        return jsonify(_FOOD_CATALOG_NOT_CONFIGURED), 404
+
+    try:
+        logger = SingletonLogger.get_logger()
+        foods = Utilities.parse_food_catalog_request_data(request)
+
+        count = food_catalog.upsert(foods)
+        return jsonify({"count": count}), 200
+    except (ValueError, TypeError, KeyError) as e:
+        logger.warning(f"Invalid food catalog data: {str(e)}")
+        return (
+            jsonify({"status": "Error", "message": "Invalid request data"}),
+            400,
+        )
+
+
+@app.route("/jobs", methods=["POST"])
+def submit_job() -> tuple[Response, int]:
+    try:
+        logger = SingletonLogger.get_logger()
+        data = Utilities.load_request_json(request)
+        food_information, objective, constraints = (
+            Utilities.parse_problem_data(data, food_catalog)
+        )
+        solver_settings = Utilities.parse_solver_settings(
+            data, default_solver_settings
+        )
+
+        job_id = job_manager.submit(
+            food_information, objective, constraints, solver_settings
+        )
+        return jsonify({"jobId": job_id, "status": "queued"}), 202
+    except ValueError as e:
+        logger.warning(f"Invalid request data: {str(e)}")
+        return (
+            jsonify({"status": "Error", "message": "Invalid request data"}),
+            400,
+        )
+    except RuntimeError as e:
+        logger.warning(f"Job submission rejected: {str(e)}")
+        return jsonify({"status": "Error", "message": str(e)}), 503
+
+
+@app.route("/jobs/<job_id>", methods=["GET"])
+def get_job(job_id: str) -> tuple[Response, int]:
+    job = job_manager.get(job_id)
+    if job is None:
+        return jsonify({"status": "Error", "message": "Job not found"}), 404
+
+    return response_encoder.create_response(request, job), 200
+
+
+@app.route("/jobs/<job_id>", methods=["DELETE"])
+def cancel_job(job_id: str) -> tuple[Response, int]:
+    job = job_manager.cancel(job_id)
+    if job is None:
+        return jsonify({"status": "Error", "message": "Job not found"}), 404
+
+    return response_encoder.create_response(request, job), 200
+
+
 if __name__ == "__main__":
+    warm_up.start()
     app.run(debug=True)
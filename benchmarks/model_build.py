@@ -0,0 +1,83 @@
+import time
+from typing import Callable
+
+from pulp import LpInteger, LpVariable
+
+from benchmarks.problem_generator import generate_food_information
+from src.food_information import FoodInformation
+from src.model_builder import ModelBuilder
+
+_FOOD_COUNTS = [500, 1000, 2000, 5000]
+_GRAM_CALCULATION_FACTOR = 100
+
+
+def _create_variables(
+    food_information: list[FoodInformation],
+) -> list[LpVariable]:
+    return [
+        LpVariable(
+            food.name,
+            lowBound=food.minimum_intake,
+            upBound=food.maximum_intake,
+            cat=LpInteger,
+        )
+        for food in food_information
+    ]
+
+
+def _build_with_accumulation(
+    food_information: list[FoodInformation], variables: list[LpVariable]
+) -> None:
+    totals: dict = {nutrient: 0.0 for nutrient in FoodInformation.NUTRIENTS}
+    for food, variable in zip(food_information, variables):
+        for nutrient in FoodInformation.NUTRIENTS:
+            totals[nutrient] = totals[nutrient] + (
+                getattr(food, nutrient)
+                * food.grams_per_unit
+                * variable
+                / _GRAM_CALCULATION_FACTOR
+            )
+
+
+def _build_with_model_builder(
+    food_information: list[FoodInformation], variables: list[LpVariable]
+) -> None:
+    ModelBuilder(food_information).build_nutrient_totals(variables)
+
+
+def _measure(
+    build: Callable[[list[FoodInformation], list[LpVariable]], None],
+    food_information: list[FoodInformation],
+    variables: list[LpVariable],
+) -> float:
+    start = time.perf_counter()
+    build(food_information, variables)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    print(
+        f"{'foods':>6} {'accumulation [ms]':>18}"
+        f" {'model builder [ms]':>19} {'builder us/food':>16}"
+    )
+
+    for food_count in _FOOD_COUNTS:
+        food_information = generate_food_information(food_count)
+        variables = _create_variables(food_information)
+
+        accumulation_seconds = _measure(
+            _build_with_accumulation, food_information, variables
+        )
+        model_builder_seconds = _measure(
+            _build_with_model_builder, food_information, variables
+        )
+
+        print(
+            f"{food_count:>6} {accumulation_seconds * 1000:>18.1f}"
+            f" {model_builder_seconds * 1000:>19.1f}"
+            f" {model_builder_seconds * 1e6 / food_count:>16.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
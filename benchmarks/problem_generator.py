@@ -0,0 +1,91 @@
+import random
+
+from src.constraint import Constraint
+from src.food_information import FoodInformation
+from src.objective import Objective
+
+_SEED = 0
+
+INTAKE_RANGES = {
+    "narrow": (0, 10),
+    "wide": (0, 1000),
+}
+
+OBJECTIVE = Objective(sense="maximize", nutrient="protein")
+
+_CONSTRAINT_POOL = [
+    Constraint(min_max="max", nutrient="energy", unit="energy", value=2500),
+    Constraint(min_max="min", nutrient="protein", unit="amount", value=50),
+    Constraint(min_max="max", nutrient="fat", unit="ratio", value=60),
+    Constraint(min_max="min", nutrient="carbohydrates", unit="ratio", value=5),
+    Constraint(min_max="min", nutrient="energy", unit="energy", value=1000),
+    Constraint(min_max="max", nutrient="fat", unit="amount", value=150),
+    Constraint(min_max="max", nutrient="protein", unit="ratio", value=70),
+    Constraint(
+        min_max="max", nutrient="carbohydrates", unit="amount", value=400
+    ),
+]
+
+
+def generate_food_information(
+    food_count: int, intake_range: str = "narrow", seed: int = _SEED
+) -> list[FoodInformation]:
+    generator = random.Random(seed)
+    minimum_intake, maximum_intake = INTAKE_RANGES[intake_range]
+    return [
+        FoodInformation(
+            name=f"food_{index}",
+            energy=generator.uniform(0, 500),
+            protein=generator.uniform(0, 50),
+            fat=generator.uniform(0, 50),
+            carbohydrates=generator.uniform(0, 50),
+            grams_per_unit=generator.randint(1, 200),
+            minimum_intake=minimum_intake,
+            maximum_intake=generator.randint(
+                minimum_intake + 1, maximum_intake
+            ),
+        )
+        for index in range(food_count)
+    ]
+
+
+def generate_constraints(constraint_count: int) -> list[Constraint]:
+    return [
+        _CONSTRAINT_POOL[index % len(_CONSTRAINT_POOL)]
+        for index in range(constraint_count)
+    ]
+
+
+def generate_request_data(
+    food_information: list[FoodInformation],
+    objective: Objective,
+    constraints: list[Constraint],
+) -> dict:
+    return {
+        "foodInformation": [
+            {
+                "name": food.name,
+                "energy": food.energy,
+                "protein": food.protein,
+                "fat": food.fat,
+                "carbohydrates": food.carbohydrates,
+                "gramsPerUnit": food.grams_per_unit,
+                "minimumIntake": food.minimum_intake,
+                "maximumIntake": food.maximum_intake,
+            }
+            for food in food_information
+        ],
+        "objective": {
+            "sense": objective.sense,
+            "nutrient": objective.nutrient,
+        },
+        "constraints": [
+            {
+                "minMax": constraint.min_max,
+                "nutrient": constraint.nutrient,
+                "unit": constraint.unit,
+                "value": constraint.value,
+            }
+            for constraint in constraints
+        ],
+    }
@@ -0,0 +1,85 @@
+import json
+import re
+import time
+from typing import Any, Callable, Type
+
+from benchmarks.problem_generator import (
+    OBJECTIVE,
+    generate_constraints,
+    generate_food_information,
+    generate_request_data,
+)
+from src.constraint import Constraint
+from src.food_information import FoodInformation
+from src.objective import Objective
+from src.request_parser import RequestParser
+
+_FOOD_COUNTS = [100, 1000, 5000, 10000]
+_CONSTRAINT_COUNT = 8
+_REPEATS = 5
+
+
+def _camel_to_snake(camel_case_str: str) -> str:
+    return re.sub(r"([a-z])([A-Z])", r"\1_\2", camel_case_str).lower()
+
+
+def _convert_with_regex(data: list, cls: Type) -> list:
+    return [
+        cls(**{_camel_to_snake(key): value for key, value in item.items()})
+        for item in data
+    ]
+
+
+def _parse_with_regex(body: bytes) -> tuple:
+    data = json.loads(body)
+    return (
+        _convert_with_regex(data["foodInformation"], FoodInformation),
+        _convert_with_regex([data["objective"]], Objective)[0],
+        _convert_with_regex(data["constraints"], Constraint),
+    )
+
+
+def _parse_with_request_parser(body: bytes) -> tuple:
+    return RequestParser.parse_problem_data(RequestParser.decode_json(body))
+
+
+def _measure(parse: Callable[[bytes], Any], body: bytes) -> float:
+    samples = []
+    for _ in range(_REPEATS):
+        start = time.perf_counter()
+        parse(body)
+        samples.append(time.perf_counter() - start)
+    return min(samples)
+
+
+def main() -> None:
+    print(f"JSON decoder: {RequestParser.JSON_DECODER}")
+    print(
+        f"{'foods':>6} {'payload [KB]':>13} {'regex [ms]':>11}"
+        f" {'compiled [ms]':>14} {'speedup':>8}"
+    )
+
+    for food_count in _FOOD_COUNTS:
+        body = json.dumps(
+            generate_request_data(
+                generate_food_information(food_count),
+                OBJECTIVE,
+                generate_constraints(_CONSTRAINT_COUNT),
+            )
+        ).encode()
+        if _parse_with_regex(body) != _parse_with_request_parser(body):
+            raise RuntimeError("Parsers returned different problems.")
+
+        regex_seconds = _measure(_parse_with_regex, body)
+        compiled_seconds = _measure(_parse_with_request_parser, body)
+
+        print(
+            f"{food_count:>6} {len(body) / 1024:>13.1f}"
+            f" {regex_seconds * 1000:>11.2f}"
+            f" {compiled_seconds * 1000:>14.2f}"
+            f" {regex_seconds / compiled_seconds:>7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,274 @@
+import argparse
+import itertools
+import json
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Callable, TypeVar
+
+from benchmarks.problem_generator import (
+    INTAKE_RANGES,
+    OBJECTIVE,
+    generate_constraints,
+    generate_food_information,
+    generate_request_data,
+)
+from src.nutrition_optimizer import NutritionOptimizer
+from src.singleton_logger import SingletonLogger
+from src.solver_settings import SolverSettings
+from src.utilities import Utilities
+
+_FOOD_COUNTS = [10, 100, 1000, 10000]
+_CONSTRAINT_COUNTS = [1, 4, 8]
+_REPEATS = 3
+_TIME_LIMIT = 10.0
+_REGRESSION_THRESHOLD = 1.2
+_MINIMUM_COMPARED_SECONDS = 0.001
+
+_T = TypeVar("_T")
+
+PHASES = [
+    "parse",
+    "setup_food_intake_variables",
+    "setup_objective_variables",
+    "setup_lp_problem",
+    "setup_constraints",
+    "solve",
+    "result",
+]
+
+
+def _time_phase(
+    phase_seconds: dict[str, float], phase: str, run: Callable[[], _T]
+) -> _T:
+    start = time.perf_counter()
+    returned_value = run()
+    phase_seconds[phase] = time.perf_counter() - start
+    return returned_value
+
+
+def _run_once(
+    request_data: dict, solver_settings: SolverSettings
+) -> tuple[str, dict[str, float]]:
+    phase_seconds: dict[str, float] = {}
+
+    food_information, objective, constraints = _time_phase(
+        phase_seconds,
+        "parse",
+        lambda: Utilities.parse_problem_data(request_data),
+    )
+    optimizer = NutritionOptimizer(
+        food_information, objective, constraints, solver_settings
+    )
+
+    _time_phase(
+        phase_seconds,
+        "setup_food_intake_variables",
+        optimizer._setup_food_intake_variables,
+    )
+    _time_phase(
+        phase_seconds,
+        "setup_objective_variables",
+        optimizer._setup_objective_variables,
+    )
+    _time_phase(phase_seconds, "setup_lp_problem", optimizer._setup_lp_problem)
+    _time_phase(
+        phase_seconds, "setup_constraints", optimizer._setup_constraints
+    )
+    best_bound = _time_phase(phase_seconds, "solve", optimizer._run_solver)
+
+    status = optimizer._get_solution_result()
+    if status in NutritionOptimizer.SOLVED_STATUSES:
+        _time_phase(
+            phase_seconds,
+            "result",
+            lambda: optimizer._create_solved_result(
+                status,
+                optimizer._calculate_food_intakes(),
+                optimizer._calculate_gap(best_bound),
+                phase_seconds["solve"],
+            ),
+        )
+    else:
+        _time_phase(
+            phase_seconds,
+            "result",
+            lambda: optimizer._create_failed_result(
+                status, phase_seconds["solve"]
+            ),
+        )
+
+    return status, phase_seconds
+
+
+def _run_scenario(
+    food_count: int,
+    constraint_count: int,
+    intake_range: str,
+    repeats: int,
+    solver_settings: SolverSettings,
+) -> dict:
+    request_data = generate_request_data(
+        generate_food_information(food_count, intake_range),
+        OBJECTIVE,
+        generate_constraints(constraint_count),
+    )
+
+    statuses = []
+    phase_samples: dict[str, list[float]] = {phase: [] for phase in PHASES}
+    for _ in range(repeats):
+        status, phase_seconds = _run_once(request_data, solver_settings)
+        statuses.append(status)
+        for phase, seconds in phase_seconds.items():
+            phase_samples[phase].append(seconds)
+
+    phases = {
+        phase: statistics.median(samples)
+        for phase, samples in phase_samples.items()
+    }
+    return {
+        "food_count": food_count,
+        "constraint_count": constraint_count,
+        "intake_range": intake_range,
+        "status": statistics.mode(statuses),
+        "phases": phases,
+        "total": sum(phases.values()),
+    }
+
+
+def _scenario_key(result: dict) -> tuple:
+    return (
+        result["food_count"],
+        result["constraint_count"],
+        result["intake_range"],
+    )
+
+
+def _find_regressions(
+    results: list[dict], baseline_results: list[dict], threshold: float
+) -> list[str]:
+    baseline = {_scenario_key(result): result for result in baseline_results}
+
+    regressions = []
+    for result in results:
+        baseline_result = baseline.get(_scenario_key(result))
+        if baseline_result is None:
+            continue
+
+        for phase, seconds in result["phases"].items():
+            baseline_seconds = baseline_result["phases"].get(phase)
+            if baseline_seconds is None or seconds < _MINIMUM_COMPARED_SECONDS:
+                continue
+            if seconds > baseline_seconds * threshold:
+                regressions.append(
+                    f"{_scenario_key(result)} {phase}:"
+                    f" {baseline_seconds * 1000:.2f} ms"
+                    f" -> {seconds * 1000:.2f} ms"
+                )
+
+    return regressions
+
+
+def _parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Measure per-phase optimization time as problems grow."
+    )
+    parser.add_argument(
+        "--food-counts", type=int, nargs="+", default=_FOOD_COUNTS
+    )
+    parser.add_argument(
+        "--constraint-counts", type=int, nargs="+", default=_CONSTRAINT_COUNTS
+    )
+    parser.add_argument(
+        "--intake-ranges",
+        nargs="+",
+        choices=list(INTAKE_RANGES),
+        default=list(INTAKE_RANGES),
+    )
+    parser.add_argument("--repeats", type=int, default=_REPEATS)
+    parser.add_argument("--time-limit", type=float, default=_TIME_LIMIT)
+    parser.add_argument("--output", help="Write results to this JSON file.")
+    parser.add_argument(
+        "--baseline", help="Compare against a previous JSON result file."
+    )
+    parser.add_argument(
+        "--threshold", type=float, default=_REGRESSION_THRESHOLD
+    )
+    return parser.parse_args()
+
+
+def _print_result(result: dict) -> None:
+    phases = "".join(
+        f" {seconds * 1000:>10.2f}" for seconds in result["phases"].values()
+    )
+    print(
+        f"{result['food_count']:>6} {result['constraint_count']:>5}"
+        f" {result['intake_range']:>7} {result['status']:>11}{phases}"
+    )
+
+
+def _write_report(arguments: argparse.Namespace, results: list[dict]) -> None:
+    report = {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "time_limit": arguments.time_limit,
+        "repeats": arguments.repeats,
+        "results": results,
+    }
+    with open(arguments.output, "w", encoding="utf-8") as output_file:
+        json.dump(report, output_file, indent=2)
+
+
+def _check_baseline(
+    arguments: argparse.Namespace, results: list[dict]
+) -> None:
+    with open(arguments.baseline, encoding="utf-8") as baseline_file:
+        baseline_results = json.load(baseline_file)["results"]
+
+    regressions = _find_regressions(
+        results, baseline_results, arguments.threshold
+    )
+    for regression in regressions:
+        print(f"Regression: {regression}")
+    if regressions:
+        sys.exit(1)
+
+
+def main() -> None:
+    arguments = _parse_arguments()
+    SingletonLogger.get_logger().disabled = True
+    solver_settings = SolverSettings(time_limit=arguments.time_limit)
+
+    print(
+        f"{'foods':>6} {'cons':>5} {'intake':>7} {'status':>11}"
+        + "".join(f" {phase[:10]:>10}" for phase in PHASES)
+        + "  [ms]"
+    )
+
+    results = []
+    for food_count, constraint_count, intake_range in itertools.product(
+        arguments.food_counts,
+        arguments.constraint_counts,
+        arguments.intake_ranges,
+    ):
+        result = _run_scenario(
+            food_count,
+            constraint_count,
+            intake_range,
+            arguments.repeats,
+            solver_settings,
+        )
+        _print_result(result)
+        results.append(result)
+
+    if arguments.output:
+        _write_report(arguments, results)
+    if arguments.baseline:
+        _check_baseline(arguments, results)
+
+
+if __name__ == "__main__":
+    main()
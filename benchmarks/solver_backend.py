@@ -0,0 +1,55 @@
+import statistics
+import time
+
+from benchmarks.problem_generator import generate_food_information
+from src.constraint import Constraint
+from src.nutrition_optimizer import NutritionOptimizer
+from src.objective import Objective
+from src.solver_settings import SolverSettings
+
+_FOOD_COUNTS = [5, 10, 15, 50, 200]
+_REPEATS = 20
+_SOLVERS = ["cbc", "highs"]
+
+_OBJECTIVE = Objective(sense="maximize", nutrient="protein")
+
+_CONSTRAINTS = [
+    Constraint(min_max="min", nutrient="energy", unit="energy", value=1500),
+    Constraint(min_max="max", nutrient="energy", unit="energy", value=2000),
+    Constraint(min_max="min", nutrient="fat", unit="ratio", value=20),
+    Constraint(min_max="max", nutrient="fat", unit="ratio", value=30),
+]
+
+
+def _measure(food_count: int, solver: str) -> float:
+    food_information = generate_food_information(food_count)
+    solver_settings = SolverSettings(solver=solver)
+
+    durations = []
+    for _ in range(_REPEATS):
+        nutrition_optimizer = NutritionOptimizer(
+            food_information, _OBJECTIVE, _CONSTRAINTS, solver_settings
+        )
+        start = time.perf_counter()
+        nutrition_optimizer.solve()
+        durations.append(time.perf_counter() - start)
+
+    return statistics.median(durations)
+
+
+def main() -> None:
+    print(
+        f"{'foods':>6}"
+        + "".join(f" {solver + ' [ms]':>12}" for solver in _SOLVERS)
+    )
+
+    for food_count in _FOOD_COUNTS:
+        medians = [_measure(food_count, solver) for solver in _SOLVERS]
+        print(
+            f"{food_count:>6}"
+            + "".join(f" {median * 1000:>12.2f}" for median in medians)
+        )
+
+
+if __name__ == "__main__":
+    main()
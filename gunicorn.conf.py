@@ -0,0 +1,31 @@
+import os
+import time
+
+from flask.cli import load_dotenv
+
+_BOOT_START = time.perf_counter()
+
+load_dotenv()
+
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:8000")
+preload_app = True
+
+# One worker keeps the admission limit per node; solves run on threads
+# and CBC runs in its own process, so the GIL is not the bottleneck.
+workers = int(os.getenv("GUNICORN_WORKERS", 1))
+worker_class = "gthread"
+threads = int(os.getenv("GUNICORN_THREADS", 32))
+timeout = int(os.getenv("GUNICORN_TIMEOUT", 120))
+graceful_timeout = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", 30))
+
+
+def when_ready(server: object) -> None:
+    from app import startup_durations
+
+    startup_durations["boot"] = time.perf_counter() - _BOOT_START
+
+
+def post_worker_init(worker: object) -> None:
+    from app import warm_up
+
+    warm_up.start()
@@ -0,0 +1,175 @@
+import os
+import threading
+from contextlib import contextmanager
+from typing import Iterator
+
+_DEFAULT_ADMISSION_MAX_QUEUED = 16
+_DEFAULT_ADMISSION_QUEUE_TIMEOUT = 10.0
+_DEFAULT_ADMISSION_RETRY_AFTER = 1
+
+
+class AdmissionRejectedError(RuntimeError):
+    def __init__(
+        self, message: str, status_code: int, retry_after: int
+    ) -> None:
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+class AdmissionController:
+    QUEUE_FULL_STATUS_CODE = 429
+    QUEUE_TIMEOUT_STATUS_CODE = 503
+
+    def __init__(
+        self,
+        max_concurrent_solves: int,
+        max_queued_solves: int = _DEFAULT_ADMISSION_MAX_QUEUED,
+        queue_timeout: float = _DEFAULT_ADMISSION_QUEUE_TIMEOUT,
+        retry_after: int = _DEFAULT_ADMISSION_RETRY_AFTER,
+    ) -> None:
+        if max_concurrent_solves <= 0:
+            raise ValueError(
+                "Admission max concurrent solves must be greater than zero."
+                f" Got {max_concurrent_solves}."
+            )
+        if max_queued_solves < 0:
+            raise ValueError(
+                "Admission max queued solves must be non-negative."
+                f" Got {max_queued_solves}."
+            )
+        if queue_timeout <= 0 or retry_after <= 0:
+            raise ValueError(
+                "Admission queue timeout and retry after must be greater"
+                f" than zero. Got {queue_timeout} and {retry_after}."
+            )
+
+        self._max_concurrent_solves = max_concurrent_solves
+        self._max_queued_solves = max_queued_solves
+        self._queue_timeout = queue_timeout
+        self._retry_after = retry_after
+        self._active_solves = 0
+        self._queued_solves = 0
+        self._condition = threading.Condition()
+
+    def _has_free_slot(self, slots: int = 1) -> bool:
+        return self._active_solves + slots <= self._max_concurrent_solves
+
+    def _wait_for_slot(self, slots: int) -> None:
+        if self._queued_solves >= self._max_queued_solves:
+            raise AdmissionRejectedError(
+                "Too many solves are waiting. Please retry later.",
+                self.QUEUE_FULL_STATUS_CODE,
+                self._retry_after,
+            )
+
+        self._queued_solves += 1
+        try:
+            has_free_slot = self._condition.wait_for(
+                lambda: self._has_free_slot(slots), self._queue_timeout
+            )
+        finally:
+            self._queued_solves -= 1
+
+        if not has_free_slot:
+            raise AdmissionRejectedError(
+                "Timed out waiting for a free solver. Please retry later.",
+                self.QUEUE_TIMEOUT_STATUS_CODE,
+                self._retry_after,
+            )
+
+    def _release(self, slots: int) -> None:
+        with self._condition:
+            self._active_solves -= slots
+            self._condition.notify_all()
+
+    @contextmanager
+    def admit(self, slots: int = 1) -> Iterator[None]:
+        # Requests that fan out take one slot per worker, capped so that a
+        # single request can always be admitted on its own.
+        slots = max(1, min(slots, self._max_concurrent_solves))
+        with self._condition:
+            if not self._has_free_slot(slots):
+                self._wait_for_slot(slots)
+            self._active_solves += slots
+
+        try:
+            yield
+        finally:
+            self._release(slots)
+
+    @contextmanager
+    def admit_background(self) -> Iterator[None]:
+        # Background jobs already hold a job id, so they wait as long as it
+        # takes and stay out of the queue meant for interactive requests.
+        with self._condition:
+            self._condition.wait_for(self._has_free_slot)
+            self._active_solves += 1
+
+        try:
+            yield
+        finally:
+            self._release(1)
+
+    @contextmanager
+    def try_admit(self) -> Iterator[None]:
+        with self._condition:
+            if not self._has_free_slot():
+                raise AdmissionRejectedError(
+                    "No solver is free. Please retry later.",
+                    self.QUEUE_FULL_STATUS_CODE,
+                    self._retry_after,
+                )
+            self._active_solves += 1
+
+        try:
+            yield
+        finally:
+            self._release(1)
+
+    @property
+    def is_saturated(self) -> bool:
+        with self._condition:
+            return (
+                not self._has_free_slot()
+                and self._queued_solves >= self._max_queued_solves
+            )
+
+    @property
+    def retry_after(self) -> int:
+        return self._retry_after
+
+    def status(self) -> dict:
+        with self._condition:
+            return {
+                "active_solves": self._active_solves,
+                "queued_solves": self._queued_solves,
+                "max_concurrent_solves": self._max_concurrent_solves,
+                "max_queued_solves": self._max_queued_solves,
+            }
+
+    @classmethod
+    def from_environment(cls) -> "AdmissionController":
+        max_concurrent_solves = os.getenv("ADMISSION_MAX_CONCURRENT")
+        return cls(
+            (
+                int(max_concurrent_solves)
+                if max_concurrent_solves
+                else os.cpu_count() or 1
+            ),
+            int(
+                os.getenv(
+                    "ADMISSION_MAX_QUEUED", _DEFAULT_ADMISSION_MAX_QUEUED
+                )
+            ),
+            float(
+                os.getenv(
+                    "ADMISSION_QUEUE_TIMEOUT", _DEFAULT_ADMISSION_QUEUE_TIMEOUT
+                )
+            ),
+            int(
+                os.getenv(
+                    "ADMISSION_RETRY_AFTER", _DEFAULT_ADMISSION_RETRY_AFTER
+                )
+            ),
+        )
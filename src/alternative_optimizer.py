@@ -0,0 +1,161 @@
+import os
+import time
+
+import numpy as np
+
+from src.constraint import Constraint
+from src.food_information import FoodInformation
+from src.model_builder import ModelBuilder
+from src.objective import Objective
+from src.singleton_logger import SingletonLogger
+from src.solver_backend import (
+    CbcSolverBackend,
+    HighsSolverBackend,
+    SolverBackend,
+    SolverResult,
+)
+from src.solver_settings import SolverSettings
+
+_DEFAULT_ALTERNATIVES_MAX_COUNT = 10
+
+
+class AlternativeOptimizer:
+    SOLVED_STATUSES = ["Optimal", "Feasible"]
+    SOLVER_BACKENDS: dict[str, type[SolverBackend]] = {
+        "cbc": CbcSolverBackend,
+        "highs": HighsSolverBackend,
+    }
+    _FAILURE_MESSAGE = (
+        "Please review the constraints,"
+        " the grams per unit, or the intake values."
+    )
+
+    def __init__(self, max_count: int) -> None:
+        if max_count <= 0:
+            raise ValueError(
+                "Alternatives max count must be greater than zero."
+                f" Got {max_count}."
+            )
+
+        self._max_count = max_count
+        self._logger = SingletonLogger.get_logger()
+
+    @classmethod
+    def from_environment(cls) -> "AlternativeOptimizer":
+        max_count = int(
+            os.getenv(
+                "ALTERNATIVES_MAX_COUNT", _DEFAULT_ALTERNATIVES_MAX_COUNT
+            )
+        )
+        return cls(max_count)
+
+    def _validate_count(self, count: int) -> None:
+        if not 1 <= count <= self._max_count:
+            raise ValueError(
+                f"Alternative count must be between 1 and {self._max_count}."
+                f" Got {count}."
+            )
+
+    def _validate_min_difference(self, min_difference: float) -> None:
+        if min_difference < 1:
+            raise ValueError(
+                f"Min difference must be at least 1. Got {min_difference}."
+            )
+
+    @staticmethod
+    def _create_alternative(
+        solver_result: SolverResult,
+        nutrient_totals: np.ndarray,
+        pfc_ratios: np.ndarray,
+    ) -> dict:
+        return {
+            "status": solver_result.status,
+            "food_intakes": solver_result.food_intakes,
+            "total_nutrient_values": dict(
+                zip(
+                    FoodInformation.NUTRIENTS,
+                    np.round(nutrient_totals, 1).tolist(),
+                )
+            ),
+            "pfc_ratio": {
+                nutrient: pfc_ratio
+                for nutrient, pfc_ratio in zip(
+                    FoodInformation.NUTRIENTS,
+                    np.round(pfc_ratios, 1).tolist(),
+                )
+                if nutrient != "energy"
+            },
+            "gap": solver_result.gap,
+        }
+
+    def solve(
+        self,
+        food_information: list[FoodInformation],
+        objective: Objective,
+        constraints: list[Constraint],
+        count: int,
+        min_difference: float = 1,
+        solver_settings: SolverSettings | None = None,
+    ) -> dict:
+        self._validate_count(count)
+        self._validate_min_difference(min_difference)
+        solver_settings = solver_settings or SolverSettings()
+
+        self._logger.info(f"Starting to search for {count} alternatives.")
+        start = time.perf_counter()
+
+        model_builder = ModelBuilder(food_information)
+        linear_model = model_builder.build_linear_model(objective, constraints)
+        solver_backend = self.SOLVER_BACKENDS[solver_settings.solver]()
+        all_solver_results = solver_backend.solve_alternatives(
+            linear_model, solver_settings, count, min_difference
+        )
+        solver_results = [
+            solver_result
+            for solver_result in all_solver_results
+            if solver_result.status in self.SOLVED_STATUSES
+        ]
+        solve_time = round(time.perf_counter() - start, 3)
+
+        if not solver_results:
+            status = all_solver_results[0].status
+            self._logger.warning(
+                f"Alternative search failed with status: {status}"
+            )
+            return {
+                "status": status,
+                "message": self._FAILURE_MESSAGE,
+                "alternatives": [],
+                "solve_time": solve_time,
+            }
+
+        nutrient_totals = model_builder.calculate_nutrient_totals(
+            np.array(
+                [
+                    SolverBackend.to_vector(linear_model, solver_result)
+                    for solver_result in solver_results
+                ]
+            )
+        )
+        pfc_ratios = ModelBuilder.calculate_pfc_ratios(
+            np.round(nutrient_totals, 1)
+        )
+
+        self._logger.info(f"Found {len(solver_results)} alternatives.")
+        return {
+            "status": (
+                "Optimal"
+                if all(
+                    solver_result.status == "Optimal"
+                    for solver_result in solver_results
+                )
+                else "Feasible"
+            ),
+            "alternatives": [
+                self._create_alternative(*alternative)
+                for alternative in zip(
+                    solver_results, nutrient_totals, pfc_ratios
+                )
+            ],
+            "solve_time": solve_time,
+        }
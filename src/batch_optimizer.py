@@ -0,0 +1,172 @@
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from src.constraint import Constraint
+from src.food_catalog import FoodCatalog
+from src.food_information import FoodInformation
+from src.nutrition_optimizer import NutritionOptimizer
+from src.objective import Objective
+from src.singleton_logger import SingletonLogger
+from src.solve_cache import SolveCache
+from src.solver_settings import SolverSettings
+from src.utilities import Utilities
+
+_DEFAULT_BATCH_MAX_WORKERS = os.cpu_count() or 1
+
+
+def _solve_problem(
+    problem: tuple[
+        list[FoodInformation], Objective, list[Constraint], SolverSettings
+    ],
+) -> dict:
+    food_information, objective, constraints, solver_settings = problem
+    nutrition_optimizer = NutritionOptimizer(
+        food_information, objective, constraints, solver_settings
+    )
+    return nutrition_optimizer.solve()
+
+
+class BatchOptimizer:
+    def __init__(
+        self,
+        max_workers: int,
+        solve_cache: SolveCache | None = None,
+        default_solver_settings: SolverSettings | None = None,
+        food_catalog: FoodCatalog | None = None,
+    ) -> None:
+        if max_workers <= 0:
+            raise ValueError(
+                f"Batch max workers must be greater than zero."
+                f" Got {max_workers}."
+            )
+
+        self._max_workers = max_workers
+        self._solve_cache = solve_cache
+        self._default_solver_settings = (
+            default_solver_settings or SolverSettings()
+        )
+        self._food_catalog = food_catalog
+        self._logger = SingletonLogger.get_logger()
+
+        self._executor: ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_environment(
+        cls,
+        solve_cache: SolveCache | None = None,
+        default_solver_settings: SolverSettings | None = None,
+        food_catalog: FoodCatalog | None = None,
+    ) -> "BatchOptimizer":
+        max_workers = int(
+            os.getenv("BATCH_MAX_WORKERS", _DEFAULT_BATCH_MAX_WORKERS)
+        )
+        return cls(
+            max_workers, solve_cache, default_solver_settings, food_catalog
+        )
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self._max_workers
+                )
+            return self._executor
+
+    def _reset_executor(self, executor: ProcessPoolExecutor) -> None:
+        with self._lock:
+            if self._executor is executor:
+                self._executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def _submit(self, parsed_problem: tuple) -> Future | dict:
+        # A dead worker breaks the whole pool, so it is replaced and the
+        # problem is submitted once more to the new one.
+        for _ in range(2):
+            executor = self._get_executor()
+            try:
+                return executor.submit(_solve_problem, parsed_problem)
+            except (BrokenProcessPool, RuntimeError) as e:
+                self._logger.warning(
+                    f"Error during batch optimization: {str(e)}"
+                )
+                self._reset_executor(executor)
+                error = e
+
+        return self._create_error_result(str(error))
+
+    def get_worker_count(self, problem_count: int) -> int:
+        return min(self._max_workers, problem_count)
+
+    @staticmethod
+    def _create_error_result(message: str) -> dict:
+        return {"status": "Error", "message": message}
+
+    def _parse_problem(self, problem: dict) -> tuple | None:
+        try:
+            food_information, objective, constraints = (
+                Utilities.parse_problem_data(problem, self._food_catalog)
+            )
+            solver_settings = Utilities.parse_solver_settings(
+                problem, self._default_solver_settings
+            )
+            return (food_information, objective, constraints, solver_settings)
+        except Exception as e:
+            self._logger.warning(f"Invalid request data in batch: {str(e)}")
+            return None
+
+    def _get_cached_result(self, key: str) -> dict | None:
+        if self._solve_cache is None:
+            return None
+        return self._solve_cache.get(key)
+
+    def _collect_result(self, future: Future) -> dict:
+        try:
+            return future.result()
+        except Exception as e:
+            self._logger.warning(f"Error during batch optimization: {str(e)}")
+            return self._create_error_result(str(e))
+
+    def solve(self, problems: list) -> list[dict]:
+        self._logger.info(
+            f"Starting batch optimization of {len(problems)} problems."
+        )
+
+        results: list[dict] = [{} for _ in problems]
+        futures: dict[int, tuple[str, Future]] = {}
+
+        for index, problem in enumerate(problems):
+            parsed_problem = self._parse_problem(problem)
+            if parsed_problem is None:
+                results[index] = self._create_error_result(
+                    "Invalid request data"
+                )
+                continue
+
+            key = SolveCache.compute_key(*parsed_problem)
+            cached_result = self._get_cached_result(key)
+            if cached_result is not None:
+                results[index] = cached_result
+                continue
+
+            future = self._submit(parsed_problem)
+            if isinstance(future, dict):
+                results[index] = future
+                continue
+            futures[index] = (key, future)
+
+        for index, (key, future) in futures.items():
+            results[index] = self._collect_result(future)
+            if self._solve_cache is not None:
+                self._solve_cache.set(key, results[index])
+
+        self._logger.info("Completed batch optimization.")
+        return results
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
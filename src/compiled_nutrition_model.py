@@ -0,0 +1,213 @@
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Iterator
+
+from pulp import (
+    LpConstraint,
+    LpInteger,
+    LpMaximize,
+    LpMinimize,
+    LpProblem,
+    LpVariable,
+)
+
+from src.constraint import Constraint
+from src.food_information import FoodInformation
+from src.model_builder import ModelBuilder
+from src.objective import Objective
+
+_DEFAULT_COMPILED_MODEL_CATALOGS = 16
+_DEFAULT_COMPILED_MODEL_POOL_SIZE = 4
+
+
+class CompiledNutritionModel:
+    _GRAM_CALCULATION_FACTOR = 100
+    _CATALOG_ATTRIBUTES = [
+        "name",
+        *FoodInformation.NUTRIENTS,
+        "grams_per_unit",
+    ]
+
+    def __init__(self, food_information: list[FoodInformation]) -> None:
+        self._food_intake_variables: dict[str, LpVariable] = {
+            food.name: LpVariable(food.name, cat=LpInteger)
+            for food in food_information
+        }
+        self._nutrient_total_variables: dict[str, LpVariable] = {
+            nutrient: LpVariable(f"_total_{nutrient}")
+            for nutrient in FoodInformation.NUTRIENTS
+        }
+
+        self._definition_constraints = self._build_definition_constraints(
+            food_information
+        )
+
+    @classmethod
+    def compute_catalog_key(
+        cls, food_information: list[FoodInformation]
+    ) -> str:
+        catalog = [
+            [getattr(food, attribute) for attribute in cls._CATALOG_ATTRIBUTES]
+            for food in food_information
+        ]
+        canonical_catalog = json.dumps(catalog, separators=(",", ":"))
+        return hashlib.sha256(canonical_catalog.encode()).hexdigest()
+
+    def _build_definition_constraints(
+        self, food_information: list[FoodInformation]
+    ) -> list[LpConstraint]:
+        model_builder = ModelBuilder(food_information)
+        nutrient_totals = model_builder.build_nutrient_totals(
+            list(self._food_intake_variables.values())
+        )
+
+        definition_constraints = []
+        for nutrient, nutrient_total in nutrient_totals.items():
+            nutrient_total_variable = self._nutrient_total_variables[nutrient]
+            definition_constraint = (
+                nutrient_total - nutrient_total_variable == 0
+            )
+            definition_constraint.name = f"define_total_{nutrient}"
+            definition_constraints.append(definition_constraint)
+
+        return definition_constraints
+
+    def _update_intake_bounds(
+        self, food_information: list[FoodInformation]
+    ) -> None:
+        for food in food_information:
+            food_intake_variable = self._food_intake_variables[food.name]
+            food_intake_variable.lowBound = food.minimum_intake
+            food_intake_variable.upBound = food.maximum_intake
+
+    def _create_problem(self, objective: Objective) -> LpProblem:
+        sense = objective.sense
+        nutrient = objective.nutrient
+        problem = LpProblem(
+            f"{sense}_{nutrient}",
+            LpMaximize if sense == "maximize" else LpMinimize,
+        )
+        problem.setObjective(self._nutrient_total_variables[nutrient])
+
+        for definition_constraint in self._definition_constraints:
+            problem += definition_constraint
+
+        return problem
+
+    def _get_nutrient_energy_per_gram(self, nutrient: str) -> int:
+        nutrient_energy_per_gram_attribute = (
+            f"{nutrient.upper()}_ENERGY_PER_GRAM"
+        )
+        return getattr(FoodInformation, nutrient_energy_per_gram_attribute)
+
+    def _build_constraint(self, constraint: Constraint) -> LpConstraint:
+        nutrient_total = self._nutrient_total_variables[constraint.nutrient]
+
+        if constraint.unit == "ratio":
+            calculation_factor = (
+                constraint.value / self._GRAM_CALCULATION_FACTOR
+            )
+            left_hand_side = (
+                nutrient_total
+                * self._get_nutrient_energy_per_gram(constraint.nutrient)
+                - self._nutrient_total_variables["energy"] * calculation_factor
+            )
+            right_hand_side = 0.0
+        else:
+            left_hand_side = 1 * nutrient_total
+            right_hand_side = constraint.value
+
+        if constraint.min_max == "max":
+            return left_hand_side <= right_hand_side
+        return left_hand_side >= right_hand_side
+
+    def _add_constraints(
+        self, problem: LpProblem, constraints: list[Constraint]
+    ) -> None:
+        for constraint in constraints:
+            constraint_name = (
+                f"{constraint.min_max}_{constraint.nutrient}_{constraint.unit}"
+            )
+            problem += (self._build_constraint(constraint), constraint_name)
+
+    def prepare(
+        self,
+        food_information: list[FoodInformation],
+        objective: Objective,
+        constraints: list[Constraint],
+    ) -> tuple[LpProblem, dict[str, LpVariable]]:
+        self._update_intake_bounds(food_information)
+        problem = self._create_problem(objective)
+        self._add_constraints(problem, constraints)
+
+        return problem, self._food_intake_variables
+
+
+class CompiledModelRegistry:
+    def __init__(self, max_catalogs: int, max_pooled_models: int) -> None:
+        self._max_catalogs = max_catalogs
+        self._max_pooled_models = max_pooled_models
+
+        self._idle_models: OrderedDict[str, list[CompiledNutritionModel]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_environment(cls) -> "CompiledModelRegistry | None":
+        max_catalogs = int(
+            os.getenv(
+                "COMPILED_MODEL_CATALOGS", _DEFAULT_COMPILED_MODEL_CATALOGS
+            )
+        )
+        if max_catalogs <= 0:
+            return None
+
+        max_pooled_models = int(
+            os.getenv(
+                "COMPILED_MODEL_POOL_SIZE", _DEFAULT_COMPILED_MODEL_POOL_SIZE
+            )
+        )
+        return cls(max_catalogs, max_pooled_models)
+
+    def _checkout(self, catalog_key: str) -> CompiledNutritionModel | None:
+        with self._lock:
+            idle_models = self._idle_models.get(catalog_key)
+            if not idle_models:
+                return None
+
+            self._idle_models.move_to_end(catalog_key)
+            return idle_models.pop()
+
+    def _checkin(
+        self, catalog_key: str, compiled_model: CompiledNutritionModel
+    ) -> None:
+        with self._lock:
+            idle_models = self._idle_models.setdefault(catalog_key, [])
+            self._idle_models.move_to_end(catalog_key)
+            if len(idle_models) < self._max_pooled_models:
+                idle_models.append(compiled_model)
+
+            while len(self._idle_models) > self._max_catalogs:
+                self._idle_models.popitem(last=False)
+
+    @contextmanager
+    def acquire(
+        self, food_information: list[FoodInformation]
+    ) -> Iterator[CompiledNutritionModel]:
+        catalog_key = CompiledNutritionModel.compute_catalog_key(
+            food_information
+        )
+
+        compiled_model = self._checkout(catalog_key)
+        if compiled_model is None:
+            compiled_model = CompiledNutritionModel(food_information)
+
+        try:
+            yield compiled_model
+        finally:
+            self._checkin(catalog_key, compiled_model)
@@ -0,0 +1,187 @@
+import os
+import sqlite3
+import threading
+from dataclasses import dataclass
+
+import numpy as np
+
+from src.food_information import FoodInformation
+
+
+@dataclass(frozen=True)
+class _CatalogColumns:
+    food_indices: dict[str, int]
+    food_ids: list[str]
+    names: list[str]
+    nutrient_values: np.ndarray
+    grams_per_unit: list[int]
+
+
+class FoodCatalog:
+    _CATALOG_COLUMNS = [
+        "food_id",
+        "name",
+        *FoodInformation.NUTRIENTS,
+        "grams_per_unit",
+    ]
+
+    def __init__(self, path: str) -> None:
+        catalog_dir = os.path.dirname(path)
+        if catalog_dir:
+            os.makedirs(catalog_dir, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            path, check_same_thread=False, isolation_level=None
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS foods ("
+            " food_id TEXT PRIMARY KEY,"
+            " name TEXT NOT NULL,"
+            " energy REAL NOT NULL,"
+            " protein REAL NOT NULL,"
+            " fat REAL NOT NULL,"
+            " carbohydrates REAL NOT NULL,"
+            " grams_per_unit INTEGER NOT NULL)"
+        )
+
+        self._columns = self._load()
+
+    @classmethod
+    def from_environment(cls) -> "FoodCatalog | None":
+        path = os.getenv("FOOD_CATALOG_PATH")
+        if not path:
+            return None
+        return cls(path)
+
+    def _load(self) -> _CatalogColumns:
+        columns = ", ".join(self._CATALOG_COLUMNS)
+        with self._lock:
+            rows = self._connection.execute(
+                f"SELECT {columns} FROM foods ORDER BY food_id"
+            ).fetchall()
+
+        food_ids = [row[0] for row in rows]
+        nutrient_values = np.array(
+            [row[2:-1] for row in rows], dtype=float
+        ).reshape(len(rows), len(FoodInformation.NUTRIENTS))
+
+        return _CatalogColumns(
+            food_indices={
+                food_id: index for index, food_id in enumerate(food_ids)
+            },
+            food_ids=food_ids,
+            names=[row[1] for row in rows],
+            nutrient_values=nutrient_values,
+            grams_per_unit=[row[-1] for row in rows],
+        )
+
+    def __len__(self) -> int:
+        return len(self._columns.food_ids)
+
+    @staticmethod
+    def _create_food_information(
+        columns: _CatalogColumns,
+        index: int,
+        minimum_intake: int,
+        maximum_intake: int,
+    ) -> FoodInformation:
+        energy, protein, fat, carbohydrates = columns.nutrient_values[
+            index
+        ].tolist()
+        return FoodInformation(
+            name=columns.names[index],
+            energy=energy,
+            protein=protein,
+            fat=fat,
+            carbohydrates=carbohydrates,
+            grams_per_unit=columns.grams_per_unit[index],
+            minimum_intake=minimum_intake,
+            maximum_intake=maximum_intake,
+        )
+
+    def upsert(self, foods: list[dict]) -> int:
+        rows = []
+        for food in foods:
+            food_information = FoodInformation(
+                **{
+                    key: value
+                    for key, value in food.items()
+                    if key != "food_id"
+                },
+                minimum_intake=0,
+                maximum_intake=0,
+            )
+            rows.append(
+                (
+                    str(food["food_id"]),
+                    food_information.name,
+                    *[
+                        getattr(food_information, nutrient)
+                        for nutrient in FoodInformation.NUTRIENTS
+                    ],
+                    food_information.grams_per_unit,
+                )
+            )
+
+        placeholders = ", ".join("?" for _ in self._CATALOG_COLUMNS)
+        with self._lock:
+            self._connection.executemany(
+                f"INSERT OR REPLACE INTO foods"
+                f" ({', '.join(self._CATALOG_COLUMNS)})"
+                f" VALUES ({placeholders})",
+                rows,
+            )
+        self._columns = self._load()
+
+        return len(rows)
+
+    def list_foods(self) -> list[dict]:
+        columns = self._columns
+        return [
+            {
+                "food_id": food_id,
+                "name": name,
+                **dict(
+                    zip(FoodInformation.NUTRIENTS, nutrient_values.tolist())
+                ),
+                "grams_per_unit": grams_per_unit,
+            }
+            for food_id, name, nutrient_values, grams_per_unit in zip(
+                columns.food_ids,
+                columns.names,
+                columns.nutrient_values,
+                columns.grams_per_unit,
+            )
+        ]
+
+    def resolve(self, food_references: list[dict]) -> list[FoodInformation]:
+        columns = self._columns
+
+        food_information = []
+        resolved_names: set[str] = set()
+        for food_reference in food_references:
+            food_id = str(food_reference["foodId"])
+            index = columns.food_indices.get(food_id)
+            if index is None:
+                raise ValueError(f"Unknown food id: {food_id}.")
+
+            # Results are keyed by name, so each name must appear once.
+            name = columns.names[index]
+            if name in resolved_names:
+                raise ValueError(
+                    f"Duplicate food name: {name}. Got food id {food_id}."
+                )
+            resolved_names.add(name)
+
+            food_information.append(
+                self._create_food_information(
+                    columns,
+                    index,
+                    food_reference["minimumIntake"],
+                    food_reference["maximumIntake"],
+                )
+            )
+
+        return food_information
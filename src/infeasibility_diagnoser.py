@@ -0,0 +1,351 @@
+import math
+import time
+
+import highspy
+import numpy as np
+
+from src.constraint import Constraint
+from src.food_information import FoodInformation
+from src.model_builder import LinearModel, ModelBuilder
+from src.singleton_logger import SingletonLogger
+from src.solver_backend import HighsSolverBackend
+from src.solver_settings import SolverSettings
+
+
+class InfeasibilityDiagnoser:
+    MAX_RATIO_ITERATIONS = 20
+    _FEASIBILITY_TOLERANCE = 1e-6
+    _ROUNDING_FACTOR = 10
+    _GRAM_CALCULATION_FACTOR = 100
+
+    def __init__(
+        self,
+        food_information: list[FoodInformation],
+        constraints: list[Constraint],
+        solver_settings: SolverSettings | None = None,
+    ) -> None:
+        self._food_information = food_information
+        self._constraints = constraints
+        self._solver_settings = solver_settings or SolverSettings()
+        self._model_builder = ModelBuilder(food_information)
+        self._logger = SingletonLogger.get_logger()
+
+        self._items = self._create_items()
+        self._item_matrix, self._item_lower, self._item_upper = (
+            self._create_item_rows()
+        )
+        self._is_upper_item = np.isfinite(self._item_upper)
+        self._item_bounds = np.where(
+            self._is_upper_item, self._item_upper, self._item_lower
+        )
+        self._item_tolerances = self._FEASIBILITY_TOLERANCE * np.maximum(
+            1.0, np.abs(self._item_bounds)
+        )
+        self._points: list[np.ndarray] = []
+        self._highs = self._create_elastic_highs()
+
+    def _create_items(self) -> list[dict]:
+        constraint_items = [
+            {
+                "type": "constraint",
+                "index": index,
+                "min_max": constraint.min_max,
+                "nutrient": constraint.nutrient,
+                "unit": constraint.unit,
+                "value": constraint.value,
+            }
+            for index, constraint in enumerate(self._constraints)
+        ]
+        minimum_intake_items = [
+            {
+                "type": "minimum_intake",
+                "food": food.name,
+                "value": food.minimum_intake,
+            }
+            for food in self._food_information
+            if food.minimum_intake > 0
+        ]
+        maximum_intake_items = [
+            {
+                "type": "maximum_intake",
+                "food": food.name,
+                "value": food.maximum_intake,
+            }
+            for food in self._food_information
+        ]
+
+        return constraint_items + minimum_intake_items + maximum_intake_items
+
+    def _create_item_rows(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        food_count = len(self._food_information)
+        food_indices = {
+            food.name: index
+            for index, food in enumerate(self._food_information)
+        }
+        rows = [
+            self._model_builder.build_constraint_row(constraint)
+            for constraint in self._constraints
+        ]
+        for item in self._items[len(self._constraints) :]:
+            row = np.zeros(food_count)
+            row[food_indices[item["food"]]] = 1.0
+            if item["type"] == "minimum_intake":
+                rows.append((row, float(item["value"]), np.inf))
+            else:
+                rows.append((row, -np.inf, float(item["value"])))
+
+        return (
+            np.array([row for row, _, _ in rows], dtype=float).reshape(
+                len(rows), food_count
+            ),
+            np.array([lower for _, lower, _ in rows], dtype=float),
+            np.array([upper for _, _, upper in rows], dtype=float),
+        )
+
+    def _create_elastic_highs(self) -> highspy.Highs:
+        food_count = len(self._food_information)
+        item_count = len(self._items)
+        linear_model = LinearModel(
+            food_names=[food.name for food in self._food_information],
+            maximize=False,
+            objective_coefficients=np.zeros(food_count),
+            constraint_names=[f"item_{index}" for index in range(item_count)],
+            constraint_matrix=self._item_matrix,
+            constraint_lower=self._item_lower,
+            constraint_upper=self._item_upper,
+            intake_lower=np.zeros(food_count),
+            intake_upper=np.full(food_count, np.inf),
+        )
+        highs = HighsSolverBackend.create_highs(self._solver_settings)
+        highs.passModel(HighsSolverBackend.create_lp(linear_model))
+
+        # One slack column per item; an item is elastic while its slack
+        # column may be positive.
+        highs.addCols(
+            item_count,
+            np.zeros(item_count),
+            np.zeros(item_count),
+            np.zeros(item_count),
+            item_count,
+            np.arange(item_count),
+            np.arange(item_count),
+            np.where(self._is_upper_item, -1.0, 1.0),
+        )
+        return highs
+
+    def _set_item_state(
+        self, item_index: int, enabled: bool, elastic: bool = False
+    ) -> None:
+        if enabled:
+            self._highs.changeRowBounds(
+                item_index,
+                self._item_lower[item_index],
+                self._item_upper[item_index],
+            )
+        else:
+            self._highs.changeRowBounds(item_index, -np.inf, np.inf)
+
+        self._highs.changeColBounds(
+            len(self._food_information) + item_index,
+            0.0,
+            np.inf if elastic else 0.0,
+        )
+
+    def _solve(self, costs: np.ndarray) -> np.ndarray | None:
+        column_count = len(costs)
+        self._highs.changeColsCost(
+            column_count, np.arange(column_count), costs
+        )
+        self._highs.run()
+
+        if (
+            self._highs.getInfo().primal_solution_status
+            == highspy.SolutionStatus.kSolutionStatusFeasible
+        ):
+            values = np.asarray(self._highs.getSolution().col_value)
+            self._points.append(
+                np.round(values[: len(self._food_information)])
+            )
+            return values
+
+        model_status = self._highs.getModelStatus()
+        if model_status == highspy.HighsModelStatus.kInfeasible:
+            return None
+        raise RuntimeError(
+            "Infeasibility diagnosis stopped with status:"
+            f" {self._highs.modelStatusToString(model_status)}"
+        )
+
+    def _has_feasible_point(self, item_indices: list[int]) -> bool:
+        if not self._points:
+            return False
+
+        row_values = np.array(self._points) @ self._item_matrix[item_indices].T
+        tolerances = self._item_tolerances[item_indices]
+        return bool(
+            np.any(
+                np.all(
+                    (row_values >= self._item_lower[item_indices] - tolerances)
+                    & (
+                        row_values
+                        <= self._item_upper[item_indices] + tolerances
+                    ),
+                    axis=1,
+                )
+            )
+        )
+
+    def _run_elastic_filter(self) -> list[int]:
+        food_count = len(self._food_information)
+        costs = np.concatenate(
+            (
+                np.zeros(food_count),
+                1.0 / np.maximum(1.0, np.abs(self._item_bounds)),
+            )
+        )
+        elastic_indices = list(range(len(self._items)))
+        for item_index in elastic_indices:
+            self._set_item_state(item_index, True, elastic=True)
+
+        enforced_indices: list[int] = []
+        while (values := self._solve(costs)) is not None:
+            slacks = values[food_count:]
+            violated_indices = [
+                item_index
+                for item_index in elastic_indices
+                if slacks[item_index] > self._item_tolerances[item_index]
+            ]
+            if not violated_indices:
+                break
+
+            for item_index in violated_indices:
+                self._set_item_state(item_index, True)
+                elastic_indices.remove(item_index)
+                enforced_indices.append(item_index)
+
+        return enforced_indices
+
+    def _run_deletion_filter(self, candidate_indices: list[int]) -> list[int]:
+        for item_index in range(len(self._items)):
+            self._set_item_state(item_index, item_index in candidate_indices)
+
+        costs = np.zeros(len(self._food_information) + len(self._items))
+        conflicting_indices = list(candidate_indices)
+        for item_index in candidate_indices:
+            other_indices = [
+                other_index
+                for other_index in conflicting_indices
+                if other_index != item_index
+            ]
+            if self._has_feasible_point(other_indices):
+                continue
+
+            self._set_item_state(item_index, False)
+            if self._solve(costs) is None:
+                conflicting_indices = other_indices
+            else:
+                self._set_item_state(item_index, True)
+
+        return conflicting_indices
+
+    def _round_outward(self, value: float, is_upper_item: bool) -> float:
+        if is_upper_item:
+            rounded_value = math.ceil(
+                value * self._ROUNDING_FACTOR - self._FEASIBILITY_TOLERANCE
+            )
+        else:
+            rounded_value = math.floor(
+                value * self._ROUNDING_FACTOR + self._FEASIBILITY_TOLERANCE
+            )
+        return rounded_value / self._ROUNDING_FACTOR
+
+    def _optimize_ratio(self, item_index: int, sign: float) -> float | None:
+        constraint = self._constraints[item_index]
+        food_count = len(self._food_information)
+        energy_coefficients = self._model_builder.nutrient_coefficients(
+            "energy"
+        )
+        nutrient_energy_coefficients = (
+            self._item_matrix[item_index] * self._GRAM_CALCULATION_FACTOR
+            + energy_coefficients * constraint.value
+        )
+        slack_costs = np.zeros(len(self._items))
+
+        # Dinkelbach iterations: each solve either proves the current
+        # ratio optimal or finds intakes with a strictly better ratio.
+        values = self._solve(
+            np.concatenate((sign * self._item_matrix[item_index], slack_costs))
+        )
+        ratio = None
+        for _ in range(self.MAX_RATIO_ITERATIONS):
+            if values is None:
+                break
+
+            food_intakes = values[:food_count]
+            energy = float(energy_coefficients @ food_intakes)
+            if energy <= self._FEASIBILITY_TOLERANCE:
+                break
+
+            ratio = float(nutrient_energy_coefficients @ food_intakes) / energy
+            ratio_costs = sign * (
+                nutrient_energy_coefficients - ratio * energy_coefficients
+            )
+            values = self._solve(np.concatenate((ratio_costs, slack_costs)))
+            if (
+                values is not None
+                and ratio_costs @ values[:food_count]
+                >= -self._FEASIBILITY_TOLERANCE
+            ):
+                break
+
+        return ratio
+
+    def _find_relaxed_value(self, item_index: int) -> float | None:
+        for other_index in range(len(self._items)):
+            self._set_item_state(other_index, other_index != item_index)
+
+        is_upper_item = bool(self._is_upper_item[item_index])
+        sign = 1.0 if is_upper_item else -1.0
+        item = self._items[item_index]
+        if item.get("unit") == "ratio":
+            relaxed_value = self._optimize_ratio(item_index, sign)
+        else:
+            item_row = self._item_matrix[item_index]
+            values = self._solve(
+                np.concatenate((sign * item_row, np.zeros(len(self._items))))
+            )
+            relaxed_value = (
+                None
+                if values is None
+                else float(item_row @ values[: len(self._food_information)])
+            )
+
+        if relaxed_value is None:
+            return None
+        if item["type"] != "constraint":
+            return round(relaxed_value)
+        return self._round_outward(relaxed_value, is_upper_item)
+
+    def diagnose(self) -> list[dict]:
+        self._logger.info("Starting infeasibility diagnosis.")
+        start = time.perf_counter()
+
+        candidate_indices = self._run_elastic_filter()
+        conflicting_indices = (
+            self._run_deletion_filter(candidate_indices)
+            if candidate_indices
+            else []
+        )
+        conflicts = [
+            {
+                **self._items[item_index],
+                "relaxed_value": self._find_relaxed_value(item_index),
+            }
+            for item_index in conflicting_indices
+        ]
+
+        self._logger.info(
+            f"Completed infeasibility diagnosis with {len(conflicts)}"
+            f" conflicting items in {time.perf_counter() - start:.3f}s."
+        )
+        return conflicts
@@ -0,0 +1,301 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from src.admission_controller import AdmissionController
+from src.constraint import Constraint
+from src.food_information import FoodInformation
+from src.nutrition_optimizer import NutritionOptimizer
+from src.objective import Objective
+from src.singleton_logger import SingletonLogger
+from src.solve_cache import SolveCache
+from src.solver_settings import SolverSettings
+
+_DEFAULT_JOB_STORE = "memory"
+_DEFAULT_JOB_STORE_PATH = "cache/jobs.sqlite3"
+_DEFAULT_JOB_MAX_WORKERS = 2
+_DEFAULT_JOB_MAX_QUEUED = 64
+_DEFAULT_JOB_RETENTION = 3600
+
+
+class JobStore(ABC):
+    @abstractmethod
+    def save(self, job: dict) -> None:
+        pass  # pragma: no cover
+
+    @abstractmethod
+    def get(self, job_id: str) -> dict | None:
+        pass  # pragma: no cover
+
+    @abstractmethod
+    def purge(self, updated_before: float) -> None:
+        pass  # pragma: no cover
+
+
+class InMemoryJobStore(JobStore):
+    def __init__(self) -> None:
+        self._jobs: dict[str, dict] = {}
+        self._lock = threading.Lock()
+
+    def save(self, job: dict) -> None:
+        with self._lock:
+            self._jobs[job["job_id"]] = dict(job)
+
+    def get(self, job_id: str) -> dict | None:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return None if job is None else dict(job)
+
+    def purge(self, updated_before: float) -> None:
+        with self._lock:
+            expired_job_ids = [
+                job_id
+                for job_id, job in self._jobs.items()
+                if job["status"] in JobManager.FINISHED_STATUSES
+                and job["updated_at"] < updated_before
+            ]
+            for job_id in expired_job_ids:
+                del self._jobs[job_id]
+
+
+class SQLiteJobStore(JobStore):
+    def __init__(self, path: str) -> None:
+        store_dir = os.path.dirname(path)
+        if store_dir:
+            os.makedirs(store_dir, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            path, check_same_thread=False, isolation_level=None
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            " job_id TEXT PRIMARY KEY,"
+            " status TEXT NOT NULL,"
+            " job TEXT NOT NULL,"
+            " updated_at REAL NOT NULL)"
+        )
+
+    def save(self, job: dict) -> None:
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO jobs (job_id, status, job, updated_at)"
+                " VALUES (?, ?, ?, ?)",
+                (
+                    job["job_id"],
+                    job["status"],
+                    json.dumps(job),
+                    job["updated_at"],
+                ),
+            )
+
+    def get(self, job_id: str) -> dict | None:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT job FROM jobs WHERE job_id = ?", (job_id,)
+            ).fetchone()
+        return None if row is None else json.loads(row[0])
+
+    def purge(self, updated_before: float) -> None:
+        placeholders = ", ".join("?" for _ in JobManager.FINISHED_STATUSES)
+        with self._lock:
+            self._connection.execute(
+                f"DELETE FROM jobs WHERE status IN ({placeholders})"
+                " AND updated_at < ?",
+                (*JobManager.FINISHED_STATUSES, updated_before),
+            )
+
+
+class JobManager:
+    STATUSES = ["queued", "running", "completed", "failed", "cancelled"]
+    FINISHED_STATUSES = ["completed", "failed", "cancelled"]
+    JOB_STORES = ["memory", "sqlite"]
+
+    def __init__(
+        self,
+        job_store: JobStore,
+        max_workers: int,
+        max_queued_jobs: int,
+        retention: float,
+        solve_cache: SolveCache | None = None,
+        admission_controller: AdmissionController | None = None,
+    ) -> None:
+        self._job_store = job_store
+        self._max_workers = max_workers
+        self._max_queued_jobs = max_queued_jobs
+        self._retention = retention
+        self._solve_cache = solve_cache
+        self._admission_controller = admission_controller
+        self._logger = SingletonLogger.get_logger()
+
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._futures: dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_environment(
+        cls,
+        solve_cache: SolveCache | None = None,
+        admission_controller: AdmissionController | None = None,
+    ) -> "JobManager":
+        job_store_name = os.getenv("JOB_STORE", _DEFAULT_JOB_STORE)
+        if job_store_name not in cls.JOB_STORES:
+            raise ValueError(
+                f"Invalid job store: {job_store_name}."
+                f" Valid job stores are {cls.JOB_STORES}."
+            )
+
+        job_store: JobStore
+        if job_store_name == "sqlite":
+            path = os.getenv("JOB_STORE_PATH", _DEFAULT_JOB_STORE_PATH)
+            job_store = SQLiteJobStore(path)
+        else:
+            job_store = InMemoryJobStore()
+
+        max_workers = int(
+            os.getenv("JOB_MAX_WORKERS", _DEFAULT_JOB_MAX_WORKERS)
+        )
+        max_queued_jobs = int(
+            os.getenv("JOB_MAX_QUEUED", _DEFAULT_JOB_MAX_QUEUED)
+        )
+        retention = float(os.getenv("JOB_RETENTION", _DEFAULT_JOB_RETENTION))
+
+        return cls(
+            job_store,
+            max_workers,
+            max_queued_jobs,
+            retention,
+            solve_cache,
+            admission_controller,
+        )
+
+    def _update_job(self, job: dict, status: str, **fields: object) -> None:
+        job.update(fields, status=status, updated_at=time.time())
+        self._job_store.save(job)
+
+    def _solve(
+        self,
+        food_information: list[FoodInformation],
+        objective: Objective,
+        constraints: list[Constraint],
+        solver_settings: SolverSettings | None,
+    ) -> dict:
+        if self._admission_controller is not None:
+            with self._admission_controller.admit_background():
+                return self._solve_with_cache(
+                    food_information, objective, constraints, solver_settings
+                )
+
+        return self._solve_with_cache(
+            food_information, objective, constraints, solver_settings
+        )
+
+    def _solve_with_cache(
+        self,
+        food_information: list[FoodInformation],
+        objective: Objective,
+        constraints: list[Constraint],
+        solver_settings: SolverSettings | None,
+    ) -> dict:
+        nutrition_optimizer = NutritionOptimizer(
+            food_information, objective, constraints, solver_settings
+        )
+        if self._solve_cache is None:
+            return nutrition_optimizer.solve()
+
+        return self._solve_cache.get_or_solve(
+            food_information,
+            objective,
+            constraints,
+            nutrition_optimizer.solve,
+            solver_settings,
+        )
+
+    def _run(
+        self,
+        job: dict,
+        food_information: list[FoodInformation],
+        objective: Objective,
+        constraints: list[Constraint],
+        solver_settings: SolverSettings | None,
+    ) -> None:
+        with self._lock:
+            if self._is_cancelled(job["job_id"]):
+                self._futures.pop(job["job_id"], None)
+                return
+            self._update_job(job, "running")
+
+        fields: dict[str, object]
+        try:
+            result = self._solve(
+                food_information, objective, constraints, solver_settings
+            )
+            status, fields = "completed", {"result": result}
+        except Exception as e:
+            self._logger.warning(f"Error during job {job['job_id']}: {e}")
+            status, fields = "failed", {"message": str(e)}
+
+        with self._lock:
+            self._futures.pop(job["job_id"], None)
+            if self._is_cancelled(job["job_id"]):
+                return
+            self._update_job(job, status, **fields)
+
+    def _is_cancelled(self, job_id: str) -> bool:
+        stored_job = self._job_store.get(job_id)
+        return stored_job is not None and stored_job["status"] == "cancelled"
+
+    def submit(
+        self,
+        food_information: list[FoodInformation],
+        objective: Objective,
+        constraints: list[Constraint],
+        solver_settings: SolverSettings | None = None,
+    ) -> str:
+        self._job_store.purge(time.time() - self._retention)
+
+        with self._lock:
+            if len(self._futures) >= self._max_workers + self._max_queued_jobs:
+                raise RuntimeError("Job queue is full.")
+
+            job_id = uuid.uuid4().hex
+            job = {"job_id": job_id, "created_at": time.time()}
+            self._update_job(job, "queued")
+
+            self._futures[job_id] = self._executor.submit(
+                self._run,
+                job,
+                food_information,
+                objective,
+                constraints,
+                solver_settings,
+            )
+
+        self._logger.info(f"Submitted job {job_id}.")
+        return job_id
+
+    def get(self, job_id: str) -> dict | None:
+        return self._job_store.get(job_id)
+
+    def cancel(self, job_id: str) -> dict | None:
+        with self._lock:
+            job = self._job_store.get(job_id)
+            if job is None or job["status"] in self.FINISHED_STATUSES:
+                return job
+
+            future = self._futures.get(job_id)
+            if future is not None and future.cancel():
+                del self._futures[job_id]
+            self._update_job(job, "cancelled")
+
+        self._logger.info(f"Cancelled job {job_id}.")
+        return job
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(cancel_futures=True)
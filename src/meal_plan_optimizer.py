@@ -0,0 +1,328 @@
+import time
+
+import numpy as np
+from pulp import (
+    LpAffineExpression,
+    LpBinary,
+    LpConstraint,
+    LpInteger,
+    LpMaximize,
+    LpMinimize,
+    LpProblem,
+    LpVariable,
+    lpSum,
+)
+
+from src.constraint import Constraint
+from src.food_information import FoodInformation
+from src.model_builder import ModelBuilder
+from src.nutrition_optimizer import NutritionOptimizer
+from src.objective import Objective
+from src.singleton_logger import SingletonLogger
+from src.solver_backend import CbcSolverBackend
+from src.solver_settings import SolverSettings
+
+
+class MealPlanOptimizer:
+    MAX_DAY_COUNT = 31
+    SOLVED_STATUSES = ["Optimal", "Feasible"]
+    _GRAM_CALCULATION_FACTOR = 100
+    _FAILURE_MESSAGE = (
+        "Please review the constraints, the variety rule,"
+        " the grams per unit, or the intake values."
+    )
+
+    def __init__(
+        self,
+        food_information: list[FoodInformation],
+        objective: Objective,
+        daily_constraints: list[Constraint],
+        plan_constraints: list[Constraint],
+        day_count: int,
+        max_days_per_food: int | None = None,
+        solver_settings: SolverSettings | None = None,
+    ) -> None:
+        self._food_information = food_information
+        self._objective = objective
+        self._daily_constraints = daily_constraints
+        self._plan_constraints = plan_constraints
+        self._day_count = day_count
+        self._max_days_per_food = max_days_per_food
+        self._solver_settings = solver_settings or SolverSettings()
+
+        self._validate_day_count()
+        self._validate_max_days_per_food()
+        self._validate_solver()
+
+        self._model_builder = ModelBuilder(food_information)
+        self._logger = SingletonLogger.get_logger()
+
+    def _validate_day_count(self) -> None:
+        if not 1 <= self._day_count <= self.MAX_DAY_COUNT:
+            raise ValueError(
+                f"Day count must be between 1 and {self.MAX_DAY_COUNT}."
+                f" Got {self._day_count}."
+            )
+
+    def _validate_max_days_per_food(self) -> None:
+        if self._max_days_per_food is not None and not (
+            1 <= self._max_days_per_food <= self._day_count
+        ):
+            raise ValueError(
+                f"Max days per food must be between 1 and {self._day_count}."
+                f" Got {self._max_days_per_food}."
+            )
+
+    def _validate_solver(self) -> None:
+        if not self.is_decomposable and self._solver_settings.solver != "cbc":
+            raise ValueError(
+                "Meal plans with plan constraints or a variety rule"
+                " can only be solved with cbc."
+                f" Got {self._solver_settings.solver}."
+            )
+
+    @property
+    def is_decomposable(self) -> bool:
+        return not self._plan_constraints and self._max_days_per_food is None
+
+    def _get_nutrient_energy_per_gram(self, nutrient: str) -> int:
+        nutrient_energy_per_gram_attribute = (
+            f"{nutrient.upper()}_ENERGY_PER_GRAM"
+        )
+        return getattr(FoodInformation, nutrient_energy_per_gram_attribute)
+
+    def _build_constraint(
+        self,
+        nutrient_totals: dict[str, LpAffineExpression],
+        constraint: Constraint,
+    ) -> LpConstraint:
+        nutrient_total = nutrient_totals[constraint.nutrient]
+
+        if constraint.unit == "ratio":
+            calculation_factor = (
+                constraint.value / self._GRAM_CALCULATION_FACTOR
+            )
+            left_hand_side = (
+                nutrient_total
+                * self._get_nutrient_energy_per_gram(constraint.nutrient)
+                - nutrient_totals["energy"] * calculation_factor
+            )
+            right_hand_side = 0.0
+        else:
+            left_hand_side = nutrient_total
+            right_hand_side = constraint.value
+
+        if constraint.min_max == "max":
+            return left_hand_side <= right_hand_side
+        return left_hand_side >= right_hand_side
+
+    def _create_intake_variables(self) -> list[list[LpVariable]]:
+        lower_bound_is_optional = self._max_days_per_food is not None
+        return [
+            [
+                LpVariable(
+                    f"x_{day}_{index}",
+                    0 if lower_bound_is_optional else food.minimum_intake,
+                    food.maximum_intake,
+                    LpInteger,
+                )
+                for index, food in enumerate(self._food_information)
+            ]
+            for day in range(self._day_count)
+        ]
+
+    def _add_variety_constraints(
+        self,
+        problem: LpProblem,
+        intake_variables: list[list[LpVariable]],
+        max_days_per_food: int,
+    ) -> None:
+        for index, food in enumerate(self._food_information):
+            served_variables = []
+            for day in range(self._day_count):
+                served = LpVariable(f"y_{day}_{index}", cat=LpBinary)
+                intake = intake_variables[day][index]
+                problem += (
+                    intake <= food.maximum_intake * served,
+                    f"served_max_{day}_{index}",
+                )
+                problem += (
+                    intake >= food.minimum_intake * served,
+                    f"served_min_{day}_{index}",
+                )
+                served_variables.append(served)
+
+            problem += (
+                lpSum(served_variables) <= max_days_per_food,
+                f"variety_{index}",
+            )
+
+    def _add_symmetry_breaking_constraints(
+        self,
+        problem: LpProblem,
+        daily_totals: list[dict[str, LpAffineExpression]],
+    ) -> None:
+        nutrient = self._objective.nutrient
+        for day in range(self._day_count - 1):
+            problem += (
+                daily_totals[day][nutrient] >= daily_totals[day + 1][nutrient],
+                f"day_order_{day}",
+            )
+
+    def _build_problem(self) -> tuple[LpProblem, list[list[LpVariable]]]:
+        problem = LpProblem(
+            f"{self._objective.sense}_{self._objective.nutrient}_plan",
+            (
+                LpMaximize
+                if self._objective.sense == "maximize"
+                else LpMinimize
+            ),
+        )
+        intake_variables = self._create_intake_variables()
+        daily_totals = [
+            self._model_builder.build_nutrient_totals(day_variables)
+            for day_variables in intake_variables
+        ]
+        plan_totals = {
+            nutrient: lpSum(totals[nutrient] for totals in daily_totals)
+            for nutrient in FoodInformation.NUTRIENTS
+        }
+        problem.setObjective(plan_totals[self._objective.nutrient])
+
+        for day, totals in enumerate(daily_totals):
+            for index, constraint in enumerate(self._daily_constraints):
+                problem += (
+                    self._build_constraint(totals, constraint),
+                    f"day_{day}_constraint_{index}",
+                )
+        for index, constraint in enumerate(self._plan_constraints):
+            problem += (
+                self._build_constraint(plan_totals, constraint),
+                f"plan_constraint_{index}",
+            )
+        if self._max_days_per_food is not None:
+            self._add_variety_constraints(
+                problem, intake_variables, self._max_days_per_food
+            )
+        self._add_symmetry_breaking_constraints(problem, daily_totals)
+
+        return problem, intake_variables
+
+    def _solve_single_day(self) -> tuple[str, np.ndarray, float]:
+        self._logger.info("Days are independent. Solving a single day.")
+        result = NutritionOptimizer(
+            self._food_information,
+            self._objective,
+            self._daily_constraints,
+            self._solver_settings,
+        ).solve()
+
+        if result["status"] not in self.SOLVED_STATUSES:
+            return result["status"], np.empty((0, 0)), 0.0
+
+        day_intakes = np.array(
+            [
+                result["food_intakes"][food.name]
+                for food in self._food_information
+            ],
+            dtype=float,
+        )
+        return (
+            result["status"],
+            np.tile(day_intakes, (self._day_count, 1)),
+            result["gap"],
+        )
+
+    def _solve_plan(self) -> tuple[str, np.ndarray, float]:
+        self._logger.info(
+            f"Solving a {self._day_count}-day meal plan as one model."
+        )
+        problem, intake_variables = self._build_problem()
+        best_bound = CbcSolverBackend.run_cbc(problem, self._solver_settings)
+
+        status = CbcSolverBackend.get_status(problem)
+        if status not in self.SOLVED_STATUSES:
+            return status, np.empty((0, 0)), 0.0
+
+        plan_intakes = np.round(
+            [
+                [variable.varValue or 0.0 for variable in day_variables]
+                for day_variables in intake_variables
+            ]
+        )
+        return (
+            status,
+            plan_intakes + 0.0,
+            CbcSolverBackend.calculate_gap(problem, best_bound),
+        )
+
+    def _create_totals(self, nutrient_totals: np.ndarray) -> dict:
+        pfc_ratios = ModelBuilder.calculate_pfc_ratios(
+            np.round(nutrient_totals, 1)
+        )
+        return {
+            "total_nutrient_values": dict(
+                zip(
+                    FoodInformation.NUTRIENTS,
+                    np.round(nutrient_totals, 1).tolist(),
+                )
+            ),
+            "pfc_ratio": {
+                nutrient: pfc_ratio
+                for nutrient, pfc_ratio in zip(
+                    FoodInformation.NUTRIENTS,
+                    np.round(pfc_ratios, 1).tolist(),
+                )
+                if nutrient != "energy"
+            },
+        }
+
+    def _create_solved_result(
+        self, status: str, plan_intakes: np.ndarray, gap: float
+    ) -> dict:
+        daily_totals = self._model_builder.calculate_nutrient_totals(
+            plan_intakes
+        )
+        days = [
+            {
+                "food_intakes": dict(
+                    zip(
+                        [food.name for food in self._food_information],
+                        day_intakes.tolist(),
+                    )
+                ),
+                **self._create_totals(day_totals),
+            }
+            for day_intakes, day_totals in zip(plan_intakes, daily_totals)
+        ]
+
+        return {
+            "status": status,
+            "days": days,
+            **self._create_totals(daily_totals.sum(axis=0)),
+            "gap": gap,
+        }
+
+    def solve(self) -> dict:
+        self._logger.info("Starting to solve the meal plan.")
+        start = time.perf_counter()
+
+        if self.is_decomposable:
+            status, plan_intakes, gap = self._solve_single_day()
+        else:
+            status, plan_intakes, gap = self._solve_plan()
+        solve_time = round(time.perf_counter() - start, 3)
+
+        if status not in self.SOLVED_STATUSES:
+            self._logger.warning(f"Meal plan failed with status: {status}")
+            return {
+                "status": status,
+                "message": self._FAILURE_MESSAGE,
+                "solve_time": solve_time,
+            }
+
+        self._logger.info(f"Meal plan completed with status: {status}")
+        return {
+            **self._create_solved_result(status, plan_intakes, gap),
+            "solve_time": solve_time,
+        }
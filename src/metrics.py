@@ -0,0 +1,277 @@
+import bisect
+import threading
+from abc import ABC, abstractmethod
+
+_PHASE_BUCKETS = [
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+]
+_SIZE_BUCKETS = [
+    1.0,
+    5.0,
+    10.0,
+    25.0,
+    50.0,
+    100.0,
+    250.0,
+    500.0,
+    1000.0,
+    2500.0,
+    5000.0,
+    10000.0,
+]
+
+
+class Metric(ABC):
+    def __init__(
+        self, name: str, description: str, label_names: list[str]
+    ) -> None:
+        self._name = name
+        self._description = description
+        self._label_names = label_names
+        self._lock = threading.Lock()
+
+    @property
+    @abstractmethod
+    def metric_type(self) -> str:
+        pass  # pragma: no cover
+
+    @abstractmethod
+    def _render_samples(self) -> list[str]:
+        pass  # pragma: no cover
+
+    @staticmethod
+    def _escape(label_value: str) -> str:
+        return (
+            label_value.replace("\\", "\\\\")
+            .replace('"', '\\"')
+            .replace("\n", "\\n")
+        )
+
+    def _format_labels(
+        self, label_values: tuple, extra_labels: str = ""
+    ) -> str:
+        labels = [
+            f'{label_name}="{self._escape(str(label_value))}"'
+            for label_name, label_value in zip(self._label_names, label_values)
+        ]
+        if extra_labels:
+            labels.append(extra_labels)
+        return "{" + ",".join(labels) + "}" if labels else ""
+
+    def render(self) -> list[str]:
+        with self._lock:
+            samples = self._render_samples()
+        return [
+            f"# HELP {self._name} {self._description}",
+            f"# TYPE {self._name} {self.metric_type}",
+            *samples,
+        ]
+
+
+class Counter(Metric):
+    def __init__(
+        self, name: str, description: str, label_names: list[str]
+    ) -> None:
+        super().__init__(name, description, label_names)
+        self._values: dict[tuple, float] = {}
+
+    @property
+    def metric_type(self) -> str:
+        return "counter"
+
+    def inc(self, label_values: tuple = (), amount: float = 1.0) -> None:
+        with self._lock:
+            self._values[label_values] = (
+                self._values.get(label_values, 0.0) + amount
+            )
+
+    def set(self, value: float, label_values: tuple = ()) -> None:
+        with self._lock:
+            self._values[label_values] = value
+
+    def _render_samples(self) -> list[str]:
+        return [
+            f"{self._name}{self._format_labels(label_values)} {value}"
+            for label_values, value in self._values.items()
+        ]
+
+
+class Gauge(Counter):
+    @property
+    def metric_type(self) -> str:
+        return "gauge"
+
+
+class Histogram(Metric):
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        label_names: list[str],
+        buckets: list[float],
+    ) -> None:
+        super().__init__(name, description, label_names)
+        self._buckets = sorted(buckets)
+        self._bucket_counts: dict[tuple, list[int]] = {}
+        self._sums: dict[tuple, float] = {}
+
+    @property
+    def metric_type(self) -> str:
+        return "histogram"
+
+    def observe(self, value: float, label_values: tuple = ()) -> None:
+        bucket_index = bisect.bisect_left(self._buckets, value)
+        with self._lock:
+            bucket_counts = self._bucket_counts.setdefault(
+                label_values, [0] * (len(self._buckets) + 1)
+            )
+            bucket_counts[bucket_index] += 1
+            self._sums[label_values] = (
+                self._sums.get(label_values, 0.0) + value
+            )
+
+    def _render_samples(self) -> list[str]:
+        samples = []
+        for label_values, bucket_counts in self._bucket_counts.items():
+            cumulative_count = 0
+            for upper_bound, bucket_count in zip(
+                [*map(str, self._buckets), "+Inf"], bucket_counts
+            ):
+                cumulative_count += bucket_count
+                labels = self._format_labels(
+                    label_values, f'le="{upper_bound}"'
+                )
+                samples.append(
+                    f"{self._name}_bucket{labels} {cumulative_count}"
+                )
+
+            labels = self._format_labels(label_values)
+            samples.append(
+                f"{self._name}_sum{labels} {self._sums[label_values]}"
+            )
+            samples.append(f"{self._name}_count{labels} {cumulative_count}")
+        return samples
+
+
+class OptimizerMetrics:
+    CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._phase_seconds = Histogram(
+            "nutrition_optimizer_phase_seconds",
+            "Time spent in each optimization phase.",
+            ["phase"],
+            _PHASE_BUCKETS,
+        )
+        self._solves = Counter(
+            "nutrition_optimizer_solves_total",
+            "Number of optimization requests by result status.",
+            ["status"],
+        )
+        self._problem_foods = Histogram(
+            "nutrition_optimizer_problem_foods",
+            "Number of foods per optimization problem.",
+            [],
+            _SIZE_BUCKETS,
+        )
+        self._problem_constraints = Histogram(
+            "nutrition_optimizer_problem_constraints",
+            "Number of constraints per optimization problem.",
+            [],
+            _SIZE_BUCKETS,
+        )
+        self._solve_cache = Counter(
+            "nutrition_optimizer_solve_cache_lookups_total",
+            "Solve cache lookups by result.",
+            ["result"],
+        )
+        self._coalesced_requests = Counter(
+            "nutrition_optimizer_coalesced_requests_total",
+            "Optimization requests by single-flight role.",
+            ["role"],
+        )
+        self._startup_seconds = Gauge(
+            "nutrition_optimizer_startup_seconds",
+            "Time spent in each startup phase.",
+            ["phase"],
+        )
+        self._first_request_seconds = Gauge(
+            "nutrition_optimizer_first_request_seconds",
+            "Latency of the first optimization request after startup.",
+            [],
+        )
+        self._has_first_request = False
+        self._dropped_log_records = Counter(
+            "nutrition_optimizer_log_records_dropped_total",
+            "Log records dropped because the log queue was full.",
+            [],
+        )
+
+    def record_status(self, status: str) -> None:
+        self._solves.inc((status,))
+
+    def record_solve(
+        self,
+        phase_durations: dict[str, float],
+        status: str,
+        food_count: int,
+        constraint_count: int,
+    ) -> None:
+        for phase, seconds in phase_durations.items():
+            self._phase_seconds.observe(seconds, (phase,))
+        self.record_status(status)
+        self._problem_foods.observe(food_count)
+        self._problem_constraints.observe(constraint_count)
+
+    def record_request(self, seconds: float) -> None:
+        with self._lock:
+            if self._has_first_request:
+                return
+            self._has_first_request = True
+        self._first_request_seconds.set(seconds)
+
+    def render(
+        self,
+        solve_cache_stats: dict[str, int] | None = None,
+        dropped_log_records: int = 0,
+        single_flight_stats: dict[str, int] | None = None,
+        startup_durations: dict[str, float] | None = None,
+    ) -> str:
+        self._dropped_log_records.set(dropped_log_records)
+        metrics: list[Metric] = [
+            self._phase_seconds,
+            self._solves,
+            self._problem_foods,
+            self._problem_constraints,
+            self._dropped_log_records,
+        ]
+        for counter, values in [
+            (self._solve_cache, solve_cache_stats),
+            (self._coalesced_requests, single_flight_stats),
+            (self._startup_seconds, startup_durations),
+        ]:
+            if values is not None:
+                for label_value, value in values.items():
+                    counter.set(value, (label_value,))
+                metrics.append(counter)
+        if self._has_first_request:
+            metrics.append(self._first_request_seconds)
+
+        lines = [line for metric in metrics for line in metric.render()]
+        return "\n".join(lines) + "\n"
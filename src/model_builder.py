@@ -0,0 +1,277 @@
+from dataclasses import dataclass
+
+import numpy as np
+from pulp import LpAffineExpression, LpVariable
+
+from src.constraint import Constraint
+from src.food_information import FoodInformation
+from src.objective import Objective
+
+
+@dataclass(frozen=True)
+class LinearModel:
+    food_names: list[str]
+    maximize: bool
+    objective_coefficients: np.ndarray
+    constraint_names: list[str]
+    constraint_matrix: np.ndarray
+    constraint_lower: np.ndarray
+    constraint_upper: np.ndarray
+    intake_lower: np.ndarray
+    intake_upper: np.ndarray
+
+
+@dataclass(frozen=True)
+class NoGoodCut:
+    reference_values: np.ndarray
+    min_difference: float
+    free_indices: np.ndarray
+    interior_indices: np.ndarray
+    column_lower: np.ndarray
+    column_upper: np.ndarray
+    row_matrix: np.ndarray
+    row_lower: np.ndarray
+    row_upper: np.ndarray
+
+    @classmethod
+    def create(
+        cls,
+        linear_model: LinearModel,
+        reference_values: np.ndarray,
+        min_difference: float,
+        column_count: int,
+    ) -> "NoGoodCut":
+        lower, upper = linear_model.intake_lower, linear_model.intake_upper
+        free_indices = np.flatnonzero(lower < upper)
+        interior_indices = np.flatnonzero(
+            (lower < reference_values) & (reference_values < upper)
+        )
+        free_count, interior_count = len(free_indices), len(interior_indices)
+
+        difference_columns = np.full(len(lower), -1)
+        difference_columns[free_indices] = column_count + np.arange(free_count)
+        direction_columns = (
+            column_count + free_count + np.arange(interior_count)
+        )
+        at_lower = free_indices[
+            reference_values[free_indices] == lower[free_indices]
+        ]
+        at_upper = free_indices[
+            reference_values[free_indices] == upper[free_indices]
+        ]
+
+        row_count = len(at_lower) + len(at_upper) + 2 * interior_count + 1
+        row_matrix = np.zeros(
+            (row_count, column_count + free_count + interior_count)
+        )
+        row_upper = np.full(row_count, np.inf)
+
+        # d <= x - lower and d <= upper - x for values at a bound.
+        rows = np.arange(len(at_lower))
+        row_matrix[rows, difference_columns[at_lower]] = 1.0
+        row_matrix[rows, at_lower] = -1.0
+        row_upper[rows] = -lower[at_lower]
+        rows = len(at_lower) + np.arange(len(at_upper))
+        row_matrix[rows, difference_columns[at_upper]] = 1.0
+        row_matrix[rows, at_upper] = 1.0
+        row_upper[rows] = upper[at_upper]
+
+        # d <= |x - v| for interior values, where the direction column
+        # selects the side of v that x lies on.
+        values = reference_values[interior_indices]
+        below_big_m = 2 * (values - lower[interior_indices])
+        above_big_m = 2 * (upper[interior_indices] - values)
+        rows = len(at_lower) + len(at_upper) + 2 * np.arange(interior_count)
+        row_matrix[rows, difference_columns[interior_indices]] = 1.0
+        row_matrix[rows, interior_indices] = -1.0
+        row_matrix[rows, direction_columns] = below_big_m
+        row_upper[rows] = below_big_m - values
+        row_matrix[rows + 1, difference_columns[interior_indices]] = 1.0
+        row_matrix[rows + 1, interior_indices] = 1.0
+        row_matrix[rows + 1, direction_columns] = -above_big_m
+        row_upper[rows + 1] = values
+
+        row_matrix[-1, difference_columns[free_indices]] = 1.0
+        row_lower = np.full(row_count, -np.inf)
+        row_lower[-1] = min_difference
+
+        return cls(
+            reference_values=reference_values,
+            min_difference=min_difference,
+            free_indices=free_indices,
+            interior_indices=interior_indices,
+            column_lower=np.zeros(free_count + interior_count),
+            column_upper=np.concatenate(
+                (
+                    np.maximum(
+                        upper[free_indices] - reference_values[free_indices],
+                        reference_values[free_indices] - lower[free_indices],
+                    ),
+                    np.ones(interior_count),
+                )
+            ),
+            row_matrix=row_matrix,
+            row_lower=row_lower,
+            row_upper=row_upper,
+        )
+
+    def is_satisfied(self, values: np.ndarray) -> bool:
+        difference = np.abs(values - self.reference_values).sum()
+        return bool(difference >= self.min_difference)
+
+    def auxiliary_values(self, values: np.ndarray) -> np.ndarray:
+        return np.concatenate(
+            (
+                np.abs(
+                    values[self.free_indices]
+                    - self.reference_values[self.free_indices]
+                ),
+                (
+                    values[self.interior_indices]
+                    > self.reference_values[self.interior_indices]
+                ).astype(float),
+            )
+        )
+
+
+class ModelBuilder:
+    _GRAM_CALCULATION_FACTOR = 100
+
+    def __init__(self, food_information: list[FoodInformation]) -> None:
+        self._food_information = food_information
+        self._coefficients = self._build_coefficients()
+
+    def _build_coefficients(self) -> np.ndarray:
+        nutrient_values = np.array(
+            [
+                [
+                    getattr(food, nutrient)
+                    for nutrient in FoodInformation.NUTRIENTS
+                ]
+                for food in self._food_information
+            ],
+            dtype=float,
+        ).reshape(len(self._food_information), len(FoodInformation.NUTRIENTS))
+        grams_per_unit = np.array(
+            [food.grams_per_unit for food in self._food_information],
+            dtype=float,
+        )
+
+        return (
+            nutrient_values
+            * grams_per_unit[:, np.newaxis]
+            / self._GRAM_CALCULATION_FACTOR
+        )
+
+    @property
+    def coefficients(self) -> np.ndarray:
+        return self._coefficients
+
+    def nutrient_coefficients(self, nutrient: str) -> np.ndarray:
+        nutrient_index = FoodInformation.NUTRIENTS.index(nutrient)
+        return self._coefficients[:, nutrient_index]
+
+    def build_nutrient_totals(
+        self, food_intake_variables: list[LpVariable]
+    ) -> dict[str, LpAffineExpression]:
+        nutrient_totals = {}
+
+        for nutrient in FoodInformation.NUTRIENTS:
+            coefficients = self.nutrient_coefficients(nutrient).tolist()
+            nutrient_totals[nutrient] = LpAffineExpression(
+                zip(food_intake_variables, coefficients)
+            )
+
+        return nutrient_totals
+
+    @staticmethod
+    def _get_nutrient_energy_per_gram(nutrient: str) -> int:
+        nutrient_energy_per_gram_attribute = (
+            f"{nutrient.upper()}_ENERGY_PER_GRAM"
+        )
+        return getattr(FoodInformation, nutrient_energy_per_gram_attribute)
+
+    def calculate_nutrient_totals(
+        self, food_intakes: np.ndarray
+    ) -> np.ndarray:
+        return np.asarray(food_intakes, dtype=float) @ self._coefficients
+
+    @classmethod
+    def calculate_pfc_ratios(cls, nutrient_totals: np.ndarray) -> np.ndarray:
+        energy_per_gram = np.array(
+            [
+                (
+                    0
+                    if nutrient == "energy"
+                    else cls._get_nutrient_energy_per_gram(nutrient)
+                )
+                for nutrient in FoodInformation.NUTRIENTS
+            ],
+            dtype=float,
+        )
+        nutrient_energy = np.asarray(nutrient_totals) * energy_per_gram
+        total_energy = nutrient_energy.sum(axis=-1, keepdims=True)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            pfc_ratios = (
+                nutrient_energy / total_energy * cls._GRAM_CALCULATION_FACTOR
+            )
+        return np.where(total_energy > 0, pfc_ratios, 0.0)
+
+    def build_constraint_row(
+        self, constraint: Constraint
+    ) -> tuple[np.ndarray, float, float]:
+        nutrient_coefficients = self.nutrient_coefficients(constraint.nutrient)
+
+        if constraint.unit == "ratio":
+            nutrient_energy_per_gram = self._get_nutrient_energy_per_gram(
+                constraint.nutrient
+            )
+            calculation_factor = (
+                constraint.value / self._GRAM_CALCULATION_FACTOR
+            )
+            row = (
+                nutrient_coefficients * nutrient_energy_per_gram
+                - self.nutrient_coefficients("energy") * calculation_factor
+            )
+            bound = 0.0
+        else:
+            row = nutrient_coefficients
+            bound = float(constraint.value)
+
+        if constraint.min_max == "max":
+            return row, -np.inf, bound
+        return row, bound, np.inf
+
+    def build_linear_model(
+        self, objective: Objective, constraints: list[Constraint]
+    ) -> LinearModel:
+        food_count = len(self._food_information)
+        rows = [
+            self.build_constraint_row(constraint) for constraint in constraints
+        ]
+
+        return LinearModel(
+            food_names=[food.name for food in self._food_information],
+            maximize=objective.sense == "maximize",
+            objective_coefficients=self.nutrient_coefficients(
+                objective.nutrient
+            ),
+            constraint_names=[
+                f"{constraint.min_max}_{constraint.nutrient}_{constraint.unit}"
+                for constraint in constraints
+            ],
+            constraint_matrix=np.array(
+                [row for row, _, _ in rows], dtype=float
+            ).reshape(len(rows), food_count),
+            constraint_lower=np.array([lower for _, lower, _ in rows]),
+            constraint_upper=np.array([upper for _, _, upper in rows]),
+            intake_lower=np.array(
+                [food.minimum_intake for food in self._food_information],
+                dtype=float,
+            ),
+            intake_upper=np.array(
+                [food.maximum_intake for food in self._food_information],
+                dtype=float,
+            ),
+        )
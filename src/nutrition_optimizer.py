@@ -1,30 +1,71 @@
+import time
+from dataclasses import replace
+
+import numpy as np
 from pulp import (
+    LpAffineExpression,
     LpInteger,
     LpMaximize,
     LpMinimize,
     LpProblem,
-    LpStatus,
     LpVariable,
 )
 
+from src.compiled_nutrition_model import CompiledNutritionModel
 from src.constraint import Constraint
 from src.food_information import FoodInformation
+from src.model_builder import LinearModel, ModelBuilder
 from src.objective import Objective
+from src.phase_timer import PhaseTimer
+from src.presolver import Presolver, PresolveResult
 from src.singleton_logger import SingletonLogger
+from src.solver_backend import (
+    CbcSolverBackend,
+    EnumerationSolverBackend,
+    HighsSolverBackend,
+    RoundingSolverBackend,
+    SolverBackend,
+)
+from src.solver_settings import SolverSettings
+from src.warm_start import WarmStart
 
 
 class NutritionOptimizer:
     _GRAM_CALCULATION_FACTOR = 100
 
+    SOLVED_STATUSES = ["Optimal", "Feasible"]
+    SOLVER_BACKENDS: dict[str, type[SolverBackend]] = {
+        "highs": HighsSolverBackend,
+    }
+    _DEFAULT_FAILURE_MESSAGE = (
+        "Please review the constraints,"
+        " the grams per unit, or the intake values."
+    )
+    _FAILURE_MESSAGES = {
+        "Not Solved": "No solution was found within the time limit.",
+    }
+
     def __init__(
         self,
         food_information: list[FoodInformation],
         objective: Objective,
         constraints: list[Constraint],
+        solver_settings: SolverSettings | None = None,
+        compiled_model: CompiledNutritionModel | None = None,
+        warm_start: WarmStart | None = None,
+        phase_timer: PhaseTimer | None = None,
     ) -> None:
         self._food_information: list[FoodInformation] = food_information
         self._objective: Objective = objective
         self._constraints: list[Constraint] = constraints
+        self._solver_settings: SolverSettings = (
+            solver_settings or SolverSettings()
+        )
+        self._compiled_model = compiled_model
+        self._warm_start = warm_start
+        self._linear_model: LinearModel | None = None
+        self._model_builder: ModelBuilder | None = None
+        self._phase_timer = phase_timer or PhaseTimer()
 
         self._logger = SingletonLogger.get_logger()
 
@@ -71,7 +112,7 @@ class NutritionOptimizer:
         self._logger.info("Completed setting up LP problem.")
 
     def _update_objective_variable(
-        self, nutrient: str, objective_variables: float
+        self, nutrient: str, objective_variables: LpAffineExpression
     ) -> None:
         nutrient_attribute = f"_total_{nutrient}"
         setattr(self, nutrient_attribute, objective_variables)
@@ -79,27 +120,17 @@ class NutritionOptimizer:
     def _setup_objective_variables(self) -> None:
         self._logger.info("Setting up objective variables.")
 
-        for food_information in self._food_information:
-            for nutrient in FoodInformation.NUTRIENTS:
-                nutrient_value = getattr(food_information, nutrient)
-
-                objective_variable = (
-                    nutrient_value
-                    * food_information.grams_per_unit
-                    * self._food_intake_variables[food_information.name]
-                    / self._GRAM_CALCULATION_FACTOR
-                )
-
-                current_objective_variables = self._get_objective_variable(
-                    nutrient
-                )
-                new_objective_variables = (
-                    current_objective_variables + objective_variable
-                )
+        model_builder = self._get_model_builder()
+        food_intake_variables = [
+            self._food_intake_variables[food_information.name]
+            for food_information in self._food_information
+        ]
+        nutrient_totals = model_builder.build_nutrient_totals(
+            food_intake_variables
+        )
 
-                self._update_objective_variable(
-                    nutrient, new_objective_variables
-                )
+        for nutrient, nutrient_total in nutrient_totals.items():
+            self._update_objective_variable(nutrient, nutrient_total)
 
         self._logger.info("Completed setting up objective variables.")
 
@@ -185,101 +216,304 @@ class NutritionOptimizer:
             for food_name in self._food_intake_variables
         }
 
-    def _calculate_total_nutrient_values(self) -> dict:
-        total_nutrient_values = {}
-
-        for nutrient in FoodInformation.NUTRIENTS:
-            total_nutrient_value = sum(
-                getattr(food_information, nutrient)
-                * food_information.grams_per_unit
-                * self._food_intake_variables[food_name].varValue
-                / self._GRAM_CALCULATION_FACTOR
-                for food_name, food_information in zip(
-                    self._food_intake_variables.keys(),
-                    self._food_information,
-                )
-            )
-            rounded_nutrient_value = round(total_nutrient_value, 1)
-            total_nutrient_values[nutrient] = rounded_nutrient_value
+    def _get_model_builder(self) -> ModelBuilder:
+        if self._model_builder is None:
+            self._model_builder = ModelBuilder(self._food_information)
+        return self._model_builder
 
-        return total_nutrient_values
+    def _calculate_total_nutrient_values(self, food_intakes: dict) -> dict:
+        food_intake_vector = np.array(
+            [food_intakes[food.name] for food in self._food_information],
+            dtype=float,
+        )
+        nutrient_totals = self._get_model_builder().calculate_nutrient_totals(
+            food_intake_vector
+        )
 
-    def _recalculate_total_energy(self, total_values: dict) -> float:
-        recalculated_total_energy = 0
+        return dict(
+            zip(
+                FoodInformation.NUTRIENTS,
+                np.round(nutrient_totals, 1).tolist(),
+            )
+        )
 
-        for nutrient in FoodInformation.NUTRIENTS:
-            if nutrient == "energy":
-                continue
+    def _calculate_pfc_ratio(self, total_nutrient_values: dict) -> dict:
+        pfc_ratios = ModelBuilder.calculate_pfc_ratios(
+            np.array(
+                [
+                    total_nutrient_values[nutrient]
+                    for nutrient in FoodInformation.NUTRIENTS
+                ]
+            )
+        )
 
-            energy_per_gram = self._get_nutrient_energy_per_gram(nutrient)
-            recalculated_total_energy += (
-                total_values[nutrient] * energy_per_gram
+        return {
+            nutrient: pfc_ratio
+            for nutrient, pfc_ratio in zip(
+                FoodInformation.NUTRIENTS, np.round(pfc_ratios, 1).tolist()
             )
+            if nutrient != "energy"
+        }
 
-        return recalculated_total_energy
+    def _preparation(self) -> None:
+        if self._compiled_model is not None:
+            self._logger.info("Updating compiled model for solve.")
+            with self._phase_timer.measure("prepare_model"):
+                self._problem, self._food_intake_variables = (
+                    self._compiled_model.prepare(
+                        self._food_information,
+                        self._objective,
+                        self._constraints,
+                    )
+                )
+            return
 
-    def _calculate_pfc_ratio(self, total_nutrient_values: dict) -> dict:
-        pfc_ratio = {}
+        self._logger.info("Starting preparation for solve.")
+
+        with self._phase_timer.measure("setup_variables"):
+            self._setup_food_intake_variables()
+        with self._phase_timer.measure("build_expressions"):
+            self._setup_objective_variables()
+            self._setup_lp_problem()
+        with self._phase_timer.measure("setup_constraints"):
+            self._setup_constraints()
 
-        recalculated_total_energy = self._recalculate_total_energy(
-            total_nutrient_values
+        self._logger.info("Completed preparation for solve.")
+
+    def _build_linear_model(self) -> LinearModel:
+        if self._linear_model is None:
+            with self._phase_timer.measure("build_linear_model"):
+                model_builder = self._get_model_builder()
+                self._linear_model = model_builder.build_linear_model(
+                    self._objective, self._constraints
+                )
+        return self._linear_model
+
+    def _get_initial_values(self) -> np.ndarray | None:
+        if self._warm_start is None:
+            return None
+        return self._warm_start.initial_values(self._build_linear_model())
+
+    def _apply_initial_values(self, initial_values: np.ndarray) -> None:
+        self._logger.info("Applying previous solution as MIP start.")
+
+        for variable in self._problem.variables():
+            variable.varValue = None
+
+        for food_information, initial_value in zip(
+            self._food_information, initial_values.tolist()
+        ):
+            food_intake_variable = self._food_intake_variables[
+                food_information.name
+            ]
+            food_intake_variable.setInitialValue(initial_value)
+
+    def _run_solver(self) -> float | None:
+        initial_values = self._get_initial_values()
+        warm_start = initial_values is not None
+        if initial_values is not None:
+            self._apply_initial_values(initial_values)
+
+        return CbcSolverBackend.run_cbc(
+            self._problem, self._solver_settings, warm_start
         )
 
-        for nutrient_component in FoodInformation.NUTRIENTS:
-            if nutrient_component == "energy":
-                continue
+    def _get_solution_result(self) -> str:
+        return CbcSolverBackend.get_status(self._problem)
+
+    def _calculate_gap(self, best_bound: float | None) -> float:
+        return CbcSolverBackend.calculate_gap(self._problem, best_bound)
 
-            total_nutrient_value = total_nutrient_values[nutrient_component]
-            energy_per_gram = self._get_nutrient_energy_per_gram(
-                nutrient_component
+    def _create_solved_result(
+        self,
+        solution_result: str,
+        food_intakes: dict,
+        gap: float,
+        solve_time: float,
+    ) -> dict:
+        self._logger.info(
+            f"Optimization completed with status: {solution_result}"
+        )
+
+        with self._phase_timer.measure("result"):
+            total_nutrient_values = self._calculate_total_nutrient_values(
+                food_intakes
             )
+            pfc_ratio = self._calculate_pfc_ratio(total_nutrient_values)
 
-            ratio = (
-                total_nutrient_value
-                * energy_per_gram
-                / recalculated_total_energy
-            ) * self._GRAM_CALCULATION_FACTOR
-            rounded_ratio = round(ratio, 1)
-            pfc_ratio[nutrient_component] = rounded_ratio
+        return {
+            "status": solution_result,
+            "food_intakes": food_intakes,
+            "total_nutrient_values": total_nutrient_values,
+            "pfc_ratio": pfc_ratio,
+            "gap": gap,
+            "solve_time": solve_time,
+        }
 
-        return pfc_ratio
+    def _create_failed_result(
+        self, solution_result: str, solve_time: float
+    ) -> dict:
+        self._logger.warning(
+            f"Optimization failed with status: {solution_result}"
+        )
 
-    def _preparation(self) -> None:
-        self._logger.info("Starting preparation for solve.")
+        return {
+            "status": solution_result,
+            "message": self._FAILURE_MESSAGES.get(
+                solution_result, self._DEFAULT_FAILURE_MESSAGE
+            ),
+            "solve_time": solve_time,
+        }
 
-        self._setup_food_intake_variables()
-        self._setup_objective_variables()
-        self._setup_lp_problem()
-        self._setup_constraints()
+    def _solve_from_warm_start(self, warm_start: WarmStart) -> dict | None:
+        linear_model = self._build_linear_model()
 
-        self._logger.info("Completed preparation for solve.")
+        start = time.perf_counter()
+        with self._phase_timer.measure("warm_start"):
+            proven_optimum = warm_start.find_proven_optimum(linear_model)
+        if proven_optimum is None:
+            return None
 
-    def solve(self) -> dict:
-        self._preparation()
+        self._logger.info("Previous solution is still optimal.")
+        solve_time = round(time.perf_counter() - start, 3)
+        return self._create_solved_result(
+            "Optimal", proven_optimum, 0.0, solve_time
+        )
+
+    def _solve_with_backend(self, solver_backend: SolverBackend) -> dict:
+        self._logger.info("Building linear model for in-process solver.")
+        linear_model = self._build_linear_model()
 
         self._logger.info("Starting to solve the optimization problem.")
-        self._problem.solve()
+        initial_values = self._get_initial_values()
+        start = time.perf_counter()
+        with self._phase_timer.measure("solve"):
+            solver_result = solver_backend.solve(
+                linear_model, self._solver_settings, initial_values
+            )
+        solve_time = round(time.perf_counter() - start, 3)
+
+        if solver_result.status in self.SOLVED_STATUSES:
+            return self._create_solved_result(
+                solver_result.status,
+                solver_result.food_intakes,
+                solver_result.gap,
+                solve_time,
+            )
+        return self._create_failed_result(solver_result.status, solve_time)
+
+    def _apply_presolve(self, presolve_result: PresolveResult) -> None:
+        linear_model = presolve_result.linear_model
+        self._linear_model = linear_model
+        self._food_information = [
+            replace(
+                food_information,
+                minimum_intake=int(intake_lower),
+                maximum_intake=int(intake_upper),
+            )
+            for food_information, intake_lower, intake_upper in zip(
+                self._food_information,
+                linear_model.intake_lower.tolist(),
+                linear_model.intake_upper.tolist(),
+            )
+        ]
+        self._constraints = [
+            constraint
+            for index, constraint in enumerate(self._constraints)
+            if index not in presolve_result.removed_constraint_indices
+        ]
+
+    def _presolve(self) -> PresolveResult:
+        linear_model = self._build_linear_model()
+        with self._phase_timer.measure("presolve"):
+            presolve_result = Presolver().presolve(linear_model)
+
+        if presolve_result.is_infeasible:
+            self._logger.info(
+                f"Presolve proved infeasibility:"
+                f" {presolve_result.infeasible_reason}"
+            )
+        else:
+            self._logger.info(
+                "Presolve removed"
+                f" {len(presolve_result.removed_constraint_indices)}"
+                f" constraints and fixed"
+                f" {len(presolve_result.fixed_food_names)} foods."
+            )
+            self._apply_presolve(presolve_result)
+        return presolve_result
 
-        solution_result = LpStatus[self._problem.status]
-        if solution_result == "Optimal":
-            self._logger.info("Optimization completed successfully.")
+    def solve(self) -> dict:
+        start = time.perf_counter()
+        presolve_result = self._presolve()
+        solve_time = round(time.perf_counter() - start, 3)
+
+        if presolve_result.is_infeasible:
+            result = self._create_failed_result("Infeasible", solve_time)
+        elif presolve_result.is_fully_fixed:
+            result = self._create_solved_result(
+                "Optimal",
+                dict(
+                    zip(
+                        presolve_result.linear_model.food_names,
+                        presolve_result.linear_model.intake_lower.tolist(),
+                    )
+                ),
+                0.0,
+                solve_time,
+            )
+        else:
+            result = self._solve_presolved()
 
-            food_intakes = self._calculate_food_intakes()
-            total_nutrient_values = self._calculate_total_nutrient_values()
-            pfc_ratio = self._calculate_pfc_ratio(total_nutrient_values)
+        return {**result, "presolve": presolve_result.report()}
 
-            return {
-                "status": solution_result,
-                "food_intakes": food_intakes,
-                "total_nutrient_values": total_nutrient_values,
-                "pfc_ratio": pfc_ratio,
-            }
-        else:
-            self._logger.warning(
-                f"Optimization failed with status: {solution_result}"
+    def _solve_with_shortcuts(self) -> dict | None:
+        if self._warm_start is not None:
+            warm_start_result = self._solve_from_warm_start(self._warm_start)
+            if warm_start_result is not None:
+                return warm_start_result
+
+        if self._solver_settings.is_default and (
+            EnumerationSolverBackend.supports(self._build_linear_model())
+        ):
+            self._logger.info("Solving the small problem by enumeration.")
+            return self._solve_with_backend(EnumerationSolverBackend())
+
+        if self._solver_settings.mode == "approximate":
+            approximate_result = self._solve_with_backend(
+                RoundingSolverBackend()
+            )
+            if approximate_result["status"] != "Not Solved":
+                return approximate_result
+            self._logger.info(
+                "Rounding did not reach a feasible plan."
+                " Falling back to the exact solve."
+            )
+        return None
+
+    def _solve_presolved(self) -> dict:
+        result = self._solve_with_shortcuts()
+        if result is not None:
+            return result
+
+        solver_backend = self.SOLVER_BACKENDS.get(self._solver_settings.solver)
+        if solver_backend is not None:
+            return self._solve_with_backend(solver_backend())
+
+        self._preparation()
+
+        self._logger.info("Starting to solve the optimization problem.")
+        start = time.perf_counter()
+        with self._phase_timer.measure("solve"):
+            best_bound = self._run_solver()
+        solve_time = round(time.perf_counter() - start, 3)
+
+        solution_result = self._get_solution_result()
+        if solution_result in self.SOLVED_STATUSES:
+            return self._create_solved_result(
+                solution_result,
+                self._calculate_food_intakes(),
+                self._calculate_gap(best_bound),
+                solve_time,
             )
-            return {
-                "status": solution_result,
-                "message": "Please review the constraints,"
-                " the grams per unit, or the intake values.",
-            }
+        return self._create_failed_result(solution_result, solve_time)
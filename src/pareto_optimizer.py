@@ -0,0 +1,394 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+
+import numpy as np
+
+from src.constraint import Constraint
+from src.food_information import FoodInformation
+from src.model_builder import LinearModel, ModelBuilder
+from src.objective import Objective
+from src.singleton_logger import SingletonLogger
+from src.solver_backend import (
+    CbcSolverBackend,
+    HighsSolverBackend,
+    SolverBackend,
+    SolverResult,
+)
+from src.solver_settings import SolverSettings
+
+_DEFAULT_PARETO_MAX_WORKERS = os.cpu_count() or 1
+_DEFAULT_PARETO_MAX_POINTS = 50
+
+
+class ParetoOptimizer:
+    OBJECTIVE_COUNT = 2
+    SOLVED_STATUSES = ["Optimal", "Feasible"]
+    SOLVER_BACKENDS: dict[str, type[SolverBackend]] = {
+        "cbc": CbcSolverBackend,
+        "highs": HighsSolverBackend,
+    }
+    _EPSILON_TOLERANCE = 1e-6
+    _FAILURE_MESSAGE = (
+        "Please review the constraints,"
+        " the grams per unit, or the intake values."
+    )
+
+    def __init__(self, max_workers: int, max_points: int) -> None:
+        if max_workers <= 0:
+            raise ValueError(
+                f"Pareto max workers must be greater than zero."
+                f" Got {max_workers}."
+            )
+        if max_points < 2:
+            raise ValueError(
+                f"Pareto max points must be at least 2. Got {max_points}."
+            )
+
+        self._max_workers = max_workers
+        self._max_points = max_points
+        self._logger = SingletonLogger.get_logger()
+
+    @classmethod
+    def from_environment(cls) -> "ParetoOptimizer":
+        max_workers = int(
+            os.getenv("PARETO_MAX_WORKERS", _DEFAULT_PARETO_MAX_WORKERS)
+        )
+        max_points = int(
+            os.getenv("PARETO_MAX_POINTS", _DEFAULT_PARETO_MAX_POINTS)
+        )
+        return cls(max_workers, max_points)
+
+    def get_worker_count(self, point_count: int) -> int:
+        return min(self._max_workers, point_count)
+
+    def _validate_objectives(self, objectives: list[Objective]) -> None:
+        if len(objectives) != self.OBJECTIVE_COUNT:
+            raise ValueError(
+                f"Exactly {self.OBJECTIVE_COUNT} objectives are required."
+                f" Got {len(objectives)}."
+            )
+        if objectives[0].nutrient == objectives[1].nutrient:
+            raise ValueError(
+                "Objectives must target different nutrients."
+                f" Got {objectives[0].nutrient} twice."
+            )
+
+    def _validate_point_count(self, point_count: int) -> None:
+        if not 2 <= point_count <= self._max_points:
+            raise ValueError(
+                f"Point count must be between 2 and {self._max_points}."
+                f" Got {point_count}."
+            )
+
+    @staticmethod
+    def _add_row(
+        linear_model: LinearModel,
+        name: str,
+        coefficients: np.ndarray,
+        lower: float = -np.inf,
+        upper: float = np.inf,
+    ) -> LinearModel:
+        return replace(
+            linear_model,
+            constraint_names=[*linear_model.constraint_names, name],
+            constraint_matrix=np.vstack(
+                [linear_model.constraint_matrix, coefficients]
+            ),
+            constraint_lower=np.append(linear_model.constraint_lower, lower),
+            constraint_upper=np.append(linear_model.constraint_upper, upper),
+        )
+
+    def _solve_primary_anchor(
+        self,
+        linear_model: LinearModel,
+        secondary_model: LinearModel,
+        solver_settings: SolverSettings,
+        solver_backend: SolverBackend,
+        anchor_values: np.ndarray,
+    ) -> SolverResult:
+        primary_anchor = solver_backend.solve(
+            linear_model, solver_settings, anchor_values
+        )
+        if primary_anchor.status not in self.SOLVED_STATUSES:
+            return primary_anchor
+
+        # Among the primary optima, take the one best for the secondary
+        # objective so the first point is not dominated.
+        primary_values = SolverBackend.to_vector(linear_model, primary_anchor)
+        primary_value = linear_model.objective_coefficients @ primary_values
+        tolerance = self._EPSILON_TOLERANCE * max(1.0, abs(primary_value))
+        lower, upper = (
+            (primary_value - tolerance, np.inf)
+            if linear_model.maximize
+            else (-np.inf, primary_value + tolerance)
+        )
+        lexicographic_anchor = solver_backend.solve(
+            self._add_row(
+                secondary_model,
+                "primary",
+                linear_model.objective_coefficients,
+                lower,
+                upper,
+            ),
+            solver_settings,
+            primary_values,
+        )
+        if lexicographic_anchor.status not in self.SOLVED_STATUSES:
+            return primary_anchor
+        return lexicographic_anchor
+
+    def _create_row_bounds(
+        self, secondary: Objective, epsilons: np.ndarray
+    ) -> list[tuple[float, float]]:
+        tolerances = self._EPSILON_TOLERANCE * np.maximum(1.0, abs(epsilons))
+        if secondary.sense == "minimize":
+            return [
+                (-np.inf, float(epsilon + tolerance))
+                for epsilon, tolerance in zip(epsilons, tolerances)
+            ]
+        return [
+            (float(epsilon - tolerance), np.inf)
+            for epsilon, tolerance in zip(epsilons, tolerances)
+        ]
+
+    def _solve_points(
+        self,
+        epsilon_model: LinearModel,
+        row_bounds: list[tuple[float, float]],
+        anchor_values: np.ndarray,
+        solver_settings: SolverSettings,
+        solver_backend: SolverBackend,
+    ) -> list[SolverResult]:
+        worker_count = min(self._max_workers, len(row_bounds))
+        chunks = [
+            [row_bounds[index] for index in chunk_indices]
+            for chunk_indices in np.array_split(
+                np.arange(len(row_bounds)), worker_count
+            )
+        ]
+        row_index = len(epsilon_model.constraint_names) - 1
+
+        with ThreadPoolExecutor(max_workers=worker_count) as executor:
+            chunk_results = executor.map(
+                lambda chunk: solver_backend.solve_row_bound_sequence(
+                    epsilon_model,
+                    solver_settings,
+                    row_index,
+                    chunk,
+                    anchor_values,
+                ),
+                chunks,
+            )
+            return [
+                solver_result
+                for solver_results in chunk_results
+                for solver_result in solver_results
+            ]
+
+    @staticmethod
+    def _is_dominated(
+        values: np.ndarray, other_values: np.ndarray, signs: np.ndarray
+    ) -> bool:
+        difference = (other_values - values) * signs
+        return bool(np.all(difference >= 0) and np.any(difference > 0))
+
+    def _find_pareto_indices(
+        self,
+        objective_values: np.ndarray,
+        solver_results: list[SolverResult],
+        signs: np.ndarray,
+    ) -> list[int]:
+        pareto_indices: list[int] = []
+        for index, values in enumerate(objective_values):
+            is_duplicate = any(
+                solver_results[index].food_intakes
+                == solver_results[pareto_index].food_intakes
+                for pareto_index in pareto_indices
+            )
+            is_dominated = any(
+                self._is_dominated(values, other_values, signs)
+                for other_values in objective_values
+            )
+            if not (is_duplicate or is_dominated):
+                pareto_indices.append(index)
+
+        return pareto_indices
+
+    @staticmethod
+    def _create_point(
+        solver_result: SolverResult,
+        nutrient_totals: np.ndarray,
+        pfc_ratios: np.ndarray,
+    ) -> dict:
+        return {
+            "status": solver_result.status,
+            "food_intakes": solver_result.food_intakes,
+            "total_nutrient_values": dict(
+                zip(
+                    FoodInformation.NUTRIENTS,
+                    np.round(nutrient_totals, 1).tolist(),
+                )
+            ),
+            "pfc_ratio": {
+                nutrient: pfc_ratio
+                for nutrient, pfc_ratio in zip(
+                    FoodInformation.NUTRIENTS,
+                    np.round(pfc_ratios, 1).tolist(),
+                )
+                if nutrient != "energy"
+            },
+            "gap": solver_result.gap,
+        }
+
+    def _create_points(
+        self,
+        model_builder: ModelBuilder,
+        linear_model: LinearModel,
+        objectives: list[Objective],
+        solver_results: list[SolverResult],
+    ) -> list[dict]:
+        solved_results = [
+            solver_result
+            for solver_result in solver_results
+            if solver_result.status in self.SOLVED_STATUSES
+        ]
+        if not solved_results:
+            return []
+
+        nutrient_totals = model_builder.calculate_nutrient_totals(
+            np.array(
+                [
+                    SolverBackend.to_vector(linear_model, solver_result)
+                    for solver_result in solved_results
+                ]
+            )
+        )
+        pfc_ratios = ModelBuilder.calculate_pfc_ratios(
+            np.round(nutrient_totals, 1)
+        )
+
+        objective_values = nutrient_totals[
+            :,
+            [
+                FoodInformation.NUTRIENTS.index(objective.nutrient)
+                for objective in objectives
+            ],
+        ]
+        signs = np.array(
+            [
+                1.0 if objective.sense == "maximize" else -1.0
+                for objective in objectives
+            ]
+        )
+
+        return [
+            self._create_point(
+                solved_results[index],
+                nutrient_totals[index],
+                pfc_ratios[index],
+            )
+            for index in self._find_pareto_indices(
+                objective_values, solved_results, signs
+            )
+        ]
+
+    def _get_status(self, solver_results: list[SolverResult]) -> str:
+        for solver_result in solver_results:
+            if solver_result.status not in self.SOLVED_STATUSES:
+                return solver_result.status
+        if all(
+            solver_result.status == "Optimal"
+            for solver_result in solver_results
+        ):
+            return "Optimal"
+        return "Feasible"
+
+    def _create_failed_result(self, status: str, start: float) -> dict:
+        self._logger.warning(
+            f"Pareto optimization failed with status: {status}"
+        )
+        return {
+            "status": status,
+            "message": self._FAILURE_MESSAGE,
+            "points": [],
+            "solve_time": round(time.perf_counter() - start, 3),
+        }
+
+    def solve(
+        self,
+        food_information: list[FoodInformation],
+        objectives: list[Objective],
+        constraints: list[Constraint],
+        point_count: int,
+        solver_settings: SolverSettings | None = None,
+    ) -> dict:
+        self._validate_objectives(objectives)
+        self._validate_point_count(point_count)
+        solver_settings = solver_settings or SolverSettings()
+
+        self._logger.info(
+            f"Starting Pareto optimization with {point_count} points."
+        )
+        start = time.perf_counter()
+
+        solver_backend = self.SOLVER_BACKENDS[solver_settings.solver]()
+        primary, secondary = objectives
+        model_builder = ModelBuilder(food_information)
+        linear_model = model_builder.build_linear_model(primary, constraints)
+        secondary_coefficients = model_builder.nutrient_coefficients(
+            secondary.nutrient
+        )
+
+        secondary_model = replace(
+            linear_model,
+            maximize=secondary.sense == "maximize",
+            objective_coefficients=secondary_coefficients,
+        )
+        secondary_anchor = solver_backend.solve(
+            secondary_model, solver_settings
+        )
+        if secondary_anchor.status not in self.SOLVED_STATUSES:
+            return self._create_failed_result(secondary_anchor.status, start)
+        anchor_values = SolverBackend.to_vector(linear_model, secondary_anchor)
+
+        primary_anchor = self._solve_primary_anchor(
+            linear_model,
+            secondary_model,
+            solver_settings,
+            solver_backend,
+            anchor_values,
+        )
+        if primary_anchor.status not in self.SOLVED_STATUSES:
+            return self._create_failed_result(primary_anchor.status, start)
+
+        epsilons = np.linspace(
+            secondary_coefficients
+            @ SolverBackend.to_vector(linear_model, primary_anchor),
+            secondary_coefficients @ anchor_values,
+            point_count,
+        )
+        solver_results = self._solve_points(
+            self._add_row(linear_model, "epsilon", secondary_coefficients),
+            self._create_row_bounds(secondary, epsilons),
+            anchor_values,
+            solver_settings,
+            solver_backend,
+        )
+
+        points = self._create_points(
+            model_builder, linear_model, objectives, solver_results
+        )
+        status = self._get_status(solver_results)
+        if not points:
+            return self._create_failed_result(status, start)
+
+        self._logger.info(
+            f"Completed Pareto optimization with {len(points)} points."
+        )
+        return {
+            "status": "Optimal" if status == "Optimal" else "Feasible",
+            "points": points,
+            "solve_time": round(time.perf_counter() - start, 3),
+        }
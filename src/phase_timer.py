@@ -0,0 +1,28 @@
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+
+class PhaseTimer:
+    def __init__(self) -> None:
+        self._durations: dict[str, float] = {}
+
+    @contextmanager
+    def measure(self, phase: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._durations[phase] = self._durations.get(phase, 0.0) + (
+                time.perf_counter() - start
+            )
+
+    @property
+    def durations(self) -> dict[str, float]:
+        return dict(self._durations)
+
+    def to_server_timing(self) -> str:
+        return ", ".join(
+            f"{phase};dur={seconds * 1000:.3f}"
+            for phase, seconds in self._durations.items()
+        )
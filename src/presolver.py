@@ -0,0 +1,263 @@
+from dataclasses import dataclass, replace
+
+import numpy as np
+
+from src.model_builder import LinearModel
+
+
+@dataclass(frozen=True)
+class PresolveResult:
+    linear_model: LinearModel
+    infeasible_reason: str | None = None
+    removed_constraint_indices: tuple[int, ...] = ()
+    fixed_food_names: tuple[str, ...] = ()
+    tightened_food_names: tuple[str, ...] = ()
+
+    @property
+    def is_infeasible(self) -> bool:
+        return self.infeasible_reason is not None
+
+    @property
+    def is_fully_fixed(self) -> bool:
+        return len(self.fixed_food_names) == len(self.linear_model.food_names)
+
+    def report(self) -> dict:
+        return {
+            "infeasible_reason": self.infeasible_reason,
+            "removed_constraints": list(self.removed_constraint_indices),
+            "fixed_foods": list(self.fixed_food_names),
+            "tightened_foods": list(self.tightened_food_names),
+        }
+
+
+class Presolver:
+    _FEASIBILITY_TOLERANCE = 1e-6
+
+    def __init__(self, max_passes: int = 10) -> None:
+        if max_passes <= 0:
+            raise ValueError(
+                f"Presolve max passes must be greater than zero."
+                f" Got {max_passes}."
+            )
+
+        self._max_passes = max_passes
+
+    @staticmethod
+    def calculate_activity_bounds(
+        constraint_matrix: np.ndarray,
+        intake_lower: np.ndarray,
+        intake_upper: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        positive = np.maximum(constraint_matrix, 0.0)
+        negative = np.minimum(constraint_matrix, 0.0)
+        return (
+            positive @ intake_lower + negative @ intake_upper,
+            positive @ intake_upper + negative @ intake_lower,
+        )
+
+    def _calculate_tolerances(self, values: np.ndarray) -> np.ndarray:
+        finite_values = np.where(np.isfinite(values), np.abs(values), 0.0)
+        return self._FEASIBILITY_TOLERANCE * np.maximum(1.0, finite_values)
+
+    def _find_infeasible_row(
+        self,
+        linear_model: LinearModel,
+        activity_lower: np.ndarray,
+        activity_upper: np.ndarray,
+    ) -> str | None:
+        is_infeasible = (
+            activity_upper
+            < linear_model.constraint_lower
+            - self._calculate_tolerances(linear_model.constraint_lower)
+        ) | (
+            activity_lower
+            > linear_model.constraint_upper
+            + self._calculate_tolerances(linear_model.constraint_upper)
+        )
+        if not np.any(is_infeasible):
+            return None
+
+        row_index = int(np.argmax(is_infeasible))
+        return (
+            f"Constraint {linear_model.constraint_names[row_index]} cannot"
+            " be satisfied within the intake ranges. The achievable range is"
+            f" {activity_lower[row_index]:.1f}"
+            f" to {activity_upper[row_index]:.1f}."
+        )
+
+    @staticmethod
+    def _calculate_implied_bounds(
+        linear_model: LinearModel,
+        intake_lower: np.ndarray,
+        intake_upper: np.ndarray,
+        activity_lower: np.ndarray,
+        activity_upper: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        constraint_matrix = linear_model.constraint_matrix
+        upper_slack = (linear_model.constraint_upper - activity_lower)[
+            :, np.newaxis
+        ]
+        lower_slack = (linear_model.constraint_lower - activity_upper)[
+            :, np.newaxis
+        ]
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            upper_step = upper_slack / constraint_matrix
+            lower_step = lower_slack / constraint_matrix
+
+        is_positive = constraint_matrix > 0
+        is_negative = constraint_matrix < 0
+        implied_upper = np.where(
+            is_positive,
+            intake_lower + upper_step,
+            np.where(is_negative, intake_lower + lower_step, np.inf),
+        )
+        implied_lower = np.where(
+            is_positive,
+            intake_upper + lower_step,
+            np.where(is_negative, intake_upper + upper_step, -np.inf),
+        )
+
+        return (
+            np.nan_to_num(implied_lower, nan=-np.inf).max(
+                axis=0, initial=-np.inf
+            ),
+            np.nan_to_num(implied_upper, nan=np.inf).min(
+                axis=0, initial=np.inf
+            ),
+        )
+
+    def _tighten_bounds(
+        self,
+        linear_model: LinearModel,
+        intake_lower: np.ndarray,
+        intake_upper: np.ndarray,
+        activity_lower: np.ndarray,
+        activity_upper: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        implied_lower, implied_upper = self._calculate_implied_bounds(
+            linear_model,
+            intake_lower,
+            intake_upper,
+            activity_lower,
+            activity_upper,
+        )
+        # Adding 0.0 turns the -0.0 that ceil returns in (-1, 0] into 0.0.
+        return (
+            np.maximum(
+                intake_lower,
+                np.ceil(implied_lower - self._FEASIBILITY_TOLERANCE),
+            )
+            + 0.0,
+            np.minimum(
+                intake_upper,
+                np.floor(implied_upper + self._FEASIBILITY_TOLERANCE),
+            )
+            + 0.0,
+        )
+
+    def _find_empty_intake_range(
+        self,
+        linear_model: LinearModel,
+        intake_lower: np.ndarray,
+        intake_upper: np.ndarray,
+    ) -> str | None:
+        is_empty = intake_lower > intake_upper
+        if not np.any(is_empty):
+            return None
+
+        food_name = linear_model.food_names[int(np.argmax(is_empty))]
+        return f"No intake of {food_name} satisfies the constraints."
+
+    def _create_reduced_result(
+        self,
+        linear_model: LinearModel,
+        intake_lower: np.ndarray,
+        intake_upper: np.ndarray,
+    ) -> PresolveResult:
+        activity_lower, activity_upper = self.calculate_activity_bounds(
+            linear_model.constraint_matrix, intake_lower, intake_upper
+        )
+        is_redundant = (
+            activity_lower
+            >= linear_model.constraint_lower
+            - self._calculate_tolerances(linear_model.constraint_lower)
+        ) & (
+            activity_upper
+            <= linear_model.constraint_upper
+            + self._calculate_tolerances(linear_model.constraint_upper)
+        )
+        is_kept = ~is_redundant
+        is_fixed = intake_lower == intake_upper
+        is_tightened = ~is_fixed & (
+            (intake_lower != linear_model.intake_lower)
+            | (intake_upper != linear_model.intake_upper)
+        )
+
+        return PresolveResult(
+            linear_model=replace(
+                linear_model,
+                constraint_names=[
+                    name
+                    for name, kept in zip(
+                        linear_model.constraint_names, is_kept.tolist()
+                    )
+                    if kept
+                ],
+                constraint_matrix=linear_model.constraint_matrix[is_kept],
+                constraint_lower=linear_model.constraint_lower[is_kept],
+                constraint_upper=linear_model.constraint_upper[is_kept],
+                intake_lower=intake_lower,
+                intake_upper=intake_upper,
+            ),
+            removed_constraint_indices=tuple(
+                np.flatnonzero(is_redundant).tolist()
+            ),
+            fixed_food_names=tuple(
+                np.array(linear_model.food_names, dtype=object)[
+                    is_fixed
+                ].tolist()
+            ),
+            tightened_food_names=tuple(
+                np.array(linear_model.food_names, dtype=object)[
+                    is_tightened
+                ].tolist()
+            ),
+        )
+
+    def presolve(self, linear_model: LinearModel) -> PresolveResult:
+        intake_lower = linear_model.intake_lower.astype(float)
+        intake_upper = linear_model.intake_upper.astype(float)
+
+        for _ in range(self._max_passes):
+            activity_lower, activity_upper = self.calculate_activity_bounds(
+                linear_model.constraint_matrix, intake_lower, intake_upper
+            )
+            infeasible_reason = self._find_infeasible_row(
+                linear_model, activity_lower, activity_upper
+            )
+            if infeasible_reason is not None:
+                return PresolveResult(linear_model, infeasible_reason)
+
+            tightened_lower, tightened_upper = self._tighten_bounds(
+                linear_model,
+                intake_lower,
+                intake_upper,
+                activity_lower,
+                activity_upper,
+            )
+            infeasible_reason = self._find_empty_intake_range(
+                linear_model, tightened_lower, tightened_upper
+            )
+            if infeasible_reason is not None:
+                return PresolveResult(linear_model, infeasible_reason)
+
+            if np.array_equal(tightened_lower, intake_lower) and (
+                np.array_equal(tightened_upper, intake_upper)
+            ):
+                break
+            intake_lower, intake_upper = tightened_lower, tightened_upper
+
+        return self._create_reduced_result(
+            linear_model, intake_lower, intake_upper
+        )
@@ -0,0 +1,244 @@
+import json
+from dataclasses import fields
+from typing import Any, Type
+
+from src.constraint import Constraint
+from src.food_catalog import FoodCatalog
+from src.food_information import FoodInformation
+from src.objective import Objective
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+_MAX_REPORTED_ERRORS = 20
+
+
+def _snake_to_camel(snake_case_str: str) -> str:
+    first_word, *words = snake_case_str.split("_")
+    return first_word + "".join(word.capitalize() for word in words)
+
+
+def _compile_field_map(cls: Type) -> dict[str, str]:
+    field_map = {}
+    for field in fields(cls):
+        field_map[field.name] = field.name
+        field_map[_snake_to_camel(field.name)] = field.name
+    return field_map
+
+
+class RequestValidationError(ValueError):
+    def __init__(self, errors: list[str]) -> None:
+        self.errors = errors
+
+        reported_errors = errors[:_MAX_REPORTED_ERRORS]
+        if len(errors) > _MAX_REPORTED_ERRORS:
+            reported_errors.append(
+                f"and {len(errors) - _MAX_REPORTED_ERRORS} more errors"
+            )
+        super().__init__("; ".join(reported_errors))
+
+
+class RequestParser:
+    FIELD_MAPS = {
+        cls: _compile_field_map(cls)
+        for cls in [FoodInformation, Objective, Constraint]
+    }
+    JSON_DECODER = "stdlib" if orjson is None else "orjson"
+
+    @staticmethod
+    def decode_json(body: bytes | str) -> Any:
+        if orjson is None:  # pragma: no cover
+            return json.loads(body)
+        return orjson.loads(body)
+
+    @classmethod
+    def parse_problem_data(
+        cls, data: Any, food_catalog: FoodCatalog | None = None
+    ) -> tuple[list[FoodInformation], Objective, list[Constraint]]:
+        if not isinstance(data, dict):
+            raise RequestValidationError(["request must be an object."])
+
+        errors: list[str] = []
+        food_information = cls._parse_food_information(
+            data.get("foodInformation"), food_catalog, errors
+        )
+        objective = cls._parse_item(
+            data.get("objective"), Objective, "objective", errors
+        )
+        constraints = cls._parse_items(
+            data.get("constraints"), Constraint, "constraints", errors
+        )
+
+        if errors:
+            raise RequestValidationError(errors)
+        return (food_information, objective, constraints)
+
+    @classmethod
+    def parse_pareto_problem_data(
+        cls, data: Any, food_catalog: FoodCatalog | None = None
+    ) -> tuple[list[FoodInformation], list[Objective], list[Constraint], int]:
+        if not isinstance(data, dict):
+            raise RequestValidationError(["request must be an object."])
+
+        errors: list[str] = []
+        food_information = cls._parse_food_information(
+            data.get("foodInformation"), food_catalog, errors
+        )
+        objectives = cls._parse_items(
+            data.get("objectives"), Objective, "objectives", errors
+        )
+        constraints = cls._parse_items(
+            data.get("constraints"), Constraint, "constraints", errors
+        )
+        point_count = cls._parse_integer(
+            data.get("pointCount"), "pointCount", errors
+        )
+
+        if errors:
+            raise RequestValidationError(errors)
+        return (food_information, objectives, constraints, point_count)
+
+    @classmethod
+    def parse_meal_plan_data(
+        cls, data: Any, food_catalog: FoodCatalog | None = None
+    ) -> tuple[
+        list[FoodInformation],
+        Objective,
+        list[Constraint],
+        list[Constraint],
+        int,
+        int | None,
+    ]:
+        if not isinstance(data, dict):
+            raise RequestValidationError(["request must be an object."])
+
+        errors: list[str] = []
+        food_information = cls._parse_food_information(
+            data.get("foodInformation"), food_catalog, errors
+        )
+        objective = cls._parse_item(
+            data.get("objective"), Objective, "objective", errors
+        )
+        daily_constraints = cls._parse_items(
+            data.get("constraints", []), Constraint, "constraints", errors
+        )
+        plan_constraints = cls._parse_items(
+            data.get("planConstraints", []),
+            Constraint,
+            "planConstraints",
+            errors,
+        )
+        day_count = cls._parse_integer(
+            data.get("dayCount"), "dayCount", errors
+        )
+        max_days_per_food = data.get("maxDaysPerFood")
+        if max_days_per_food is not None:
+            cls._parse_integer(max_days_per_food, "maxDaysPerFood", errors)
+
+        if errors:
+            raise RequestValidationError(errors)
+        return (
+            food_information,
+            objective,
+            daily_constraints,
+            plan_constraints,
+            day_count,
+            max_days_per_food,
+        )
+
+    @classmethod
+    def parse_alternatives_problem_data(
+        cls, data: Any, food_catalog: FoodCatalog | None = None
+    ) -> tuple[list[FoodInformation], Objective, list[Constraint], int, float]:
+        food_information, objective, constraints = cls.parse_problem_data(
+            data, food_catalog
+        )
+
+        errors: list[str] = []
+        alternative_count = cls._parse_integer(
+            data.get("alternativeCount"), "alternativeCount", errors
+        )
+        min_difference = data.get("minDifference", 1)
+        if not isinstance(min_difference, (int, float)) or isinstance(
+            min_difference, bool
+        ):
+            errors.append("minDifference must be a number.")
+
+        if errors:
+            raise RequestValidationError(errors)
+        return (
+            food_information,
+            objective,
+            constraints,
+            alternative_count,
+            min_difference,
+        )
+
+    @staticmethod
+    def _parse_integer(data: Any, path: str, errors: list[str]) -> Any:
+        if not isinstance(data, int) or isinstance(data, bool):
+            errors.append(f"{path} must be an integer.")
+        return data
+
+    @classmethod
+    def _parse_food_information(
+        cls,
+        data: Any,
+        food_catalog: FoodCatalog | None,
+        errors: list[str],
+    ) -> list[FoodInformation]:
+        if (
+            food_catalog is not None
+            and isinstance(data, list)
+            and data
+            and all(
+                isinstance(item, dict) and "foodId" in item for item in data
+            )
+        ):
+            try:
+                return food_catalog.resolve(data)
+            except (KeyError, TypeError, ValueError) as e:
+                errors.append(f"foodInformation: {str(e)}")
+                return []
+
+        return cls._parse_items(
+            data, FoodInformation, "foodInformation", errors
+        )
+
+    @classmethod
+    def _parse_items(
+        cls, data: Any, item_cls: Type, path: str, errors: list[str]
+    ) -> list:
+        if not isinstance(data, list):
+            errors.append(f"{path} must be a list.")
+            return []
+
+        items = []
+        for index, item_data in enumerate(data):
+            item = cls._parse_item(
+                item_data, item_cls, f"{path}[{index}]", errors
+            )
+            if item is not None:
+                items.append(item)
+        return items
+
+    @classmethod
+    def _parse_item(
+        cls, data: Any, item_cls: Type, path: str, errors: list[str]
+    ) -> Any:
+        if not isinstance(data, dict):
+            errors.append(f"{path} must be an object.")
+            return None
+
+        field_map = cls.FIELD_MAPS[item_cls]
+        try:
+            return item_cls(
+                **{field_map[key]: value for key, value in data.items()}
+            )
+        except KeyError as e:
+            errors.append(f"{path}: unknown field {str(e)}.")
+        except (TypeError, ValueError, AttributeError) as e:
+            errors.append(f"{path}: {str(e)}")
+        return None
@@ -0,0 +1,129 @@
+import gzip
+import json
+import os
+from functools import lru_cache
+from typing import Any
+
+from flask import Request, Response
+
+from src.utilities import Utilities
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+_DEFAULT_COMPRESSION_MIN_SIZE = 1024
+_DEFAULT_GZIP_LEVEL = 6
+_BROTLI_QUALITY = 5
+_KEY_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=_KEY_CACHE_SIZE)
+def _convert_key(key: str) -> str:
+    return Utilities._snake_to_camel(key)
+
+
+class ResponseEncoder:
+    CONTENT_TYPE = "application/json"
+    VERBATIM_KEYS = frozenset(["food_intakes"])
+
+    def __init__(
+        self,
+        compression_min_size: int = _DEFAULT_COMPRESSION_MIN_SIZE,
+        gzip_level: int = _DEFAULT_GZIP_LEVEL,
+    ) -> None:
+        if compression_min_size < 0:
+            raise ValueError(
+                "Response compression minimum size must be non-negative."
+                f" Got {compression_min_size}."
+            )
+        if not 1 <= gzip_level <= 9:
+            raise ValueError(
+                f"Invalid gzip level: {gzip_level}. It must be 1 to 9."
+            )
+
+        self._compression_min_size = compression_min_size
+        self._gzip_level = gzip_level
+
+    @classmethod
+    def from_environment(cls) -> "ResponseEncoder":
+        compression_min_size = int(
+            os.getenv(
+                "RESPONSE_COMPRESSION_MIN_SIZE", _DEFAULT_COMPRESSION_MIN_SIZE
+            )
+        )
+        gzip_level = int(os.getenv("RESPONSE_GZIP_LEVEL", _DEFAULT_GZIP_LEVEL))
+        return cls(compression_min_size, gzip_level)
+
+    @staticmethod
+    def convert_keys_to_camel_case(value: Any) -> Any:
+        if isinstance(value, dict):
+            return {
+                _convert_key(key): (
+                    item
+                    if key in ResponseEncoder.VERBATIM_KEYS
+                    else ResponseEncoder.convert_keys_to_camel_case(item)
+                )
+                for key, item in value.items()
+            }
+        if isinstance(value, list):
+            return [
+                ResponseEncoder.convert_keys_to_camel_case(item)
+                for item in value
+            ]
+        return value
+
+    @staticmethod
+    def encode_json(payload: Any) -> bytes:
+        if orjson is None:  # pragma: no cover
+            return json.dumps(payload, separators=(",", ":")).encode()
+        return orjson.dumps(payload)
+
+    def _compress(self, body: bytes, request: Request) -> tuple[bytes, str]:
+        if len(body) < self._compression_min_size:
+            return body, ""
+
+        accepted_encodings = request.accept_encodings
+        if brotli is not None and "br" in accepted_encodings:
+            return brotli.compress(body, quality=_BROTLI_QUALITY), "br"
+        if "gzip" in accepted_encodings:
+            return gzip.compress(body, self._gzip_level, mtime=0), "gzip"
+        return body, ""
+
+    @staticmethod
+    def is_not_modified(request: Request, etag: str) -> bool:
+        return request.if_none_match.contains_weak(etag)
+
+    @staticmethod
+    def create_not_modified_response(etag: str) -> Response:
+        response = Response(status=304)
+        response.set_etag(etag, weak=True)
+        return response
+
+    def create_response(
+        self,
+        request: Request,
+        payload: Any,
+        etag: str | None = None,
+        status: int = 200,
+    ) -> Response:
+        body, content_encoding = self._compress(
+            self.encode_json(self.convert_keys_to_camel_case(payload)),
+            request,
+        )
+
+        response = Response(
+            body, status=status, content_type=self.CONTENT_TYPE
+        )
+        response.vary.add("Accept-Encoding")
+        if content_encoding:
+            response.content_encoding = content_encoding
+        if etag is not None:
+            response.set_etag(etag, weak=True)
+        return response
@@ -0,0 +1,45 @@
+import copy
+import threading
+from concurrent.futures import Future
+from typing import Callable
+
+
+class SingleFlight:
+    def __init__(self) -> None:
+        self._in_flight: dict[str, Future[dict]] = {}
+        self._lock = threading.Lock()
+        self._leaders = 0
+        self._coalesced = 0
+
+    def _join_or_lead(self, key: str) -> tuple[Future[dict], bool]:
+        with self._lock:
+            future = self._in_flight.get(key)
+            if future is not None:
+                self._coalesced += 1
+                return future, False
+
+            future = Future()
+            self._in_flight[key] = future
+            self._leaders += 1
+            return future, True
+
+    def do(self, key: str, solve: Callable[[], dict]) -> dict:
+        future, is_leader = self._join_or_lead(key)
+        if not is_leader:
+            return copy.deepcopy(future.result())
+
+        try:
+            result = solve()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"leader": self._leaders, "coalesced": self._coalesced}
@@ -1,16 +1,66 @@
+import atexit
 import logging
+import multiprocessing.util
 import os
-from logging import Formatter, Logger, StreamHandler
-from logging.handlers import RotatingFileHandler
+import queue
+from logging import Formatter, Handler, Logger, LogRecord, StreamHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
-_DEFAULT_LOG_LEVEL = logging.DEBUG
+_DEFAULT_LOG_LEVEL = logging.INFO
 _DEFAULT_LOG_PATH = "log/app.log"
 _DEFAULT_LOG_SIZE = 1024 * 1024 * 10
 _DEFAULT_LOG_BACKUP = 3
+_DEFAULT_LOG_QUEUE = "false"
+_DEFAULT_LOG_QUEUE_SIZE = 10000
+_DEFAULT_LOG_QUEUE_DROP_POLICY = "newest"
+
+
+class DroppingQueueHandler(QueueHandler):
+    DROP_POLICIES = ["newest", "oldest"]
+
+    def __init__(
+        self, record_queue: "queue.Queue[LogRecord]", drop_policy: str
+    ) -> None:
+        if drop_policy not in self.DROP_POLICIES:
+            raise ValueError(
+                f"Invalid log queue drop policy: {drop_policy}."
+                f" Valid policies are {DroppingQueueHandler.DROP_POLICIES}."
+            )
+
+        super().__init__(record_queue)
+        self._record_queue = record_queue
+        self._drop_policy = drop_policy
+        self.dropped_records = 0
+
+    def _drop_oldest_record(self) -> None:
+        try:
+            self._record_queue.get_nowait()
+        except queue.Empty:  # pragma: no cover
+            pass
+
+    def enqueue(self, record: LogRecord) -> None:
+        try:
+            self._record_queue.put_nowait(record)
+            return
+        except queue.Full:
+            self.dropped_records += 1
+
+        if self._drop_policy == "oldest":
+            self._drop_oldest_record()
+            try:
+                self._record_queue.put_nowait(record)
+            except queue.Full:  # pragma: no cover
+                pass
+
+
+class BlockingStopQueueListener(QueueListener):
+    def enqueue_sentinel(self) -> None:
+        self.queue.put(self._sentinel)  # type: ignore[attr-defined]
 
 
 class SingletonLogger:
     _logger: Logger | None = None
+    _queue_listener: BlockingStopQueueListener | None = None
 
     @classmethod
     def get_logger(cls) -> Logger:
@@ -37,8 +87,16 @@ class SingletonLogger:
             formatter = Formatter(
                 "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
             )
-            cls._add_stream_handler(log_level, formatter)
-            cls._add_rotating_file_handler(log_level, formatter)
+            handlers: list[Handler] = [
+                cls._create_stream_handler(log_level, formatter),
+                cls._create_rotating_file_handler(log_level, formatter),
+            ]
+
+            if cls._is_queue_enabled():
+                cls._add_queue_handler(handlers)
+            else:
+                for handler in handlers:
+                    cls._logger.addHandler(handler)
 
     @classmethod
     def _get_log_level(cls) -> str | int:
@@ -46,25 +104,23 @@ class SingletonLogger:
         return log_level
 
     @classmethod
-    def _add_stream_handler(
-        cls, log_level: str | int, formatter: Formatter
-    ) -> None:
-        if cls._logger is None:  # pragma: no cover
-            raise RuntimeError("Logger has not been initialized.")
+    def _is_queue_enabled(cls) -> bool:
+        return os.getenv("LOG_QUEUE", _DEFAULT_LOG_QUEUE).lower() == "true"
 
+    @classmethod
+    def _create_stream_handler(
+        cls, log_level: str | int, formatter: Formatter
+    ) -> StreamHandler:
         stream_handler = StreamHandler()
         stream_handler.setLevel(log_level)
         stream_handler.setFormatter(formatter)
 
-        cls._logger.addHandler(stream_handler)
+        return stream_handler
 
     @classmethod
-    def _add_rotating_file_handler(
+    def _create_rotating_file_handler(
         cls, log_level: str | int, formatter: Formatter
-    ) -> None:
-        if cls._logger is None:  # pragma: no cover
-            raise RuntimeError("Logger has not been initialized.")
-
+    ) -> RotatingFileHandler:
         log_path = os.getenv("LOG_PATH", _DEFAULT_LOG_PATH)
         log_size = int(os.getenv("LOG_SIZE", _DEFAULT_LOG_SIZE))
         log_backup = int(os.getenv("LOG_BACKUP", _DEFAULT_LOG_BACKUP))
@@ -75,4 +131,74 @@ class SingletonLogger:
         rotating_file_handler.setLevel(log_level)
         rotating_file_handler.setFormatter(formatter)
 
-        cls._logger.addHandler(rotating_file_handler)
+        return rotating_file_handler
+
+    @classmethod
+    def _add_queue_handler(cls, handlers: list[Handler]) -> None:
+        if cls._logger is None:  # pragma: no cover
+            raise RuntimeError("Logger has not been initialized.")
+
+        queue_size = int(os.getenv("LOG_QUEUE_SIZE", _DEFAULT_LOG_QUEUE_SIZE))
+        drop_policy = os.getenv(
+            "LOG_QUEUE_DROP_POLICY", _DEFAULT_LOG_QUEUE_DROP_POLICY
+        )
+
+        record_queue: "queue.Queue[LogRecord]" = queue.Queue(queue_size)
+        cls._logger.addHandler(DroppingQueueHandler(record_queue, drop_policy))
+
+        cls._queue_listener = BlockingStopQueueListener(
+            record_queue, *handlers, respect_handler_level=True
+        )
+        cls._queue_listener.start()
+        atexit.register(cls.shutdown)
+
+    @classmethod
+    def _reinitialize_after_fork(cls) -> None:
+        if cls._logger is None or cls._queue_listener is None:
+            return
+
+        # The listener thread does not survive a fork, so the child needs
+        # its own queue and listener or its records are never written.
+        for handler in cls._logger.handlers[:]:
+            if isinstance(handler, DroppingQueueHandler):
+                cls._logger.removeHandler(handler)
+        for handler in cls._queue_listener.handlers:
+            handler.close()
+
+        cls._queue_listener = None
+        cls._logger = None
+        cls._initialize()
+
+    @classmethod
+    def get_dropped_record_count(cls) -> int:
+        if cls._logger is None:
+            return 0
+
+        return sum(
+            handler.dropped_records
+            for handler in cls._logger.handlers
+            if isinstance(handler, DroppingQueueHandler)
+        )
+
+    @classmethod
+    def shutdown(cls) -> None:
+        if cls._queue_listener is None:
+            return
+
+        cls._queue_listener.stop()
+        for handler in cls._queue_listener.handlers:
+            handler.flush()
+        cls._queue_listener = None
+
+
+def _shutdown_at_process_exit(logger_class: type[SingletonLogger]) -> None:
+    # Processes started by multiprocessing skip atexit when they exit.
+    multiprocessing.util.Finalize(
+        logger_class, logger_class.shutdown, exitpriority=0
+    )
+
+
+os.register_at_fork(after_in_child=SingletonLogger._reinitialize_after_fork)
+multiprocessing.util.register_after_fork(
+    SingletonLogger, _shutdown_at_process_exit
+)
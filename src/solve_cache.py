@@ -0,0 +1,375 @@
+import hashlib
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import asdict
+from typing import Callable
+from urllib.parse import urlparse
+
+from src.constraint import Constraint
+from src.food_information import FoodInformation
+from src.objective import Objective
+from src.singleton_logger import SingletonLogger
+from src.solver_settings import SolverSettings
+
+_DEFAULT_CACHE_BACKEND = "memory"
+_DEFAULT_CACHE_SIZE = 1024
+_DEFAULT_CACHE_TTL = 3600
+_DEFAULT_CACHE_PATH = "cache/solve_cache.sqlite3"
+_DEFAULT_CACHE_URL = "redis://localhost:6379/0"
+
+
+class CacheBackend(ABC):
+    def __init__(self, max_size: int, ttl: float) -> None:
+        self._max_size = max_size
+        self._ttl = ttl
+
+    @abstractmethod
+    def get(self, key: str) -> str | None:
+        pass  # pragma: no cover
+
+    @abstractmethod
+    def set(self, key: str, value: str) -> None:
+        pass  # pragma: no cover
+
+    @abstractmethod
+    def clear(self) -> None:
+        pass  # pragma: no cover
+
+
+class InMemoryCacheBackend(CacheBackend):
+    def __init__(self, max_size: int, ttl: float) -> None:
+        super().__init__(max_size, ttl)
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: str) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self._ttl, value)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class SQLiteCacheBackend(CacheBackend):
+    def __init__(self, path: str, max_size: int, ttl: float) -> None:
+        super().__init__(max_size, ttl)
+
+        cache_dir = os.path.dirname(path)
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            path, check_same_thread=False, isolation_level=None
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS solve_cache ("
+            " key TEXT PRIMARY KEY,"
+            " value TEXT NOT NULL,"
+            " expires_at REAL NOT NULL,"
+            " accessed_at REAL NOT NULL)"
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS solve_cache_accessed_at"
+            " ON solve_cache (accessed_at)"
+        )
+
+    def get(self, key: str) -> str | None:
+        now = time.time()
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value, expires_at FROM solve_cache WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+
+            value, expires_at = row
+            if expires_at <= now:
+                self._connection.execute(
+                    "DELETE FROM solve_cache WHERE key = ?", (key,)
+                )
+                return None
+
+            self._connection.execute(
+                "UPDATE solve_cache SET accessed_at = ? WHERE key = ?",
+                (now, key),
+            )
+            return value
+
+    def set(self, key: str, value: str) -> None:
+        now = time.time()
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO solve_cache"
+                " (key, value, expires_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, value, now + self._ttl, now),
+            )
+            self._connection.execute(
+                "DELETE FROM solve_cache WHERE key IN ("
+                " SELECT key FROM solve_cache"
+                " ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (self._max_size,),
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._connection.execute("DELETE FROM solve_cache")
+
+
+class RedisCacheBackend(CacheBackend):
+    _KEY_PREFIX = "nutrition_optimizer:solve:"
+    _INDEX_KEY = "nutrition_optimizer:solve_index"
+    _SOCKET_TIMEOUT = 1.0
+
+    def __init__(self, url: str, max_size: int, ttl: float) -> None:
+        super().__init__(max_size, ttl)
+
+        parsed_url = urlparse(url)
+        self._host = parsed_url.hostname or "localhost"
+        self._port = parsed_url.port or 6379
+        self._database = parsed_url.path.lstrip("/") or "0"
+
+        self._lock = threading.Lock()
+        self._socket: socket.socket | None = None
+
+    def _connect(self) -> socket.socket:
+        if self._socket is None:
+            self._socket = socket.create_connection(
+                (self._host, self._port), timeout=self._SOCKET_TIMEOUT
+            )
+            self._reader = self._socket.makefile("rb")
+            self._send("SELECT", self._database)
+        return self._socket
+
+    def _disconnect(self) -> None:
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+
+    def _send(self, *args: str | int | float) -> object:
+        if self._socket is None:  # pragma: no cover
+            raise RuntimeError("Redis connection has not been opened.")
+
+        command = f"*{len(args)}\r\n".encode()
+        for arg in args:
+            encoded_arg = str(arg).encode()
+            command += b"$%d\r\n%s\r\n" % (len(encoded_arg), encoded_arg)
+        self._socket.sendall(command)
+
+        return self._read_reply()
+
+    def _read_reply(self) -> object:
+        line = self._reader.readline()
+        if not line:
+            raise RuntimeError("Redis connection closed unexpectedly.")
+
+        prefix, payload = line[:1], line[1:-2].decode()
+        if prefix == b"-":
+            raise RuntimeError(f"Redis error: {payload}")
+        if prefix == b":":
+            return int(payload)
+        if prefix == b"$":
+            length = int(payload)
+            if length < 0:
+                return None
+            return self._reader.read(length + 2)[:-2].decode()
+        if prefix == b"*":
+            return [self._read_reply() for _ in range(int(payload))]
+        return payload
+
+    def _execute(self, *args: str | int | float) -> object:
+        with self._lock:
+            try:
+                self._connect()
+                return self._send(*args)
+            except (OSError, RuntimeError):
+                self._disconnect()
+                raise
+
+    def get(self, key: str) -> str | None:
+        redis_key = self._KEY_PREFIX + key
+        value = self._execute("GET", redis_key)
+        if value is None:
+            self._execute("ZREM", self._INDEX_KEY, redis_key)
+            return None
+
+        self._execute("ZADD", self._INDEX_KEY, time.time(), redis_key)
+        return str(value)
+
+    def set(self, key: str, value: str) -> None:
+        redis_key = self._KEY_PREFIX + key
+        ttl_milliseconds = max(int(self._ttl * 1000), 1)
+        self._execute("SET", redis_key, value, "PX", ttl_milliseconds)
+        self._execute("ZADD", self._INDEX_KEY, time.time(), redis_key)
+
+        index_size = self._execute("ZCARD", self._INDEX_KEY)
+        if isinstance(index_size, int) and index_size > self._max_size:
+            evicted = self._execute(
+                "ZPOPMIN", self._INDEX_KEY, index_size - self._max_size
+            )
+            if isinstance(evicted, list):
+                evicted_keys = evicted[::2]
+                self._execute("DEL", *evicted_keys)
+
+    def clear(self) -> None:
+        keys = self._execute("ZRANGE", self._INDEX_KEY, 0, -1)
+        if isinstance(keys, list) and keys:
+            self._execute("DEL", *keys)
+        self._execute("DEL", self._INDEX_KEY)
+
+
+class SolveCache:
+    CACHEABLE_STATUSES = ["Optimal", "Infeasible"]
+    BACKENDS = ["memory", "sqlite", "redis"]
+
+    def __init__(self, backend: CacheBackend) -> None:
+        self._backend = backend
+        self._logger = SingletonLogger.get_logger()
+
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @classmethod
+    def from_environment(cls) -> "SolveCache | None":
+        backend_name = os.getenv("SOLVE_CACHE_BACKEND", _DEFAULT_CACHE_BACKEND)
+        if backend_name == "none":
+            return None
+
+        if backend_name not in cls.BACKENDS:
+            raise ValueError(
+                f"Invalid solve cache backend: {backend_name}."
+                f" Valid backends are {cls.BACKENDS + ['none']}."
+            )
+
+        max_size = int(os.getenv("SOLVE_CACHE_SIZE", _DEFAULT_CACHE_SIZE))
+        ttl = float(os.getenv("SOLVE_CACHE_TTL", _DEFAULT_CACHE_TTL))
+
+        backend: CacheBackend
+        if backend_name == "sqlite":
+            path = os.getenv("SOLVE_CACHE_PATH", _DEFAULT_CACHE_PATH)
+            backend = SQLiteCacheBackend(path, max_size, ttl)
+        elif backend_name == "redis":
+            url = os.getenv("SOLVE_CACHE_URL", _DEFAULT_CACHE_URL)
+            backend = RedisCacheBackend(url, max_size, ttl)
+        else:
+            backend = InMemoryCacheBackend(max_size, ttl)
+
+        return cls(backend)
+
+    @staticmethod
+    def _normalize(value: object) -> object:
+        if isinstance(value, dict):
+            return {
+                key: SolveCache._normalize(item) for key, item in value.items()
+            }
+        if isinstance(value, list):
+            return [SolveCache._normalize(item) for item in value]
+        if isinstance(value, int) and not isinstance(value, bool):
+            return float(value)
+        return value
+
+    @staticmethod
+    def compute_key(
+        food_information: list[FoodInformation],
+        objective: Objective,
+        constraints: list[Constraint],
+        solver_settings: SolverSettings | None = None,
+    ) -> str:
+        problem = SolveCache._normalize(
+            {
+                "food_information": [
+                    asdict(food) for food in food_information
+                ],
+                "objective": asdict(objective),
+                "constraints": [
+                    asdict(constraint) for constraint in constraints
+                ],
+                "solver_settings": asdict(solver_settings or SolverSettings()),
+            }
+        )
+        canonical_problem = json.dumps(
+            problem, sort_keys=True, separators=(",", ":")
+        )
+        return hashlib.sha256(canonical_problem.encode()).hexdigest()
+
+    def get(self, key: str) -> dict | None:
+        try:
+            value = self._backend.get(key)
+        except (OSError, RuntimeError, sqlite3.Error) as e:
+            self._logger.warning(f"Failed to read from solve cache: {e}")
+            value = None
+
+        with self._lock:
+            if value is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+
+        return json.loads(value)
+
+    def set(self, key: str, result: dict) -> None:
+        if result.get("status") not in self.CACHEABLE_STATUSES:
+            return
+
+        try:
+            self._backend.set(key, json.dumps(result))
+        except (OSError, RuntimeError, sqlite3.Error) as e:
+            self._logger.warning(f"Failed to write to solve cache: {e}")
+
+    def get_or_solve(
+        self,
+        food_information: list[FoodInformation],
+        objective: Objective,
+        constraints: list[Constraint],
+        solve: Callable[[], dict],
+        solver_settings: SolverSettings | None = None,
+        key: str | None = None,
+    ) -> dict:
+        if key is None:
+            key = self.compute_key(
+                food_information, objective, constraints, solver_settings
+            )
+
+        cached_result = self.get(key)
+        if cached_result is not None:
+            self._logger.info("Returning cached optimization result.")
+            return cached_result
+
+        result = solve()
+        self.set(key, result)
+        return result
+
+    def clear(self) -> None:
+        self._backend.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"hits": self._hits, "misses": self._misses}
@@ -0,0 +1,988 @@
+import os
+import re
+import tempfile
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, replace
+from typing import Callable
+
+import highspy
+import numpy as np
+from pulp import (
+    LpAffineExpression,
+    LpInteger,
+    LpMaximize,
+    LpMinimize,
+    LpProblem,
+    LpSolutionIntegerFeasible,
+    LpStatus,
+    LpVariable,
+    value,
+)
+
+from src.model_builder import LinearModel, NoGoodCut
+from src.presolver import Presolver
+from src.solver_settings import SolverSettings
+
+
+@dataclass(frozen=True)
+class SolverResult:
+    status: str
+    food_intakes: dict[str, float]
+    gap: float
+
+
+class SolverBackend(ABC):
+    _FEASIBILITY_TOLERANCE = 1e-6
+
+    @abstractmethod
+    def solve(
+        self,
+        linear_model: LinearModel,
+        solver_settings: SolverSettings,
+        initial_values: np.ndarray | None = None,
+    ) -> SolverResult:
+        pass  # pragma: no cover
+
+    def _create_row_bound_solver(
+        self,
+        linear_model: LinearModel,
+        solver_settings: SolverSettings,
+        row_index: int,
+    ) -> Callable[[float, float, np.ndarray | None], SolverResult]:
+        def solve_with_row_bounds(
+            row_lower: float,
+            row_upper: float,
+            initial_values: np.ndarray | None,
+        ) -> SolverResult:
+            constraint_lower = linear_model.constraint_lower.copy()
+            constraint_upper = linear_model.constraint_upper.copy()
+            constraint_lower[row_index] = row_lower
+            constraint_upper[row_index] = row_upper
+
+            return self.solve(
+                replace(
+                    linear_model,
+                    constraint_lower=constraint_lower,
+                    constraint_upper=constraint_upper,
+                ),
+                solver_settings,
+                initial_values,
+            )
+
+        return solve_with_row_bounds
+
+    @classmethod
+    def _is_still_optimal(
+        cls,
+        linear_model: LinearModel,
+        row_index: int,
+        previous_result: SolverResult,
+        previous_row_bounds: tuple[float, float],
+        row_bounds: tuple[float, float],
+    ) -> bool:
+        if previous_result.status != "Optimal":
+            return False
+
+        (previous_lower, previous_upper), (row_lower, row_upper) = (
+            previous_row_bounds,
+            row_bounds,
+        )
+        if row_lower < previous_lower or row_upper > previous_upper:
+            return False
+
+        row_value = linear_model.constraint_matrix[row_index] @ cls.to_vector(
+            linear_model, previous_result
+        )
+        return bool(
+            row_lower - cls._FEASIBILITY_TOLERANCE
+            <= row_value
+            <= row_upper + cls._FEASIBILITY_TOLERANCE
+        )
+
+    def solve_row_bound_sequence(
+        self,
+        linear_model: LinearModel,
+        solver_settings: SolverSettings,
+        row_index: int,
+        row_bounds: list[tuple[float, float]],
+        initial_values: np.ndarray | None = None,
+    ) -> list[SolverResult]:
+        solve_with_row_bounds = self._create_row_bound_solver(
+            linear_model, solver_settings, row_index
+        )
+
+        solver_results: list[SolverResult] = []
+        previous_result: SolverResult | None = None
+        previous_row_bounds = (-np.inf, np.inf)
+        for row_lower, row_upper in row_bounds:
+            if previous_result is None or not self._is_still_optimal(
+                linear_model,
+                row_index,
+                previous_result,
+                previous_row_bounds,
+                (row_lower, row_upper),
+            ):
+                previous_result = solve_with_row_bounds(
+                    row_lower, row_upper, initial_values
+                )
+            solver_results.append(previous_result)
+            previous_row_bounds = (row_lower, row_upper)
+
+        return solver_results
+
+    @staticmethod
+    def _add_no_good_cut(
+        linear_model: LinearModel, no_good_cut: NoGoodCut
+    ) -> LinearModel:
+        column_count = len(linear_model.food_names)
+        new_column_count = len(no_good_cut.column_lower)
+        return replace(
+            linear_model,
+            food_names=[
+                *linear_model.food_names,
+                *[
+                    f"no_good_{column_count + index}"
+                    for index in range(new_column_count)
+                ],
+            ],
+            objective_coefficients=np.append(
+                linear_model.objective_coefficients,
+                np.zeros(new_column_count),
+            ),
+            constraint_names=[
+                *linear_model.constraint_names,
+                *[
+                    f"no_good_row_{len(linear_model.constraint_names) + index}"
+                    for index in range(len(no_good_cut.row_lower))
+                ],
+            ],
+            constraint_matrix=np.vstack(
+                [
+                    np.pad(
+                        linear_model.constraint_matrix,
+                        ((0, 0), (0, new_column_count)),
+                    ),
+                    no_good_cut.row_matrix,
+                ]
+            ),
+            constraint_lower=np.append(
+                linear_model.constraint_lower, no_good_cut.row_lower
+            ),
+            constraint_upper=np.append(
+                linear_model.constraint_upper, no_good_cut.row_upper
+            ),
+            intake_lower=np.append(
+                linear_model.intake_lower, no_good_cut.column_lower
+            ),
+            intake_upper=np.append(
+                linear_model.intake_upper, no_good_cut.column_upper
+            ),
+        )
+
+    def solve_alternatives(
+        self,
+        linear_model: LinearModel,
+        solver_settings: SolverSettings,
+        count: int,
+        min_difference: float,
+    ) -> list[SolverResult]:
+        cut_model = linear_model
+        solver_results: list[SolverResult] = []
+        while len(solver_results) < count:
+            solver_result = self.solve(cut_model, solver_settings)
+            if solver_result.status not in ["Optimal", "Feasible"]:
+                solver_results.append(solver_result)
+                break
+
+            solver_results.append(
+                replace(
+                    solver_result,
+                    food_intakes={
+                        food_name: solver_result.food_intakes[food_name]
+                        for food_name in linear_model.food_names
+                    },
+                )
+            )
+            cut_model = self._add_no_good_cut(
+                cut_model,
+                NoGoodCut.create(
+                    linear_model,
+                    self.to_vector(linear_model, solver_results[-1]),
+                    min_difference,
+                    len(cut_model.food_names),
+                ),
+            )
+
+        return solver_results
+
+    @staticmethod
+    def to_vector(
+        linear_model: LinearModel, solver_result: SolverResult
+    ) -> np.ndarray:
+        return np.array(
+            [
+                solver_result.food_intakes[food_name]
+                for food_name in linear_model.food_names
+            ]
+        )
+
+
+class CbcSolverBackend(SolverBackend):
+    _CBC_BOUND_PATTERN = re.compile(
+        r"^(?:Upper|Lower) bound:\s+(\S+)", re.MULTILINE
+    )
+    _GAP_EPSILON = 1e-10
+
+    @classmethod
+    def run_cbc(
+        cls,
+        problem: LpProblem,
+        solver_settings: SolverSettings,
+        warm_start: bool = False,
+    ) -> float | None:
+        if solver_settings.is_exact:
+            problem.solve(solver_settings.create_solver(warm_start=warm_start))
+            return None
+
+        with tempfile.TemporaryDirectory() as log_dir:
+            log_path = os.path.join(log_dir, "cbc.log")
+            problem.solve(solver_settings.create_solver(log_path, warm_start))
+
+            with open(log_path, encoding="utf-8") as log_file:
+                bound_match = cls._CBC_BOUND_PATTERN.search(log_file.read())
+
+        return float(bound_match.group(1)) if bound_match else None
+
+    @staticmethod
+    def get_status(problem: LpProblem) -> str:
+        status = LpStatus[problem.status]
+        if (
+            status == "Optimal"
+            and problem.sol_status == LpSolutionIntegerFeasible
+        ):
+            return "Feasible"
+        return status
+
+    @classmethod
+    def calculate_gap(
+        cls, problem: LpProblem, best_bound: float | None
+    ) -> float:
+        if best_bound is None:
+            return 0.0
+
+        objective_value = value(problem.objective)
+        gap = abs(best_bound - objective_value) / max(
+            abs(objective_value), cls._GAP_EPSILON
+        )
+        return round(gap, 4)
+
+    @staticmethod
+    def _create_problem(
+        linear_model: LinearModel,
+    ) -> tuple[LpProblem, list[LpVariable]]:
+        problem = LpProblem(
+            "linear_model",
+            LpMaximize if linear_model.maximize else LpMinimize,
+        )
+        variables = [
+            LpVariable(f"x_{index}", lower, upper, LpInteger)
+            for index, (lower, upper) in enumerate(
+                zip(
+                    linear_model.intake_lower.tolist(),
+                    linear_model.intake_upper.tolist(),
+                )
+            )
+        ]
+        problem.setObjective(
+            LpAffineExpression(
+                zip(variables, linear_model.objective_coefficients.tolist())
+            )
+        )
+
+        for name, row, lower, upper in zip(
+            linear_model.constraint_names,
+            linear_model.constraint_matrix.tolist(),
+            linear_model.constraint_lower.tolist(),
+            linear_model.constraint_upper.tolist(),
+        ):
+            row_expression = LpAffineExpression(zip(variables, row))
+            if np.isfinite(lower):
+                problem += row_expression >= lower, f"{name}_lower"
+            if np.isfinite(upper):
+                problem += row_expression <= upper, f"{name}_upper"
+
+        return problem, variables
+
+    def solve(
+        self,
+        linear_model: LinearModel,
+        solver_settings: SolverSettings,
+        initial_values: np.ndarray | None = None,
+    ) -> SolverResult:
+        problem, variables = self._create_problem(linear_model)
+        if initial_values is not None:
+            for variable, initial_value in zip(
+                variables, initial_values.tolist()
+            ):
+                variable.setInitialValue(initial_value)
+
+        best_bound = self.run_cbc(
+            problem, solver_settings, initial_values is not None
+        )
+
+        status = self.get_status(problem)
+        if status not in ["Optimal", "Feasible"]:
+            return SolverResult(status=status, food_intakes={}, gap=0.0)
+
+        values = (
+            np.round([variable.varValue or 0.0 for variable in variables])
+            + 0.0
+        )
+        return SolverResult(
+            status=status,
+            food_intakes=dict(zip(linear_model.food_names, values.tolist())),
+            gap=self.calculate_gap(problem, best_bound),
+        )
+
+
+class HighsSolverBackend(SolverBackend):
+    _STOPPED_MODEL_STATUSES = [
+        highspy.HighsModelStatus.kTimeLimit,
+        highspy.HighsModelStatus.kIterationLimit,
+        highspy.HighsModelStatus.kSolutionLimit,
+        highspy.HighsModelStatus.kInterrupt,
+    ]
+    _MODEL_STATUSES = {
+        highspy.HighsModelStatus.kOptimal: "Optimal",
+        highspy.HighsModelStatus.kModelEmpty: "Optimal",
+        highspy.HighsModelStatus.kInfeasible: "Infeasible",
+        highspy.HighsModelStatus.kUnboundedOrInfeasible: "Infeasible",
+        highspy.HighsModelStatus.kUnbounded: "Unbounded",
+    }
+
+    @staticmethod
+    def create_lp(
+        linear_model: LinearModel, integer: bool = True
+    ) -> highspy.HighsLp:
+        column_count = len(linear_model.food_names)
+        constraint_matrix = linear_model.constraint_matrix
+
+        lp = highspy.HighsLp()
+        lp.num_col_ = column_count
+        lp.num_row_ = constraint_matrix.shape[0]
+        lp.sense_ = (
+            highspy.ObjSense.kMaximize
+            if linear_model.maximize
+            else highspy.ObjSense.kMinimize
+        )
+        lp.col_cost_ = linear_model.objective_coefficients
+        lp.col_lower_ = linear_model.intake_lower
+        lp.col_upper_ = linear_model.intake_upper
+        lp.row_lower_ = linear_model.constraint_lower
+        lp.row_upper_ = linear_model.constraint_upper
+        if integer:
+            lp.integrality_ = [highspy.HighsVarType.kInteger] * column_count
+
+        column_indices, row_indices = np.nonzero(constraint_matrix.T)
+        lp.a_matrix_.format_ = highspy.MatrixFormat.kColwise
+        lp.a_matrix_.start_ = np.concatenate(
+            (
+                [0],
+                np.cumsum(np.bincount(column_indices, minlength=column_count)),
+            )
+        )
+        lp.a_matrix_.index_ = row_indices
+        lp.a_matrix_.value_ = constraint_matrix[row_indices, column_indices]
+
+        return lp
+
+    @staticmethod
+    def create_highs(solver_settings: SolverSettings) -> highspy.Highs:
+        highs = highspy.Highs()
+        highs.setOptionValue("output_flag", False)
+        highs.setOptionValue(
+            "mip_rel_gap", solver_settings.relative_gap or 0.0
+        )
+        highs.setOptionValue(
+            "mip_abs_gap", solver_settings.absolute_gap or 0.0
+        )
+        if solver_settings.time_limit is not None:
+            highs.setOptionValue(
+                "time_limit", float(solver_settings.time_limit)
+            )
+        if solver_settings.threads is not None:
+            highs.setOptionValue("threads", solver_settings.threads)
+        return highs
+
+    def _get_status(self, highs: highspy.Highs) -> str:
+        model_status = highs.getModelStatus()
+        if model_status in self._STOPPED_MODEL_STATUSES:
+            has_solution = (
+                highs.getInfo().primal_solution_status
+                == highspy.SolutionStatus.kSolutionStatusFeasible
+            )
+            return "Feasible" if has_solution else "Not Solved"
+
+        return self._MODEL_STATUSES.get(model_status, "Undefined")
+
+    def solve_relaxation(self, linear_model: LinearModel) -> float | None:
+        highs = self.create_highs(SolverSettings())
+        highs.passModel(self.create_lp(linear_model, integer=False))
+        highs.run()
+
+        if highs.getModelStatus() != highspy.HighsModelStatus.kOptimal:
+            return None
+        return highs.getInfo().objective_function_value
+
+    @staticmethod
+    def _set_initial_values(
+        highs: highspy.Highs, initial_values: np.ndarray | None
+    ) -> None:
+        if initial_values is not None:
+            solution = highspy.HighsSolution()
+            solution.col_value = initial_values.tolist()
+            highs.setSolution(solution)
+
+    def _read_result(
+        self, highs: highspy.Highs, linear_model: LinearModel
+    ) -> SolverResult:
+        status = self._get_status(highs)
+        if status not in ["Optimal", "Feasible"]:
+            return SolverResult(status=status, food_intakes={}, gap=0.0)
+
+        values = np.round(np.asarray(highs.getSolution().col_value)) + 0.0
+        # HiGHS reports an infinite gap when it has no dual bound yet, so
+        # nothing is known about how far the solution is from optimal.
+        gap = highs.getInfo().mip_gap
+        if not np.isfinite(gap):
+            gap = 1.0
+
+        return SolverResult(
+            status=status,
+            food_intakes=dict(zip(linear_model.food_names, values.tolist())),
+            gap=round(gap, 4),
+        )
+
+    def solve(
+        self,
+        linear_model: LinearModel,
+        solver_settings: SolverSettings,
+        initial_values: np.ndarray | None = None,
+    ) -> SolverResult:
+        highs = self.create_highs(solver_settings)
+        highs.passModel(self.create_lp(linear_model))
+        self._set_initial_values(highs, initial_values)
+        highs.run()
+
+        return self._read_result(highs, linear_model)
+
+    def _create_row_bound_solver(
+        self,
+        linear_model: LinearModel,
+        solver_settings: SolverSettings,
+        row_index: int,
+    ) -> Callable[[float, float, np.ndarray | None], SolverResult]:
+        highs = self.create_highs(solver_settings)
+        highs.passModel(self.create_lp(linear_model))
+
+        def solve_with_row_bounds(
+            row_lower: float,
+            row_upper: float,
+            initial_values: np.ndarray | None,
+        ) -> SolverResult:
+            highs.changeRowBounds(row_index, row_lower, row_upper)
+            self._set_initial_values(highs, initial_values)
+            highs.run()
+
+            return self._read_result(highs, linear_model)
+
+        return solve_with_row_bounds
+
+    @staticmethod
+    def _add_no_good_cut_to_highs(
+        highs: highspy.Highs, no_good_cut: NoGoodCut
+    ) -> None:
+        column_count = highs.getNumCol()
+        new_column_count = len(no_good_cut.column_lower)
+        highs.addVars(
+            new_column_count,
+            no_good_cut.column_lower,
+            no_good_cut.column_upper,
+        )
+        highs.changeColsIntegrality(
+            new_column_count,
+            np.arange(column_count, column_count + new_column_count),
+            np.full(
+                new_column_count,
+                highspy.HighsVarType.kInteger.value,
+                dtype=np.uint8,
+            ),
+        )
+
+        row_indices, column_indices = np.nonzero(no_good_cut.row_matrix)
+        highs.addRows(
+            len(no_good_cut.row_lower),
+            no_good_cut.row_lower,
+            no_good_cut.row_upper,
+            len(row_indices),
+            np.concatenate(
+                (
+                    [0],
+                    np.cumsum(
+                        np.bincount(
+                            row_indices, minlength=len(no_good_cut.row_lower)
+                        )
+                    )[:-1],
+                )
+            ),
+            column_indices,
+            no_good_cut.row_matrix[row_indices, column_indices],
+        )
+
+    @staticmethod
+    def _find_initial_values(
+        linear_model: LinearModel,
+        no_good_cuts: list[NoGoodCut],
+        candidates: list[np.ndarray],
+    ) -> np.ndarray | None:
+        feasible_candidates = [
+            candidate
+            for candidate in candidates
+            if all(
+                no_good_cut.is_satisfied(candidate)
+                for no_good_cut in no_good_cuts
+            )
+        ]
+        if not feasible_candidates:
+            return None
+
+        sign = 1.0 if linear_model.maximize else -1.0
+        best_candidate = max(
+            feasible_candidates,
+            key=lambda candidate: sign
+            * float(linear_model.objective_coefficients @ candidate),
+        )
+        return np.concatenate(
+            [
+                best_candidate,
+                *[
+                    no_good_cut.auxiliary_values(best_candidate)
+                    for no_good_cut in no_good_cuts
+                ],
+            ]
+        )
+
+    def solve_alternatives(
+        self,
+        linear_model: LinearModel,
+        solver_settings: SolverSettings,
+        count: int,
+        min_difference: float,
+    ) -> list[SolverResult]:
+        highs = self.create_highs(solver_settings)
+        highs.setOptionValue("mip_improving_solution_save", True)
+        highs.passModel(self.create_lp(linear_model))
+
+        food_count = len(linear_model.food_names)
+        no_good_cuts: list[NoGoodCut] = []
+        candidates: list[np.ndarray] = []
+        solver_results: list[SolverResult] = []
+        while True:
+            highs.run()
+            solver_results.append(self._read_result(highs, linear_model))
+            if (
+                solver_results[-1].status not in ["Optimal", "Feasible"]
+                or len(solver_results) == count
+            ):
+                return solver_results
+
+            candidates.extend(
+                np.round(np.asarray(solution.col_value)[:food_count])
+                for solution in highs.getSavedMipSolutions()
+            )
+            no_good_cuts.append(
+                NoGoodCut.create(
+                    linear_model,
+                    self.to_vector(linear_model, solver_results[-1]),
+                    min_difference,
+                    highs.getNumCol(),
+                )
+            )
+            self._add_no_good_cut_to_highs(highs, no_good_cuts[-1])
+            self._set_initial_values(
+                highs,
+                self._find_initial_values(
+                    linear_model, no_good_cuts, candidates
+                ),
+            )
+
+
+class RoundingSolverBackend(SolverBackend):
+    MAX_REPAIR_STEPS = 1000
+    _GAP_EPSILON = 1e-10
+
+    @staticmethod
+    def _solve_relaxation(
+        linear_model: LinearModel,
+    ) -> tuple[str, np.ndarray]:
+        highs = HighsSolverBackend.create_highs(SolverSettings())
+        highs.passModel(HighsSolverBackend.create_lp(linear_model, False))
+        highs.run()
+
+        model_status = highs.getModelStatus()
+        status = HighsSolverBackend._MODEL_STATUSES.get(
+            model_status, "Not Solved"
+        )
+        if status != "Optimal":
+            return status, np.empty(0)
+        return status, np.asarray(highs.getSolution().col_value)
+
+    @staticmethod
+    def _calculate_violations(
+        linear_model: LinearModel, row_values: np.ndarray
+    ) -> np.ndarray:
+        lower = linear_model.constraint_lower[:, np.newaxis]
+        upper = linear_model.constraint_upper[:, np.newaxis]
+        scale = np.maximum(
+            1.0,
+            np.where(
+                np.isfinite(upper), np.abs(upper), np.abs(np.nan_to_num(lower))
+            ),
+        )
+        violations = (
+            np.maximum(lower - row_values, 0.0)
+            + np.maximum(row_values - upper, 0.0)
+        ) / scale
+        return np.where(
+            violations > SolverBackend._FEASIBILITY_TOLERANCE, violations, 0.0
+        ).sum(axis=0)
+
+    def _evaluate_moves(
+        self, linear_model: LinearModel, values: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        row_values = (linear_model.constraint_matrix @ values)[:, np.newaxis]
+        steps = np.concatenate((np.ones(len(values)), -np.ones(len(values))))
+        columns = np.concatenate(
+            (np.arange(len(values)), np.arange(len(values)))
+        )
+        moved_values = values[columns] + steps
+        is_valid = (moved_values >= linear_model.intake_lower[columns]) & (
+            moved_values <= linear_model.intake_upper[columns]
+        )
+
+        violations = np.where(
+            is_valid,
+            self._calculate_violations(
+                linear_model,
+                row_values
+                + linear_model.constraint_matrix[:, columns] * steps,
+            ),
+            np.inf,
+        )
+        sign = 1.0 if linear_model.maximize else -1.0
+        gains = sign * linear_model.objective_coefficients[columns] * steps
+        return violations, gains, steps
+
+    def _apply_best_move(
+        self,
+        linear_model: LinearModel,
+        values: np.ndarray,
+        repair: bool,
+    ) -> bool:
+        violations, gains, steps = self._evaluate_moves(linear_model, values)
+        if repair:
+            current_violation = self._calculate_violations(
+                linear_model,
+                (linear_model.constraint_matrix @ values)[:, np.newaxis],
+            )[0]
+            is_candidate = violations < current_violation
+            order = np.lexsort((-gains, violations))
+        else:
+            is_candidate = (violations == 0.0) & (gains > 0.0)
+            order = np.argsort(-gains, kind="stable")
+
+        candidates = order[is_candidate[order]]
+        if len(candidates) == 0:
+            return False
+
+        move = int(candidates[0])
+        values[move % len(values)] += steps[move]
+        return True
+
+    def _round(
+        self, linear_model: LinearModel, relaxed_values: np.ndarray
+    ) -> np.ndarray | None:
+        values = np.clip(
+            np.round(relaxed_values),
+            linear_model.intake_lower,
+            linear_model.intake_upper,
+        )
+
+        for _ in range(self.MAX_REPAIR_STEPS):
+            violation = self._calculate_violations(
+                linear_model,
+                (linear_model.constraint_matrix @ values)[:, np.newaxis],
+            )[0]
+            if violation == 0.0:
+                break
+            if not self._apply_best_move(linear_model, values, repair=True):
+                return None
+        else:
+            return None
+
+        for _ in range(self.MAX_REPAIR_STEPS):
+            if not self._apply_best_move(linear_model, values, repair=False):
+                break
+        return values
+
+    def _calculate_bound_gap(
+        self, relaxation_bound: float, objective_value: float
+    ) -> float:
+        gap = abs(relaxation_bound - objective_value) / max(
+            abs(objective_value), self._GAP_EPSILON
+        )
+        return round(gap, 4)
+
+    def solve(
+        self,
+        linear_model: LinearModel,
+        solver_settings: SolverSettings,
+        initial_values: np.ndarray | None = None,
+    ) -> SolverResult:
+        status, relaxed_values = self._solve_relaxation(linear_model)
+        if status != "Optimal":
+            return SolverResult(status=status, food_intakes={}, gap=0.0)
+
+        values = self._round(linear_model, relaxed_values)
+        if values is None:
+            return SolverResult(status="Not Solved", food_intakes={}, gap=0.0)
+
+        relaxation_bound = float(
+            linear_model.objective_coefficients @ relaxed_values
+        )
+        objective_value = float(linear_model.objective_coefficients @ values)
+        is_optimal = (
+            abs(relaxation_bound - objective_value)
+            <= self._FEASIBILITY_TOLERANCE
+        )
+        return SolverResult(
+            status="Optimal" if is_optimal else "Feasible",
+            food_intakes=dict(
+                zip(linear_model.food_names, (values + 0.0).tolist())
+            ),
+            gap=self._calculate_bound_gap(relaxation_bound, objective_value),
+        )
+
+
+class _EnumerationSearch:
+    def __init__(self, linear_model: LinearModel, block_size: int) -> None:
+        self._linear_model = linear_model
+        self._sign = 1.0 if linear_model.maximize else -1.0
+        self._scores = self._sign * linear_model.objective_coefficients
+        self._tolerances = SolverBackend._FEASIBILITY_TOLERANCE * np.maximum(
+            1.0,
+            np.abs(
+                np.nan_to_num(
+                    np.concatenate(
+                        (
+                            linear_model.constraint_lower,
+                            linear_model.constraint_upper,
+                        )
+                    ),
+                    posinf=0.0,
+                    neginf=0.0,
+                )
+            ),
+        ).reshape(2, -1)
+
+        self._tail_indices, self._head_indices = self._split_foods(block_size)
+        self._head_ranges = [
+            self._create_range(index) for index in self._head_indices
+        ]
+        self._tail_values = self._enumerate_tail()
+        self._tail_activity = (
+            self._tail_values
+            @ linear_model.constraint_matrix[:, self._tail_indices].T
+        )
+        self._tail_scores = (
+            self._tail_values @ self._scores[self._tail_indices]
+        )
+        self._suffix_lower, self._suffix_upper, self._suffix_scores = (
+            self._calculate_suffix_bounds()
+        )
+
+        self._best_score = -np.inf
+        self._best_values: np.ndarray | None = None
+
+    def _create_range(self, index: int) -> np.ndarray:
+        food_range = np.arange(
+            self._linear_model.intake_lower[index],
+            self._linear_model.intake_upper[index] + 1.0,
+        )
+        return food_range[::-1] if self._scores[index] >= 0 else food_range
+
+    def _split_foods(self, block_size: int) -> tuple[list[int], list[int]]:
+        range_sizes = (
+            self._linear_model.intake_upper
+            - self._linear_model.intake_lower
+            + 1.0
+        )
+        order = np.argsort(-range_sizes, kind="stable").tolist()
+
+        tail_indices = order[:1]
+        tail_size = float(range_sizes[order[0]]) if order else 1.0
+        for index in order[1:]:
+            if tail_size * range_sizes[index] > block_size:
+                break
+            tail_indices.append(index)
+            tail_size *= range_sizes[index]
+        return tail_indices, order[len(tail_indices) :]
+
+    def _enumerate_tail(self) -> np.ndarray:
+        ranges = [self._create_range(index) for index in self._tail_indices]
+        if not ranges:
+            return np.zeros((1, 0))
+        return np.stack(np.meshgrid(*ranges, indexing="ij"), axis=-1).reshape(
+            -1, len(ranges)
+        )
+
+    def _calculate_suffix_bounds(
+        self,
+    ) -> tuple[list[np.ndarray], list[np.ndarray], list[float]]:
+        row_count = len(self._linear_model.constraint_names)
+        if len(self._tail_values) == 0:
+            return [], [], []
+
+        suffix_lower = [self._tail_activity.min(axis=0, initial=np.inf)]
+        suffix_upper = [self._tail_activity.max(axis=0, initial=-np.inf)]
+        suffix_scores = [float(self._tail_scores.max())]
+        for index in reversed(self._head_indices):
+            activity_lower, activity_upper = (
+                Presolver.calculate_activity_bounds(
+                    self._linear_model.constraint_matrix[:, [index]],
+                    self._linear_model.intake_lower[[index]],
+                    self._linear_model.intake_upper[[index]],
+                )
+            )
+            suffix_lower.append(suffix_lower[-1] + activity_lower)
+            suffix_upper.append(suffix_upper[-1] + activity_upper)
+            suffix_scores.append(
+                suffix_scores[-1]
+                + max(
+                    self._scores[index]
+                    * self._linear_model.intake_lower[index],
+                    self._scores[index]
+                    * self._linear_model.intake_upper[index],
+                )
+            )
+
+        return (
+            [bounds.reshape(row_count) for bounds in suffix_lower[::-1]],
+            [bounds.reshape(row_count) for bounds in suffix_upper[::-1]],
+            suffix_scores[::-1],
+        )
+
+    def _can_improve(
+        self, depth: int, activity: np.ndarray, score: float
+    ) -> bool:
+        if score + self._suffix_scores[depth] <= self._best_score:
+            return False
+        return bool(
+            np.all(
+                activity + self._suffix_lower[depth]
+                <= self._linear_model.constraint_upper + self._tolerances[1]
+            )
+            and np.all(
+                activity + self._suffix_upper[depth]
+                >= self._linear_model.constraint_lower - self._tolerances[0]
+            )
+        )
+
+    def _evaluate_tail(
+        self, head_values: list[float], activity: np.ndarray, score: float
+    ) -> None:
+        row_values = activity + self._tail_activity
+        is_feasible = np.all(
+            (
+                row_values
+                >= self._linear_model.constraint_lower - self._tolerances[0]
+            )
+            & (
+                row_values
+                <= self._linear_model.constraint_upper + self._tolerances[1]
+            ),
+            axis=1,
+        )
+        if not np.any(is_feasible):
+            return
+
+        scores = np.where(is_feasible, score + self._tail_scores, -np.inf)
+        best_index = int(np.argmax(scores))
+        if scores[best_index] <= self._best_score:
+            return
+
+        values = np.empty(len(self._linear_model.food_names))
+        values[self._head_indices] = head_values
+        values[self._tail_indices] = self._tail_values[best_index]
+        self._best_score = float(scores[best_index])
+        self._best_values = values
+
+    def _search(
+        self, depth: int, head_values: list[float], activity: np.ndarray
+    ) -> None:
+        score = float(
+            self._scores[self._head_indices[:depth]] @ np.array(head_values)
+        )
+        if not self._can_improve(depth, activity, score):
+            return
+        if depth == len(self._head_indices):
+            self._evaluate_tail(head_values, activity, score)
+            return
+
+        column = self._linear_model.constraint_matrix[
+            :, self._head_indices[depth]
+        ]
+        for intake in self._head_ranges[depth].tolist():
+            self._search(
+                depth + 1, head_values + [intake], activity + column * intake
+            )
+
+    def run(self) -> np.ndarray | None:
+        if len(self._tail_values) > 0:
+            self._search(
+                0, [], np.zeros(len(self._linear_model.constraint_names))
+            )
+        return self._best_values
+
+
+class EnumerationSolverBackend(SolverBackend):
+    MAX_COMBINATION_COUNT = 1_000_000
+    BLOCK_SIZE = 4096
+
+    @classmethod
+    def supports(cls, linear_model: LinearModel) -> bool:
+        combination_count = np.prod(
+            linear_model.intake_upper - linear_model.intake_lower + 1.0
+        )
+        return bool(combination_count <= cls.MAX_COMBINATION_COUNT)
+
+    def solve(
+        self,
+        linear_model: LinearModel,
+        solver_settings: SolverSettings,
+        initial_values: np.ndarray | None = None,
+    ) -> SolverResult:
+        if not self.supports(linear_model):
+            return SolverResult(status="Not Solved", food_intakes={}, gap=0.0)
+
+        values = _EnumerationSearch(linear_model, self.BLOCK_SIZE).run()
+        if values is None:
+            return SolverResult(status="Infeasible", food_intakes={}, gap=0.0)
+
+        return SolverResult(
+            status="Optimal",
+            food_intakes=dict(
+                zip(linear_model.food_names, (values + 0.0).tolist())
+            ),
+            gap=0.0,
+        )
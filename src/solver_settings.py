@@ -0,0 +1,116 @@
+import os
+from dataclasses import dataclass, replace
+
+from pulp import LpSolver, getSolver
+
+_DEFAULT_SOLVER = "cbc"
+_DEFAULT_MODE = "exact"
+
+
+@dataclass(frozen=True)
+class SolverSettings:
+    solver: str = _DEFAULT_SOLVER
+    time_limit: float | None = None
+    relative_gap: float | None = None
+    absolute_gap: float | None = None
+    threads: int | None = None
+    mode: str = _DEFAULT_MODE
+
+    SOLVERS = ["cbc", "highs"]
+    MODES = ["exact", "approximate"]
+    PULP_SOLVER_NAMES = {"cbc": "PULP_CBC_CMD"}
+
+    def __post_init__(self) -> None:
+        self._validate_solver()
+        self._validate_time_limit_is_positive()
+        self._validate_gaps_are_non_negative()
+        self._validate_threads_is_positive()
+        self._validate_mode()
+
+    def _validate_solver(self) -> None:
+        if self.solver not in self.SOLVERS:
+            raise ValueError(
+                f"Invalid solver: {self.solver}."
+                f" Valid solvers are {SolverSettings.SOLVERS}."
+            )
+
+    def _validate_time_limit_is_positive(self) -> None:
+        if self.time_limit is not None and self.time_limit <= 0:
+            raise ValueError(
+                f"Time limit must be greater than zero. Got {self.time_limit}."
+            )
+
+    def _validate_gaps_are_non_negative(self) -> None:
+        if any(
+            gap is not None and gap < 0
+            for gap in [self.relative_gap, self.absolute_gap]
+        ):
+            raise ValueError(
+                "Both relative_gap and absolute_gap must be non-negative."
+            )
+
+    def _validate_threads_is_positive(self) -> None:
+        if self.threads is not None and self.threads <= 0:
+            raise ValueError(
+                f"Threads must be greater than zero. Got {self.threads}."
+            )
+
+    def _validate_mode(self) -> None:
+        if self.mode not in self.MODES:
+            raise ValueError(
+                f"Invalid mode: {self.mode}."
+                f" Valid modes are {SolverSettings.MODES}."
+            )
+
+    @staticmethod
+    def _get_optional_float(name: str) -> float | None:
+        value = os.getenv(name)
+        return float(value) if value else None
+
+    @staticmethod
+    def _get_optional_int(name: str) -> int | None:
+        value = os.getenv(name)
+        return int(value) if value else None
+
+    @classmethod
+    def from_environment(cls) -> "SolverSettings":
+        return cls(
+            solver=os.getenv("SOLVER", _DEFAULT_SOLVER),
+            time_limit=cls._get_optional_float("SOLVER_TIME_LIMIT"),
+            relative_gap=cls._get_optional_float("SOLVER_RELATIVE_GAP"),
+            absolute_gap=cls._get_optional_float("SOLVER_ABSOLUTE_GAP"),
+            threads=cls._get_optional_int("SOLVER_THREADS"),
+            mode=os.getenv("SOLVER_MODE", _DEFAULT_MODE),
+        )
+
+    def merge(self, overrides: dict) -> "SolverSettings":
+        return replace(self, **overrides)
+
+    @property
+    def is_default(self) -> bool:
+        # Threads only tune CBC's speed, not which solution it returns.
+        return replace(self, threads=None) == SolverSettings()
+
+    @property
+    def is_exact(self) -> bool:
+        return (
+            self.mode == "exact"
+            and self.time_limit is None
+            and not (self.relative_gap or self.absolute_gap)
+        )
+
+    def create_solver(
+        self, log_path: str | None = None, warm_start: bool = False
+    ) -> LpSolver:
+        options: dict = {
+            "msg": False,
+            "timeLimit": self.time_limit,
+            "gapRel": self.relative_gap,
+            "gapAbs": self.absolute_gap,
+            "threads": self.threads,
+            "warmStart": warm_start,
+        }
+        if log_path is not None:
+            options["logPath"] = log_path
+
+        return getSolver(self.PULP_SOLVER_NAMES[self.solver], **options)
@@ -1,11 +1,12 @@
 import re
-from typing import Type
+from typing import Any
 
 from flask import Request
 
-from src.constraint import Constraint
-from src.food_information import FoodInformation
-from src.objective import Objective
+from src.food_catalog import FoodCatalog
+from src.request_parser import RequestParser
+from src.solver_settings import SolverSettings
+from src.warm_start import WarmStart
 
 
 class Utilities:
@@ -31,48 +32,136 @@ class Utilities:
         )
 
     @staticmethod
-    def _convert_to_generic(data: list, cls: Type) -> list:
-        return [
-            cls(
-                **{
+    def parse_problem_data(
+        data: Any, food_catalog: FoodCatalog | None = None
+    ) -> tuple:
+        return RequestParser.parse_problem_data(data, food_catalog)
+
+    @staticmethod
+    def parse_pareto_problem_data(
+        data: Any, food_catalog: FoodCatalog | None = None
+    ) -> tuple:
+        return RequestParser.parse_pareto_problem_data(data, food_catalog)
+
+    @staticmethod
+    def parse_meal_plan_data(
+        data: Any, food_catalog: FoodCatalog | None = None
+    ) -> tuple:
+        return RequestParser.parse_meal_plan_data(data, food_catalog)
+
+    @staticmethod
+    def parse_alternatives_problem_data(
+        data: Any, food_catalog: FoodCatalog | None = None
+    ) -> tuple:
+        return RequestParser.parse_alternatives_problem_data(
+            data, food_catalog
+        )
+
+    @staticmethod
+    def load_request_json(request: Request) -> Any:
+        if request is None or not request.is_json:
+            raise ValueError("Error processing request data: InvalidRequest")
+
+        try:
+            return RequestParser.decode_json(request.get_data(cache=True))
+        except ValueError as e:
+            raise ValueError(f"Error processing request data: {str(e)}")
+
+    @staticmethod
+    def parse_solver_settings(
+        data: Any, default_solver_settings: SolverSettings
+    ) -> SolverSettings:
+        try:
+            solver_settings_request = data.get("solverSettings") or {}
+            return default_solver_settings.merge(
+                {
                     Utilities._camel_to_snake(key): value
-                    for key, value in item.items()
+                    for key, value in solver_settings_request.items()
                 }
             )
-            for item in data
-        ]
+        except Exception as e:
+            raise ValueError(f"Error processing solver settings: {str(e)}")
 
     @staticmethod
-    def _convert_to_objective(data: dict) -> Objective:
-        return Objective(
-            **{
-                Utilities._camel_to_snake(key): value
-                for key, value in data.items()
-            }
-        )
+    def parse_session_id(data: Any) -> str | None:
+        session_id = data.get("sessionId")
+        if session_id is not None and not isinstance(session_id, str):
+            raise ValueError(
+                "Error processing request data: sessionId must be a string."
+            )
+        return session_id
 
     @staticmethod
-    def parse_request_data(request: Request) -> tuple:
+    def parse_diagnose(data: Any) -> bool:
+        diagnose = data.get("diagnose", False)
+        if not isinstance(diagnose, bool):
+            raise ValueError(
+                "Error processing request data: diagnose must be a boolean."
+            )
+        return diagnose
+
+    @staticmethod
+    def parse_warm_start(data: Any) -> WarmStart | None:
+        try:
+            previous_food_intakes = data.get("previousFoodIntakes")
+            if previous_food_intakes is None:
+                return None
+
+            return WarmStart(
+                {
+                    food_name: float(intake)
+                    for food_name, intake in previous_food_intakes.items()
+                }
+            )
+        except Exception as e:
+            raise ValueError(
+                f"Error processing previous food intakes: {str(e)}"
+            )
+
+    @staticmethod
+    def parse_request_data(
+        request: Request, food_catalog: FoodCatalog | None = None
+    ) -> tuple:
         try:
             if request is None or request.json is None:
                 raise ValueError(
                     "Error processing request data: InvalidRequest"
                 )
 
-            food_information_request = request.json.get("foodInformation")
-            food_information = Utilities._convert_to_generic(
-                food_information_request, FoodInformation
+            return Utilities.parse_problem_data(request.json, food_catalog)
+        except Exception as e:
+            raise ValueError(f"Error processing request data: {str(e)}")
+
+    @staticmethod
+    def parse_batch_request_data(request: Request) -> list:
+        if request is None or request.json is None:
+            raise ValueError("Error processing request data: InvalidRequest")
+
+        problems = request.json.get("problems")
+        if not isinstance(problems, list):
+            raise ValueError(
+                "Error processing request data: problems must be a list."
             )
 
-            objective_request = request.json.get("objective")
-            objective = Utilities._convert_to_objective(objective_request)
+        return problems
 
-            constraints_request = request.json.get("constraints")
-            constraints = Utilities._convert_to_generic(
-                constraints_request, Constraint
-            )
+    @staticmethod
+    def parse_food_catalog_request_data(request: Request) -> list[dict]:
+        try:
+            if request is None or request.json is None:
+                raise ValueError("InvalidRequest")
+
+            foods = request.json.get("foods")
+            if not isinstance(foods, list):
+                raise ValueError("foods must be a list.")
 
-            return (food_information, objective, constraints)
+            return [
+                {
+                    Utilities._camel_to_snake(key): value
+                    for key, value in food.items()
+                }
+                for food in foods
+            ]
         except Exception as e:
             raise ValueError(f"Error processing request data: {str(e)}")
 
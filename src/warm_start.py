@@ -0,0 +1,227 @@
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from src.constraint import Constraint
+from src.food_information import FoodInformation
+from src.model_builder import LinearModel, ModelBuilder
+from src.objective import Objective
+from src.solver_backend import HighsSolverBackend
+
+_DEFAULT_WARM_START_SESSIONS = 256
+
+
+class WarmStart:
+    _FEASIBILITY_TOLERANCE = 1e-6
+    _OPTIMALITY_TOLERANCE = 1e-6
+
+    def __init__(
+        self,
+        previous_food_intakes: dict[str, float],
+        previous_linear_model: LinearModel | None = None,
+    ) -> None:
+        self._validate_intakes_are_non_negative(previous_food_intakes)
+
+        self._previous_food_intakes = previous_food_intakes
+        self._previous_linear_model = previous_linear_model
+
+    def _validate_intakes_are_non_negative(
+        self, previous_food_intakes: dict[str, float]
+    ) -> None:
+        if any(intake < 0 for intake in previous_food_intakes.values()):
+            raise ValueError("Previous food intakes must be non-negative.")
+
+    def initial_values(self, linear_model: LinearModel) -> np.ndarray:
+        previous_values = np.array(
+            [
+                self._previous_food_intakes.get(food_name, np.nan)
+                for food_name in linear_model.food_names
+            ],
+            dtype=float,
+        )
+        previous_values = np.where(
+            np.isnan(previous_values),
+            linear_model.intake_lower,
+            np.round(previous_values),
+        )
+        return np.clip(
+            previous_values,
+            linear_model.intake_lower,
+            linear_model.intake_upper,
+        )
+
+    def _get_previous_values(
+        self, linear_model: LinearModel
+    ) -> np.ndarray | None:
+        if any(
+            food_name not in self._previous_food_intakes
+            for food_name in linear_model.food_names
+        ):
+            return None
+
+        previous_values = np.array(
+            [
+                self._previous_food_intakes[food_name]
+                for food_name in linear_model.food_names
+            ],
+            dtype=float,
+        )
+        if not np.array_equal(previous_values, np.round(previous_values)):
+            return None
+        return previous_values
+
+    def _is_feasible(
+        self, linear_model: LinearModel, values: np.ndarray
+    ) -> bool:
+        tolerance = self._FEASIBILITY_TOLERANCE
+        row_values = linear_model.constraint_matrix @ values
+        return bool(
+            np.all(values >= linear_model.intake_lower - tolerance)
+            and np.all(values <= linear_model.intake_upper + tolerance)
+            and np.all(row_values >= linear_model.constraint_lower - tolerance)
+            and np.all(row_values <= linear_model.constraint_upper + tolerance)
+        )
+
+    @staticmethod
+    def _is_row_implied(
+        previous_linear_model: LinearModel,
+        previous_row_index: int,
+        linear_model: LinearModel,
+    ) -> bool:
+        previous_row = previous_linear_model.constraint_matrix[
+            previous_row_index
+        ]
+        return any(
+            np.array_equal(row, previous_row)
+            and lower
+            >= previous_linear_model.constraint_lower[previous_row_index]
+            and upper
+            <= previous_linear_model.constraint_upper[previous_row_index]
+            for row, lower, upper in zip(
+                linear_model.constraint_matrix,
+                linear_model.constraint_lower,
+                linear_model.constraint_upper,
+            )
+        )
+
+    def _is_restriction_of_previous_model(
+        self, linear_model: LinearModel
+    ) -> bool:
+        previous_linear_model = self._previous_linear_model
+        if previous_linear_model is None or (
+            previous_linear_model.food_names != linear_model.food_names
+            or previous_linear_model.maximize != linear_model.maximize
+        ):
+            return False
+
+        return bool(
+            np.array_equal(
+                previous_linear_model.objective_coefficients,
+                linear_model.objective_coefficients,
+            )
+            and np.all(
+                linear_model.intake_lower >= previous_linear_model.intake_lower
+            )
+            and np.all(
+                linear_model.intake_upper <= previous_linear_model.intake_upper
+            )
+            and all(
+                self._is_row_implied(
+                    previous_linear_model, previous_row_index, linear_model
+                )
+                for previous_row_index in range(
+                    len(previous_linear_model.constraint_names)
+                )
+            )
+        )
+
+    def _reaches_relaxation_bound(
+        self, linear_model: LinearModel, values: np.ndarray
+    ) -> bool:
+        relaxation_bound = HighsSolverBackend().solve_relaxation(linear_model)
+        if relaxation_bound is None:
+            return False
+
+        objective_value = float(linear_model.objective_coefficients @ values)
+        return abs(relaxation_bound - objective_value) <= (
+            self._OPTIMALITY_TOLERANCE * max(1.0, abs(objective_value))
+        )
+
+    def find_proven_optimum(
+        self, linear_model: LinearModel
+    ) -> dict[str, float] | None:
+        previous_values = self._get_previous_values(linear_model)
+        if previous_values is None or not self._is_feasible(
+            linear_model, previous_values
+        ):
+            return None
+
+        if not (
+            self._is_restriction_of_previous_model(linear_model)
+            or self._reaches_relaxation_bound(linear_model, previous_values)
+        ):
+            return None
+
+        return dict(
+            zip(linear_model.food_names, (previous_values + 0.0).tolist())
+        )
+
+
+class WarmStartSessionStore:
+    def __init__(self, max_sessions: int) -> None:
+        self._max_sessions = max_sessions
+
+        self._sessions: OrderedDict[
+            str,
+            tuple[
+                list[FoodInformation],
+                Objective,
+                list[Constraint],
+                dict[str, float],
+            ],
+        ] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_environment(cls) -> "WarmStartSessionStore | None":
+        max_sessions = int(
+            os.getenv("WARM_START_SESSIONS", _DEFAULT_WARM_START_SESSIONS)
+        )
+        if max_sessions <= 0:
+            return None
+        return cls(max_sessions)
+
+    def save(
+        self,
+        session_id: str,
+        food_information: list[FoodInformation],
+        objective: Objective,
+        constraints: list[Constraint],
+        food_intakes: dict[str, float],
+    ) -> None:
+        with self._lock:
+            self._sessions[session_id] = (
+                food_information,
+                objective,
+                constraints,
+                food_intakes,
+            )
+            self._sessions.move_to_end(session_id)
+
+            while len(self._sessions) > self._max_sessions:
+                self._sessions.popitem(last=False)
+
+    def get(self, session_id: str) -> WarmStart | None:
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if session is None:
+                return None
+            self._sessions.move_to_end(session_id)
+
+        food_information, objective, constraints, food_intakes = session
+        previous_linear_model = ModelBuilder(
+            food_information
+        ).build_linear_model(objective, constraints)
+        return WarmStart(food_intakes, previous_linear_model)
@@ -0,0 +1,96 @@
+import os
+import threading
+import time
+
+from src.constraint import Constraint
+from src.food_information import FoodInformation
+from src.model_builder import ModelBuilder
+from src.objective import Objective
+from src.singleton_logger import SingletonLogger
+from src.solver_backend import (
+    CbcSolverBackend,
+    EnumerationSolverBackend,
+    HighsSolverBackend,
+    SolverBackend,
+)
+from src.solver_settings import SolverSettings
+
+_DEFAULT_WARM_UP = "false"
+
+
+class WarmUp:
+    _FOOD_INFORMATION = [
+        FoodInformation(
+            name="warm_up",
+            energy=100,
+            protein=10,
+            fat=1,
+            carbohydrates=10,
+            grams_per_unit=100,
+            minimum_intake=0,
+            maximum_intake=2,
+        )
+    ]
+    _OBJECTIVE = Objective(sense="maximize", nutrient="protein")
+    _CONSTRAINTS = [
+        Constraint(min_max="max", nutrient="energy", unit="energy", value=150)
+    ]
+    SOLVER_BACKENDS: list[type[SolverBackend]] = [
+        CbcSolverBackend,
+        HighsSolverBackend,
+        EnumerationSolverBackend,
+    ]
+
+    def __init__(self, enabled: bool) -> None:
+        self._enabled = enabled
+        self._completed = threading.Event()
+        self._started = False
+        self._lock = threading.Lock()
+        self._duration: float | None = None
+        self._logger = SingletonLogger.get_logger()
+
+        if not enabled:
+            self._completed.set()
+
+    @property
+    def is_complete(self) -> bool:
+        return self._completed.is_set()
+
+    @property
+    def duration(self) -> float | None:
+        return self._duration
+
+    def run(self) -> None:
+        self._logger.info("Starting solver warm-up.")
+        start = time.perf_counter()
+
+        try:
+            linear_model = ModelBuilder(
+                self._FOOD_INFORMATION
+            ).build_linear_model(self._OBJECTIVE, self._CONSTRAINTS)
+            for solver_backend in self.SOLVER_BACKENDS:
+                solver_backend().solve(linear_model, SolverSettings())
+        except Exception as e:
+            self._logger.warning(f"Solver warm-up failed: {str(e)}")
+        finally:
+            self._duration = time.perf_counter() - start
+            self._completed.set()
+
+        self._logger.info(
+            f"Completed solver warm-up in {self._duration:.3f}s."
+        )
+
+    def start(self) -> None:
+        with self._lock:
+            if not self._enabled or self._started:
+                return
+            self._started = True
+
+        threading.Thread(target=self.run, name="warm_up", daemon=True).start()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        return self._completed.wait(timeout)
+
+    @classmethod
+    def from_environment(cls) -> "WarmUp":
+        return cls(os.getenv("WARM_UP", _DEFAULT_WARM_UP).lower() == "true")
@@ -174,6 +174,7 @@ function drawFoodintakes(foodintakes) {
         ],
     });
 }
+let warmStart = {};
 function clearCharts() {
     const foodIntakesChart = getElementByIdOrThrow("food-intakes-chart");
     const pfcRatioChart = getElementByIdOrThrow("pfc-ratio-chart");
@@ -182,6 +183,10 @@ function clearCharts() {
 }
 function handleOptimizationResult(result) {
     if (result.status === "Optimal") {
+        warmStart = {
+            sessionId: result.sessionId,
+            previousFoodIntakes: result.foodIntakes,
+        };
         drawPFCRatioWithTotalEnergy(result.pfcRatio, result.totalNutrientValues);
         drawFoodintakes(result.foodIntakes);
     }
@@ -199,11 +204,9 @@ export function optimize() {
             const response = yield fetch("/optimize", {
                 method: "POST",
                 headers: { "Content-Type": "application/json" },
-                body: JSON.stringify({
-                    foodInformation,
+                body: JSON.stringify(Object.assign({ foodInformation,
                     objective,
-                    constraints,
-                }),
+                    constraints }, warmStart)),
             });
             if (!response.ok) {
                 throw new Error(`Response status: ${response.status}`);
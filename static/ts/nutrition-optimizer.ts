@@ -328,8 +328,16 @@ interface Result {
   totalNutrientValues: TotalNutrientValues;
   foodIntakes: FoodIntakes;
   message: string;
+  sessionId?: string;
 }
 
+interface WarmStart {
+  sessionId?: string;
+  previousFoodIntakes?: FoodIntakes;
+}
+
+let warmStart: WarmStart = {};
+
 function clearCharts(): void {
   const foodIntakesChart =
     getElementByIdOrThrow<HTMLElement>("food-intakes-chart");
@@ -341,6 +349,10 @@ function clearCharts(): void {
 
 function handleOptimizationResult(result: Result): void {
   if (result.status === "Optimal") {
+    warmStart = {
+      sessionId: result.sessionId,
+      previousFoodIntakes: result.foodIntakes,
+    };
     drawPFCRatioWithTotalEnergy(result.pfcRatio, result.totalNutrientValues);
     drawFoodintakes(result.foodIntakes);
   } else {
@@ -362,6 +374,7 @@ export async function optimize(): Promise<void> {
         foodInformation,
         objective,
         constraints,
+        ...warmStart,
       }),
     });
 
@@ -0,0 +1,175 @@
+import os
+import threading
+import time
+from unittest import mock
+
+import pytest
+
+from src.admission_controller import (
+    AdmissionController,
+    AdmissionRejectedError,
+)
+
+
+def _wait_until_queued(
+    admission_controller: AdmissionController, queued_solves: int
+) -> None:
+    deadline = time.monotonic() + 5
+    while admission_controller.status()["queued_solves"] < queued_solves:
+        assert time.monotonic() < deadline
+        time.sleep(0.001)
+
+
+def test_admit() -> None:
+    admission_controller = AdmissionController(2)
+
+    with admission_controller.admit():
+        assert admission_controller.status() == {
+            "active_solves": 1,
+            "queued_solves": 0,
+            "max_concurrent_solves": 2,
+            "max_queued_solves": 16,
+        }
+
+    assert admission_controller.status()["active_solves"] == 0
+
+
+def test_admit_takes_slot_per_worker() -> None:
+    admission_controller = AdmissionController(4, 0)
+
+    with admission_controller.admit(3):
+        assert admission_controller.status()["active_solves"] == 3
+        with admission_controller.admit():
+            assert admission_controller.is_saturated
+        with pytest.raises(AdmissionRejectedError):
+            with admission_controller.admit(2):
+                pass  # pragma: no cover
+
+    with admission_controller.admit(8):
+        assert admission_controller.status()["active_solves"] == 4
+
+    assert admission_controller.status()["active_solves"] == 0
+
+
+def test_admit_rejects_when_queue_is_full() -> None:
+    admission_controller = AdmissionController(1, 0, retry_after=3)
+
+    with admission_controller.admit():
+        assert admission_controller.is_saturated
+        with pytest.raises(AdmissionRejectedError) as exception_info:
+            with admission_controller.admit():
+                pass  # pragma: no cover
+
+    assert exception_info.value.status_code == 429
+    assert exception_info.value.retry_after == 3
+    assert not admission_controller.is_saturated
+
+
+def test_try_admit_does_not_wait() -> None:
+    admission_controller = AdmissionController(1, 1)
+
+    with admission_controller.try_admit():
+        assert admission_controller.status()["active_solves"] == 1
+        with pytest.raises(AdmissionRejectedError) as exception_info:
+            with admission_controller.try_admit():
+                pass  # pragma: no cover
+        assert admission_controller.status()["queued_solves"] == 0
+
+    assert exception_info.value.status_code == 429
+    assert admission_controller.status()["active_solves"] == 0
+
+
+def test_admit_background_waits_outside_queue() -> None:
+    admission_controller = AdmissionController(1, 0, queue_timeout=0.01)
+    admitted = threading.Event()
+
+    def wait_for_slot() -> None:
+        with admission_controller.admit_background():
+            admitted.set()
+
+    with admission_controller.admit():
+        waiter = threading.Thread(target=wait_for_slot)
+        waiter.start()
+        time.sleep(0.05)
+
+        assert not admitted.is_set()
+        assert admission_controller.status()["queued_solves"] == 0
+
+    waiter.join()
+
+    assert admitted.is_set()
+    assert admission_controller.status()["active_solves"] == 0
+
+
+def test_admit_rejects_after_queue_timeout() -> None:
+    admission_controller = AdmissionController(1, 1, queue_timeout=0.01)
+
+    with admission_controller.admit():
+        with pytest.raises(AdmissionRejectedError) as exception_info:
+            with admission_controller.admit():
+                pass  # pragma: no cover
+
+    assert exception_info.value.status_code == 503
+    assert admission_controller.status()["queued_solves"] == 0
+
+
+def test_admit_waits_for_free_slot() -> None:
+    admission_controller = AdmissionController(1, 1)
+    release = threading.Event()
+    admitted = threading.Event()
+
+    def hold_slot() -> None:
+        with admission_controller.admit():
+            release.wait()
+
+    def wait_for_slot() -> None:
+        with admission_controller.admit():
+            admitted.set()
+
+    holder = threading.Thread(target=hold_slot)
+    holder.start()
+    while admission_controller.status()["active_solves"] == 0:
+        time.sleep(0.001)
+    waiter = threading.Thread(target=wait_for_slot)
+    waiter.start()
+    _wait_until_queued(admission_controller, 1)
+
+    assert admission_controller.is_saturated
+    assert not admitted.is_set()
+
+    release.set()
+    holder.join()
+    waiter.join()
+
+    assert admitted.is_set()
+    assert admission_controller.status()["active_solves"] == 0
+
+
+@pytest.mark.parametrize(
+    "arguments, message",
+    [
+        ((0,), "Admission max concurrent solves must be greater than zero."),
+        ((1, -1), "Admission max queued solves must be non-negative."),
+        ((1, 1, 0), "Admission queue timeout and retry after must be"),
+    ],
+)
+def test_invalid_admission_controller(arguments: tuple, message: str) -> None:
+    with pytest.raises(ValueError, match=message):
+        AdmissionController(*arguments)
+
+
+def test_from_environment() -> None:
+    environment = {
+        "ADMISSION_MAX_CONCURRENT": "",
+        "ADMISSION_MAX_QUEUED": "4",
+        "ADMISSION_QUEUE_TIMEOUT": "2.5",
+        "ADMISSION_RETRY_AFTER": "5",
+    }
+    with mock.patch.dict(os.environ, environment):
+        admission_controller = AdmissionController.from_environment()
+
+    assert admission_controller.status()["max_concurrent_solves"] == (
+        os.cpu_count() or 1
+    )
+    assert admission_controller.status()["max_queued_solves"] == 4
+    assert admission_controller.retry_after == 5
@@ -0,0 +1,148 @@
+import os
+from unittest import mock
+
+import pytest
+
+from src.alternative_optimizer import AlternativeOptimizer
+from src.constraint import Constraint
+from src.food_information import FoodInformation
+from src.objective import Objective
+from src.solver_settings import SolverSettings
+
+_FOOD_INFORMATION = [
+    FoodInformation(
+        name="boiled_egg",
+        energy=134,
+        protein=12.5,
+        fat=10.4,
+        carbohydrates=0.3,
+        grams_per_unit=50,
+        minimum_intake=0,
+        maximum_intake=3,
+    ),
+    FoodInformation(
+        name="chicken_breast",
+        energy=105,
+        protein=23.3,
+        fat=1.9,
+        carbohydrates=0.1,
+        grams_per_unit=100,
+        minimum_intake=0,
+        maximum_intake=2,
+    ),
+    FoodInformation(
+        name="natto",
+        energy=190,
+        protein=16.5,
+        fat=10.0,
+        carbohydrates=12.1,
+        grams_per_unit=45,
+        minimum_intake=0,
+        maximum_intake=2,
+    ),
+]
+
+_OBJECTIVE = Objective(sense="maximize", nutrient="protein")
+
+_CONSTRAINTS = [
+    Constraint(min_max="max", nutrient="energy", unit="energy", value=500),
+]
+
+
+def _calculate_difference(alternative: dict, other_alternative: dict) -> float:
+    return sum(
+        abs(intake - other_alternative["food_intakes"][food_name])
+        for food_name, intake in alternative["food_intakes"].items()
+    )
+
+
+@pytest.mark.parametrize("solver", ["cbc", "highs"])
+@pytest.mark.parametrize("min_difference", [1, 2])
+def test_solve(solver: str, min_difference: int) -> None:
+    result = AlternativeOptimizer(10).solve(
+        _FOOD_INFORMATION,
+        _OBJECTIVE,
+        _CONSTRAINTS,
+        4,
+        min_difference,
+        SolverSettings(solver=solver),
+    )
+
+    alternatives = result["alternatives"]
+    proteins = [
+        alternative["total_nutrient_values"]["protein"]
+        for alternative in alternatives
+    ]
+
+    assert result["status"] == "Optimal"
+    assert len(alternatives) == 4
+    assert proteins == sorted(proteins, reverse=True)
+    assert all(
+        alternative["total_nutrient_values"]["energy"] <= 500
+        for alternative in alternatives
+    )
+    assert all(
+        _calculate_difference(alternative, other_alternative) >= min_difference
+        for index, alternative in enumerate(alternatives)
+        for other_alternative in alternatives[:index]
+    )
+
+
+def test_solve_returns_fewer_alternatives_when_exhausted() -> None:
+    result = AlternativeOptimizer(10).solve(
+        _FOOD_INFORMATION[:1], _OBJECTIVE, _CONSTRAINTS, 10
+    )
+
+    assert result["status"] == "Optimal"
+    assert [
+        alternative["food_intakes"]["boiled_egg"]
+        for alternative in result["alternatives"]
+    ] == [3.0, 2.0, 1.0, 0.0]
+
+
+def test_solve_infeasible() -> None:
+    result = AlternativeOptimizer(10).solve(
+        _FOOD_INFORMATION,
+        _OBJECTIVE,
+        [
+            Constraint(
+                min_max="min", nutrient="protein", unit="amount", value=1e6
+            )
+        ],
+        3,
+    )
+
+    assert result["status"] == "Infeasible"
+    assert result["alternatives"] == []
+
+
+@pytest.mark.parametrize(
+    "count, min_difference, message",
+    [
+        (0, 1, "Alternative count must be between 1 and 10."),
+        (11, 1, "Alternative count must be between 1 and 10."),
+        (3, 0.5, "Min difference must be at least 1."),
+    ],
+)
+def test_solve_with_invalid_request(
+    count: int, min_difference: float, message: str
+) -> None:
+    with pytest.raises(ValueError, match=message):
+        AlternativeOptimizer(10).solve(
+            _FOOD_INFORMATION, _OBJECTIVE, _CONSTRAINTS, count, min_difference
+        )
+
+
+def test_invalid_settings() -> None:
+    with pytest.raises(ValueError):
+        AlternativeOptimizer(0)
+
+
+def test_from_environment() -> None:
+    with mock.patch.dict(os.environ, {"ALTERNATIVES_MAX_COUNT": "2"}):
+        alternative_optimizer = AlternativeOptimizer.from_environment()
+
+    with pytest.raises(ValueError, match="between 1 and 2"):
+        alternative_optimizer.solve(
+            _FOOD_INFORMATION, _OBJECTIVE, _CONSTRAINTS, 3
+        )
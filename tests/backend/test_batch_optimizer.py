@@ -0,0 +1,109 @@
+from concurrent.futures.process import BrokenProcessPool
+from typing import Generator
+from unittest import mock
+
+import pytest
+
+from src.batch_optimizer import BatchOptimizer
+from src.solve_cache import InMemoryCacheBackend, SolveCache
+
+_PROBLEM = {
+    "foodInformation": [
+        {
+            "name": "boiled_egg",
+            "energy": 134,
+            "protein": 12.5,
+            "fat": 10.4,
+            "carbohydrates": 0.3,
+            "gramsPerUnit": 50,
+            "minimumIntake": 1,
+            "maximumIntake": 3,
+        }
+    ],
+    "objective": {"sense": "maximize", "nutrient": "energy"},
+    "constraints": [
+        {"minMax": "max", "nutrient": "energy", "unit": "energy", "value": 200}
+    ],
+}
+
+_INFEASIBLE_PROBLEM = {
+    **_PROBLEM,
+    "constraints": [
+        {"minMax": "max", "nutrient": "energy", "unit": "energy", "value": 1}
+    ],
+}
+
+_INVALID_PROBLEM = {**_PROBLEM, "objective": {"sense": "invalid_sense"}}
+
+
+@pytest.fixture
+def batch_optimizer() -> Generator[BatchOptimizer, None, None]:
+    solve_cache = SolveCache(InMemoryCacheBackend(max_size=8, ttl=60))
+    batch_optimizer = BatchOptimizer(max_workers=2, solve_cache=solve_cache)
+    try:
+        yield batch_optimizer
+    finally:
+        batch_optimizer.shutdown()
+
+
+def test_solve_preserves_input_order(batch_optimizer: BatchOptimizer) -> None:
+    results = batch_optimizer.solve(
+        [_PROBLEM, _INVALID_PROBLEM, _INFEASIBLE_PROBLEM]
+    )
+
+    assert [result["status"] for result in results] == [
+        "Optimal",
+        "Error",
+        "Infeasible",
+    ]
+    assert results[0]["food_intakes"]["boiled_egg"] == 2
+    assert results[1]["message"] == "Invalid request data"
+
+
+def test_solve_uses_cache(batch_optimizer: BatchOptimizer) -> None:
+    first_results = batch_optimizer.solve([_PROBLEM])
+    second_results = batch_optimizer.solve([_PROBLEM])
+
+    assert first_results == second_results
+
+
+def test_solve_replaces_broken_executor(
+    batch_optimizer: BatchOptimizer,
+) -> None:
+    broken_executor = batch_optimizer._get_executor()
+    with mock.patch.object(
+        broken_executor,
+        "submit",
+        side_effect=BrokenProcessPool("A process was terminated abruptly."),
+    ):
+        results = batch_optimizer.solve([_PROBLEM])
+
+    assert results[0]["status"] == "Optimal"
+    assert batch_optimizer._get_executor() is not broken_executor
+
+
+def test_solve_returns_error_when_executor_stays_broken(
+    batch_optimizer: BatchOptimizer,
+) -> None:
+    with mock.patch(
+        "src.batch_optimizer.ProcessPoolExecutor.submit",
+        side_effect=BrokenProcessPool("A process was terminated abruptly."),
+    ):
+        results = batch_optimizer.solve([_PROBLEM, _INVALID_PROBLEM])
+
+    assert results == [
+        {"status": "Error", "message": "A process was terminated abruptly."},
+        {"status": "Error", "message": "Invalid request data"},
+    ]
+
+
+def test_get_worker_count(batch_optimizer: BatchOptimizer) -> None:
+    assert batch_optimizer.get_worker_count(1) == 1
+    assert batch_optimizer.get_worker_count(5) == 2
+
+
+def test_invalid_max_workers() -> None:
+    with pytest.raises(
+        ValueError, match="Batch max workers must be greater than zero."
+    ):
+        BatchOptimizer(max_workers=0)
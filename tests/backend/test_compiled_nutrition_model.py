@@ -0,0 +1,116 @@
+from dataclasses import replace
+
+from src.compiled_nutrition_model import (
+    CompiledModelRegistry,
+    CompiledNutritionModel,
+)
+from src.constraint import Constraint
+from src.food_information import FoodInformation
+from src.nutrition_optimizer import NutritionOptimizer
+from src.objective import Objective
+
+_FOOD_INFORMATION = [
+    FoodInformation(
+        name="boiled_egg",
+        energy=134,
+        protein=12.5,
+        fat=10.4,
+        carbohydrates=0.3,
+        grams_per_unit=50,
+        minimum_intake=1,
+        maximum_intake=3,
+    ),
+    FoodInformation(
+        name="broccoli",
+        energy=30,
+        protein=3.9,
+        fat=0.4,
+        carbohydrates=5.2,
+        grams_per_unit=15,
+        minimum_intake=6,
+        maximum_intake=9,
+    ),
+]
+
+_OBJECTIVE = Objective(sense="maximize", nutrient="protein")
+
+_CONSTRAINTS = [
+    Constraint(
+        min_max="max",
+        nutrient="energy",
+        unit="energy",
+        value=200,
+    ),
+    Constraint(
+        min_max="min",
+        nutrient="fat",
+        unit="ratio",
+        value=20,
+    ),
+]
+
+
+def test_compiled_model_matches_cold_build() -> None:
+    compiled_model = CompiledNutritionModel(_FOOD_INFORMATION)
+
+    cold_result = NutritionOptimizer(
+        _FOOD_INFORMATION, _OBJECTIVE, _CONSTRAINTS
+    ).solve()
+    compiled_result = NutritionOptimizer(
+        _FOOD_INFORMATION, _OBJECTIVE, _CONSTRAINTS, None, compiled_model
+    ).solve()
+
+    assert compiled_result["status"] == "Optimal"
+    assert compiled_result["food_intakes"] == cold_result["food_intakes"]
+    assert (
+        compiled_result["total_nutrient_values"]
+        == cold_result["total_nutrient_values"]
+    )
+
+
+def test_compiled_model_updates_bounds_objective_and_constraints() -> None:
+    compiled_model = CompiledNutritionModel(_FOOD_INFORMATION)
+    NutritionOptimizer(
+        _FOOD_INFORMATION, _OBJECTIVE, _CONSTRAINTS, None, compiled_model
+    ).solve()
+
+    food_information = [
+        replace(_FOOD_INFORMATION[0], minimum_intake=0),
+        _FOOD_INFORMATION[1],
+    ]
+    result = NutritionOptimizer(
+        food_information,
+        Objective(sense="minimize", nutrient="energy"),
+        [],
+        None,
+        compiled_model,
+    ).solve()
+
+    assert result["status"] == "Optimal"
+    assert result["food_intakes"] == {"boiled_egg": 0.0, "broccoli": 6.0}
+
+
+def test_catalog_key_ignores_intake_bounds() -> None:
+    food_information = [
+        replace(food, maximum_intake=10) for food in _FOOD_INFORMATION
+    ]
+
+    assert CompiledNutritionModel.compute_catalog_key(
+        _FOOD_INFORMATION
+    ) == CompiledNutritionModel.compute_catalog_key(food_information)
+
+
+def test_registry_reuses_compiled_models() -> None:
+    registry = CompiledModelRegistry(max_catalogs=1, max_pooled_models=1)
+
+    with registry.acquire(_FOOD_INFORMATION) as first_model:
+        with registry.acquire(_FOOD_INFORMATION) as concurrent_model:
+            assert concurrent_model is not first_model
+
+    with registry.acquire(_FOOD_INFORMATION) as reused_model:
+        assert reused_model in [first_model, concurrent_model]
+
+    with registry.acquire(_FOOD_INFORMATION[:1]):
+        pass
+    with registry.acquire(_FOOD_INFORMATION) as evicted_model:
+        assert evicted_model not in [first_model, concurrent_model]
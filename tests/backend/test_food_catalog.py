@@ -0,0 +1,113 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from src.food_catalog import FoodCatalog
+
+_FOODS = [
+    {
+        "food_id": "egg",
+        "name": "boiled_egg",
+        "energy": 134,
+        "protein": 12.5,
+        "fat": 10.4,
+        "carbohydrates": 0.3,
+        "grams_per_unit": 50,
+    },
+    {
+        "food_id": "broccoli",
+        "name": "broccoli",
+        "energy": 30,
+        "protein": 3.9,
+        "fat": 0.4,
+        "carbohydrates": 5.2,
+        "grams_per_unit": 15,
+    },
+]
+
+
+@pytest.fixture
+def food_catalog(tmp_path: Path) -> FoodCatalog:
+    food_catalog = FoodCatalog(os.path.join(tmp_path, "food_catalog.sqlite3"))
+    food_catalog.upsert(_FOODS)
+    return food_catalog
+
+
+def test_upsert_and_list_foods(food_catalog: FoodCatalog) -> None:
+    foods = food_catalog.list_foods()
+
+    assert len(food_catalog) == 2
+    assert [food["food_id"] for food in foods] == ["broccoli", "egg"]
+    assert foods[1]["protein"] == 12.5
+    assert foods[1]["grams_per_unit"] == 50
+
+
+def test_upsert_replaces_existing_food(food_catalog: FoodCatalog) -> None:
+    food_catalog.upsert([{**_FOODS[0], "energy": 140}])
+
+    foods = food_catalog.list_foods()
+
+    assert len(food_catalog) == 2
+    assert foods[1]["energy"] == 140
+
+
+def test_upsert_invalid_food(food_catalog: FoodCatalog) -> None:
+    with pytest.raises(ValueError, match="All nutrient values"):
+        food_catalog.upsert([{**_FOODS[0], "protein": -1}])
+
+    assert food_catalog.list_foods()[1]["protein"] == 12.5
+
+
+def test_catalog_is_loaded_from_disk(tmp_path: Path) -> None:
+    path = os.path.join(tmp_path, "food_catalog.sqlite3")
+    FoodCatalog(path).upsert(_FOODS)
+
+    assert len(FoodCatalog(path)) == 2
+
+
+def test_resolve(food_catalog: FoodCatalog) -> None:
+    food_information = food_catalog.resolve(
+        [{"foodId": "egg", "minimumIntake": 1, "maximumIntake": 3}]
+    )
+
+    assert food_information[0].name == "boiled_egg"
+    assert food_information[0].energy == 134
+    assert food_information[0].grams_per_unit == 50
+    assert food_information[0].minimum_intake == 1
+    assert food_information[0].maximum_intake == 3
+
+
+def test_resolve_unknown_food(food_catalog: FoodCatalog) -> None:
+    with pytest.raises(ValueError, match="Unknown food id: rice."):
+        food_catalog.resolve(
+            [{"foodId": "rice", "minimumIntake": 1, "maximumIntake": 3}]
+        )
+
+
+@pytest.mark.parametrize("food_id", ["egg", "organic_egg"])
+def test_resolve_duplicate_food_name(
+    food_catalog: FoodCatalog, food_id: str
+) -> None:
+    food_catalog.upsert([{**_FOODS[0], "food_id": "organic_egg"}])
+
+    with pytest.raises(ValueError, match="Duplicate food name: boiled_egg."):
+        food_catalog.resolve(
+            [
+                {"foodId": "egg", "minimumIntake": 1, "maximumIntake": 3},
+                {"foodId": food_id, "minimumIntake": 1, "maximumIntake": 3},
+            ]
+        )
+
+
+def test_resolve_invalid_intake(food_catalog: FoodCatalog) -> None:
+    with pytest.raises(ValueError, match="Invalid intake range"):
+        food_catalog.resolve(
+            [{"foodId": "egg", "minimumIntake": 3, "maximumIntake": 1}]
+        )
+
+
+def test_from_environment(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("FOOD_CATALOG_PATH", "")
+
+    assert FoodCatalog.from_environment() is None
@@ -0,0 +1,129 @@
+from dataclasses import replace
+
+import pytest
+
+from src.constraint import Constraint
+from src.food_information import FoodInformation
+from src.infeasibility_diagnoser import InfeasibilityDiagnoser
+from src.nutrition_optimizer import NutritionOptimizer
+from src.objective import Objective
+
+_FOOD_INFORMATION = [
+    FoodInformation(
+        name="boiled_egg",
+        energy=134,
+        protein=12.5,
+        fat=10.4,
+        carbohydrates=0.3,
+        grams_per_unit=50,
+        minimum_intake=1,
+        maximum_intake=3,
+    ),
+    FoodInformation(
+        name="chicken_breast",
+        energy=105,
+        protein=23.3,
+        fat=1.9,
+        carbohydrates=0.1,
+        grams_per_unit=100,
+        minimum_intake=0,
+        maximum_intake=2,
+    ),
+    FoodInformation(
+        name="rice",
+        energy=156,
+        protein=2.5,
+        fat=0.3,
+        carbohydrates=37.1,
+        grams_per_unit=150,
+        minimum_intake=1,
+        maximum_intake=2,
+    ),
+]
+
+_CONSTRAINTS = [
+    Constraint(min_max="max", nutrient="energy", unit="energy", value=500),
+    Constraint(min_max="min", nutrient="protein", unit="amount", value=60),
+    Constraint(
+        min_max="min", nutrient="carbohydrates", unit="ratio", value=40
+    ),
+    Constraint(min_max="max", nutrient="fat", unit="ratio", value=40),
+]
+
+
+def _solve(constraints: list[Constraint]) -> str:
+    return NutritionOptimizer(
+        _FOOD_INFORMATION,
+        Objective(sense="maximize", nutrient="protein"),
+        constraints,
+    ).solve()["status"]
+
+
+def test_diagnose() -> None:
+    conflicts = InfeasibilityDiagnoser(
+        _FOOD_INFORMATION, _CONSTRAINTS
+    ).diagnose()
+
+    assert conflicts == [
+        {
+            "type": "constraint",
+            "index": 0,
+            "min_max": "max",
+            "nutrient": "energy",
+            "unit": "energy",
+            "value": 500,
+            "relaxed_value": 745.0,
+        },
+        {
+            "type": "constraint",
+            "index": 1,
+            "min_max": "min",
+            "nutrient": "protein",
+            "unit": "amount",
+            "value": 60,
+            "relaxed_value": 39.5,
+        },
+        {
+            "type": "minimum_intake",
+            "food": "rice",
+            "value": 1,
+            "relaxed_value": None,
+        },
+    ]
+
+
+@pytest.mark.parametrize(
+    "index, relaxed_value, status",
+    [
+        (0, 745.0, "Optimal"),
+        (0, 744.9, "Infeasible"),
+        (1, 39.5, "Optimal"),
+        (1, 39.6, "Infeasible"),
+    ],
+)
+def test_relaxed_value_is_the_smallest_relaxation(
+    index: int, relaxed_value: float, status: str
+) -> None:
+    constraints = list(_CONSTRAINTS)
+    constraints[index] = replace(constraints[index], value=relaxed_value)
+
+    assert _solve(_CONSTRAINTS) == "Infeasible"
+    assert _solve(constraints) == status
+
+
+def test_diagnose_ratio_constraint() -> None:
+    conflicts = InfeasibilityDiagnoser(
+        _FOOD_INFORMATION[:2],
+        [Constraint(min_max="max", nutrient="fat", unit="ratio", value=10)],
+    ).diagnose()
+
+    assert [
+        (conflict["type"], conflict["relaxed_value"]) for conflict in conflicts
+    ] == [("minimum_intake", 0), ("constraint", 29.3)]
+
+
+def test_diagnose_feasible_problem() -> None:
+    assert (
+        InfeasibilityDiagnoser(_FOOD_INFORMATION, _CONSTRAINTS[:1]).diagnose()
+        == []
+    )
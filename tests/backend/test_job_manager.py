@@ -0,0 +1,149 @@
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Generator
+from unittest import mock
+
+import pytest
+
+from src.admission_controller import AdmissionController
+from src.constraint import Constraint
+from src.food_information import FoodInformation
+from src.job_manager import InMemoryJobStore, JobManager, SQLiteJobStore
+from src.objective import Objective
+
+_FOOD_INFORMATION = [
+    FoodInformation(
+        name="boiled_egg",
+        energy=134,
+        protein=12.5,
+        fat=10.4,
+        carbohydrates=0.3,
+        grams_per_unit=50,
+        minimum_intake=1,
+        maximum_intake=3,
+    ),
+]
+
+_OBJECTIVE = Objective(sense="maximize", nutrient="energy")
+
+_CONSTRAINTS = [
+    Constraint(
+        min_max="max",
+        nutrient="energy",
+        unit="energy",
+        value=200,
+    ),
+]
+
+
+@pytest.fixture
+def job_manager() -> Generator[JobManager, None, None]:
+    job_manager = JobManager(
+        InMemoryJobStore(), max_workers=1, max_queued_jobs=1, retention=60
+    )
+    try:
+        yield job_manager
+    finally:
+        job_manager.shutdown()
+
+
+def _wait_for_status(
+    job_manager: JobManager, job_id: str, status: str
+) -> dict:
+    for _ in range(100):
+        job = job_manager.get(job_id)
+        if job is not None and job["status"] == status:
+            return job
+        time.sleep(0.05)
+    raise AssertionError(f"Job {job_id} did not reach status {status}.")
+
+
+def test_submit_and_complete(job_manager: JobManager) -> None:
+    job_id = job_manager.submit(_FOOD_INFORMATION, _OBJECTIVE, _CONSTRAINTS)
+
+    job = _wait_for_status(job_manager, job_id, "completed")
+
+    assert job["result"]["status"] == "Optimal"
+    assert job["result"]["food_intakes"]["boiled_egg"] == 2
+
+
+def test_unknown_job(job_manager: JobManager) -> None:
+    assert job_manager.get("unknown") is None
+    assert job_manager.cancel("unknown") is None
+
+
+def test_cancel_queued_job_and_reject_when_full(
+    job_manager: JobManager,
+) -> None:
+    release = threading.Event()
+
+    def blocking_solve(*args: object) -> dict:
+        release.wait(5)
+        return {"status": "Optimal"}
+
+    with mock.patch.object(job_manager, "_solve", side_effect=blocking_solve):
+        running_job_id = job_manager.submit(
+            _FOOD_INFORMATION, _OBJECTIVE, _CONSTRAINTS
+        )
+        _wait_for_status(job_manager, running_job_id, "running")
+        queued_job_id = job_manager.submit(
+            _FOOD_INFORMATION, _OBJECTIVE, _CONSTRAINTS
+        )
+
+        with pytest.raises(RuntimeError, match="Job queue is full."):
+            job_manager.submit(_FOOD_INFORMATION, _OBJECTIVE, _CONSTRAINTS)
+
+        cancelled_job = job_manager.cancel(queued_job_id)
+        release.set()
+        _wait_for_status(job_manager, running_job_id, "completed")
+
+    assert cancelled_job is not None
+    assert cancelled_job["status"] == "cancelled"
+    assert job_manager.get(queued_job_id) == cancelled_job
+
+
+def test_job_waits_for_admission_slot() -> None:
+    admission_controller = AdmissionController(1, 0, queue_timeout=0.01)
+    job_manager = JobManager(
+        InMemoryJobStore(),
+        max_workers=1,
+        max_queued_jobs=1,
+        retention=60,
+        admission_controller=admission_controller,
+    )
+    try:
+        with admission_controller.admit():
+            job_id = job_manager.submit(
+                _FOOD_INFORMATION, _OBJECTIVE, _CONSTRAINTS
+            )
+            _wait_for_status(job_manager, job_id, "running")
+            time.sleep(0.05)
+
+            assert admission_controller.status()["queued_solves"] == 0
+            assert admission_controller.status()["active_solves"] == 1
+
+        completed_job = _wait_for_status(job_manager, job_id, "completed")
+    finally:
+        job_manager.shutdown()
+
+    assert completed_job["result"]["status"] == "Optimal"
+    assert admission_controller.status()["active_solves"] == 0
+
+
+def test_sqlite_job_store(tmp_path: Path) -> None:
+    job_store = SQLiteJobStore(os.path.join(tmp_path, "jobs.sqlite3"))
+    job = {"job_id": "job", "status": "completed", "updated_at": 0.0}
+
+    job_store.save(job)
+    assert job_store.get("job") == job
+
+    job_store.purge(updated_before=1.0)
+    assert job_store.get("job") is None
+
+
+def test_from_environment_invalid_job_store() -> None:
+    with mock.patch.dict(os.environ, {"JOB_STORE": "invalid"}):
+        with pytest.raises(ValueError, match="Invalid job store"):
+            JobManager.from_environment()
@@ -0,0 +1,154 @@
+import pytest
+
+from src.constraint import Constraint
+from src.food_information import FoodInformation
+from src.meal_plan_optimizer import MealPlanOptimizer
+from src.objective import Objective
+from src.solver_settings import SolverSettings
+
+_FOOD_INFORMATION = [
+    FoodInformation(
+        name="boiled_egg",
+        energy=134,
+        protein=12.5,
+        fat=10.4,
+        carbohydrates=0.3,
+        grams_per_unit=50,
+        minimum_intake=1,
+        maximum_intake=3,
+    ),
+    FoodInformation(
+        name="chicken_breast",
+        energy=105,
+        protein=23.3,
+        fat=1.9,
+        carbohydrates=0.1,
+        grams_per_unit=100,
+        minimum_intake=1,
+        maximum_intake=2,
+    ),
+    FoodInformation(
+        name="natto",
+        energy=190,
+        protein=16.5,
+        fat=10.0,
+        carbohydrates=12.1,
+        grams_per_unit=45,
+        minimum_intake=1,
+        maximum_intake=2,
+    ),
+]
+
+_OBJECTIVE = Objective(sense="maximize", nutrient="protein")
+
+_DAILY_CONSTRAINTS = [
+    Constraint(min_max="max", nutrient="energy", unit="energy", value=800),
+]
+
+
+def _get_intakes(result: dict, food_name: str) -> list[int]:
+    return [day["food_intakes"][food_name] for day in result["days"]]
+
+
+def test_solve_independent_days() -> None:
+    meal_plan_optimizer = MealPlanOptimizer(
+        _FOOD_INFORMATION, _OBJECTIVE, _DAILY_CONSTRAINTS, [], 3
+    )
+
+    assert meal_plan_optimizer.is_decomposable
+
+    result = meal_plan_optimizer.solve()
+
+    assert result["status"] == "Optimal"
+    assert len(result["days"]) == 3
+    assert all(day == result["days"][0] for day in result["days"])
+    assert result["total_nutrient_values"]["protein"] == pytest.approx(
+        3 * result["days"][0]["total_nutrient_values"]["protein"]
+    )
+
+
+def test_solve_with_plan_constraint() -> None:
+    plan_constraints = [
+        Constraint(min_max="max", nutrient="energy", unit="energy", value=2000)
+    ]
+    meal_plan_optimizer = MealPlanOptimizer(
+        _FOOD_INFORMATION, _OBJECTIVE, _DAILY_CONSTRAINTS, plan_constraints, 3
+    )
+
+    assert not meal_plan_optimizer.is_decomposable
+
+    result = meal_plan_optimizer.solve()
+
+    assert result["status"] == "Optimal"
+    assert result["total_nutrient_values"]["energy"] <= 2000
+    assert all(
+        day["total_nutrient_values"]["energy"] <= 800 for day in result["days"]
+    )
+
+
+def test_solve_with_variety_rule() -> None:
+    result = MealPlanOptimizer(
+        _FOOD_INFORMATION,
+        _OBJECTIVE,
+        _DAILY_CONSTRAINTS,
+        [],
+        3,
+        max_days_per_food=2,
+    ).solve()
+
+    assert result["status"] == "Optimal"
+    for food in _FOOD_INFORMATION:
+        intakes = _get_intakes(result, food.name)
+        assert sum(intake > 0 for intake in intakes) <= 2
+        assert all(
+            intake == 0 or intake >= food.minimum_intake for intake in intakes
+        )
+
+
+def test_solve_infeasible() -> None:
+    plan_constraints = [
+        Constraint(min_max="min", nutrient="energy", unit="energy", value=1e6)
+    ]
+
+    result = MealPlanOptimizer(
+        _FOOD_INFORMATION, _OBJECTIVE, _DAILY_CONSTRAINTS, plan_constraints, 3
+    ).solve()
+
+    assert result["status"] == "Infeasible"
+    assert "days" not in result
+
+
+@pytest.mark.parametrize(
+    "day_count, max_days_per_food, message",
+    [
+        (0, None, "Day count must be between 1 and 31."),
+        (32, None, "Day count must be between 1 and 31."),
+        (3, 0, "Max days per food must be between 1 and 3."),
+        (3, 4, "Max days per food must be between 1 and 3."),
+    ],
+)
+def test_invalid_plan(
+    day_count: int, max_days_per_food: int | None, message: str
+) -> None:
+    with pytest.raises(ValueError, match=message):
+        MealPlanOptimizer(
+            _FOOD_INFORMATION,
+            _OBJECTIVE,
+            _DAILY_CONSTRAINTS,
+            [],
+            day_count,
+            max_days_per_food,
+        )
+
+
+def test_coupled_plan_rejects_non_cbc_solver() -> None:
+    with pytest.raises(ValueError, match="can only be solved with cbc"):
+        MealPlanOptimizer(
+            _FOOD_INFORMATION,
+            _OBJECTIVE,
+            _DAILY_CONSTRAINTS,
+            [],
+            3,
+            1,
+            SolverSettings(solver="highs"),
+        )
@@ -0,0 +1,82 @@
+from src.metrics import Counter, Histogram, OptimizerMetrics
+
+
+def test_counter() -> None:
+    counter = Counter("solves_total", "Solves.", ["status"])
+
+    counter.inc(("Optimal",))
+    counter.inc(("Optimal",))
+    counter.inc(('In"feasible',))
+
+    assert counter.render() == [
+        "# HELP solves_total Solves.",
+        "# TYPE solves_total counter",
+        'solves_total{status="Optimal"} 2.0',
+        'solves_total{status="In\\"feasible"} 1.0',
+    ]
+
+
+def test_histogram() -> None:
+    histogram = Histogram("phase_seconds", "Phases.", ["phase"], [0.1, 1.0])
+
+    histogram.observe(0.1, ("solve",))
+    histogram.observe(0.5, ("solve",))
+    histogram.observe(2.0, ("solve",))
+
+    assert histogram.render() == [
+        "# HELP phase_seconds Phases.",
+        "# TYPE phase_seconds histogram",
+        'phase_seconds_bucket{phase="solve",le="0.1"} 1',
+        'phase_seconds_bucket{phase="solve",le="1.0"} 2',
+        'phase_seconds_bucket{phase="solve",le="+Inf"} 3',
+        'phase_seconds_sum{phase="solve"} 2.6',
+        'phase_seconds_count{phase="solve"} 3',
+    ]
+
+
+def test_optimizer_metrics() -> None:
+    optimizer_metrics = OptimizerMetrics()
+
+    optimizer_metrics.record_solve(
+        {"parse": 0.001, "solve": 0.02}, "Optimal", 3, 2
+    )
+    optimizer_metrics.record_status("Error")
+    optimizer_metrics.record_request(0.5)
+    optimizer_metrics.record_request(0.1)
+    rendered_metrics = optimizer_metrics.render(
+        {"hits": 1, "misses": 2},
+        4,
+        {"leader": 1, "coalesced": 5},
+        {"initialize": 0.25},
+    )
+
+    assert (
+        'nutrition_optimizer_phase_seconds_count{phase="solve"} 1'
+        in rendered_metrics
+    )
+    assert (
+        'nutrition_optimizer_solves_total{status="Optimal"} 1.0'
+        in rendered_metrics
+    )
+    assert (
+        'nutrition_optimizer_solves_total{status="Error"} 1.0'
+        in rendered_metrics
+    )
+    assert "nutrition_optimizer_problem_foods_sum 3" in rendered_metrics
+    assert (
+        'nutrition_optimizer_solve_cache_lookups_total{result="misses"} 2'
+        in rendered_metrics
+    )
+    assert (
+        "nutrition_optimizer_log_records_dropped_total 4" in rendered_metrics
+    )
+    assert (
+        'nutrition_optimizer_coalesced_requests_total{role="coalesced"} 5'
+        in rendered_metrics
+    )
+    assert (
+        'nutrition_optimizer_startup_seconds{phase="initialize"} 0.25'
+        in rendered_metrics
+    )
+    assert "nutrition_optimizer_first_request_seconds 0.5" in rendered_metrics
+    assert rendered_metrics.endswith("\n")
@@ -0,0 +1,145 @@
+import numpy as np
+import pytest
+from pulp import LpInteger, LpVariable
+
+from src.constraint import Constraint
+from src.food_information import FoodInformation
+from src.model_builder import ModelBuilder, NoGoodCut
+from src.objective import Objective
+
+_FOOD_INFORMATION = [
+    FoodInformation(
+        name="boiled_egg",
+        energy=134,
+        protein=12.5,
+        fat=10.4,
+        carbohydrates=0.3,
+        grams_per_unit=50,
+        minimum_intake=1,
+        maximum_intake=3,
+    ),
+    FoodInformation(
+        name="broccoli",
+        energy=30,
+        protein=3.9,
+        fat=0.4,
+        carbohydrates=5.2,
+        grams_per_unit=15,
+        minimum_intake=6,
+        maximum_intake=9,
+    ),
+]
+
+
+def test_coefficients() -> None:
+    model_builder = ModelBuilder(_FOOD_INFORMATION)
+
+    assert model_builder.coefficients.shape == (2, 4)
+    assert model_builder.nutrient_coefficients("energy").tolist() == [
+        pytest.approx(67.0),
+        pytest.approx(4.5),
+    ]
+
+
+def test_empty_food_information() -> None:
+    model_builder = ModelBuilder([])
+
+    assert model_builder.coefficients.shape == (0, 4)
+
+
+def test_build_nutrient_totals() -> None:
+    model_builder = ModelBuilder(_FOOD_INFORMATION)
+    variables = [
+        LpVariable(food.name, lowBound=0, upBound=10, cat=LpInteger)
+        for food in _FOOD_INFORMATION
+    ]
+
+    nutrient_totals = model_builder.build_nutrient_totals(variables)
+
+    assert list(nutrient_totals) == FoodInformation.NUTRIENTS
+    assert nutrient_totals["protein"][variables[0]] == pytest.approx(6.25)
+    assert nutrient_totals["protein"][variables[1]] == pytest.approx(0.585)
+
+
+def test_build_linear_model() -> None:
+    model_builder = ModelBuilder(_FOOD_INFORMATION)
+    constraints = [
+        Constraint(min_max="max", nutrient="energy", unit="energy", value=200),
+        Constraint(min_max="min", nutrient="fat", unit="ratio", value=20),
+    ]
+
+    linear_model = model_builder.build_linear_model(
+        Objective(sense="minimize", nutrient="protein"), constraints
+    )
+
+    assert linear_model.food_names == ["boiled_egg", "broccoli"]
+    assert not linear_model.maximize
+    assert linear_model.objective_coefficients.tolist() == [
+        pytest.approx(6.25),
+        pytest.approx(0.585),
+    ]
+    assert linear_model.constraint_names == [
+        "max_energy_energy",
+        "min_fat_ratio",
+    ]
+    assert linear_model.constraint_matrix.shape == (2, 2)
+    assert linear_model.constraint_matrix[1, 0] == pytest.approx(
+        5.2 * 9 - 67.0 * 0.2
+    )
+    assert linear_model.constraint_lower.tolist() == [-float("inf"), 0.0]
+    assert linear_model.constraint_upper.tolist() == [200.0, float("inf")]
+    assert linear_model.intake_lower.tolist() == [1.0, 6.0]
+    assert linear_model.intake_upper.tolist() == [3.0, 9.0]
+
+
+def test_calculate_nutrient_totals() -> None:
+    model_builder = ModelBuilder(_FOOD_INFORMATION)
+
+    nutrient_totals = model_builder.calculate_nutrient_totals(
+        np.array([2.0, 6.0])
+    )
+    batch_nutrient_totals = model_builder.calculate_nutrient_totals(
+        np.array([[2.0, 6.0], [0.0, 1.0]])
+    )
+
+    assert nutrient_totals[0] == pytest.approx(161.0)
+    assert batch_nutrient_totals.shape == (2, 4)
+    assert batch_nutrient_totals[0] == pytest.approx(nutrient_totals)
+    assert batch_nutrient_totals[1, 0] == pytest.approx(4.5)
+
+
+def test_calculate_pfc_ratios() -> None:
+    pfc_ratios = ModelBuilder.calculate_pfc_ratios(
+        np.array([[100.0, 10.0, 0.0, 15.0], [0.0, 0.0, 0.0, 0.0]])
+    )
+
+    assert pfc_ratios.tolist() == [
+        [0.0, pytest.approx(40.0), 0.0, pytest.approx(60.0)],
+        [0.0, 0.0, 0.0, 0.0],
+    ]
+
+
+@pytest.mark.parametrize(
+    "values, is_satisfied",
+    [
+        ([2.0, 6.0], False),
+        ([3.0, 6.0], False),
+        ([1.0, 7.0], True),
+        ([3.0, 9.0], True),
+    ],
+)
+def test_no_good_cut(values: list[float], is_satisfied: bool) -> None:
+    linear_model = ModelBuilder(_FOOD_INFORMATION).build_linear_model(
+        Objective(sense="maximize", nutrient="protein"), []
+    )
+    no_good_cut = NoGoodCut.create(linear_model, np.array([2.0, 6.0]), 2, 2)
+
+    values_array = np.array(values)
+    row_values = no_good_cut.row_matrix @ np.concatenate(
+        (values_array, no_good_cut.auxiliary_values(values_array))
+    )
+
+    assert no_good_cut.row_matrix.shape == (4, 5)
+    assert no_good_cut.is_satisfied(values_array) == is_satisfied
+    assert np.all(row_values <= no_good_cut.row_upper)
+    assert np.all(row_values >= no_good_cut.row_lower) == is_satisfied
@@ -1,7 +1,20 @@
+from unittest import mock
+
+import pytest
+from pulp import LpSolutionIntegerFeasible
+
 from src.constraint import Constraint
 from src.food_information import FoodInformation
 from src.nutrition_optimizer import NutritionOptimizer
 from src.objective import Objective
+from src.phase_timer import PhaseTimer
+from src.solver_backend import (
+    EnumerationSolverBackend,
+    RoundingSolverBackend,
+    SolverResult,
+)
+from src.solver_settings import SolverSettings
+from src.warm_start import WarmStart
 
 _FOOD_INFORMATION = [
     FoodInformation(
@@ -54,6 +67,247 @@ def test_solve() -> None:
 
     assert result["food_intakes"]["boiled_egg"] == 2
     assert result["total_nutrient_values"]["energy"] == 134
+    assert result["gap"] == 0.0
+    assert result["solve_time"] >= 0
+
+
+@mock.patch.object(EnumerationSolverBackend, "MAX_COMBINATION_COUNT", 0)
+def test_solve_records_phase_durations() -> None:
+    phase_timer = PhaseTimer()
+    optimizer = NutritionOptimizer(
+        _FOOD_INFORMATION, _OBJECTIVE, _CONSTRAINTS, phase_timer=phase_timer
+    )
+    optimizer.solve()
+
+    assert list(phase_timer.durations) == [
+        "build_linear_model",
+        "presolve",
+        "setup_variables",
+        "build_expressions",
+        "setup_constraints",
+        "solve",
+        "result",
+    ]
+
+
+def test_solve_with_solver_settings() -> None:
+    solver_settings = SolverSettings(
+        time_limit=10, relative_gap=0.0, absolute_gap=0.0, threads=1
+    )
+    optimizer = NutritionOptimizer(
+        _FOOD_INFORMATION, _OBJECTIVE, _CONSTRAINTS, solver_settings
+    )
+    result = optimizer.solve()
+
+    assert result["status"] == "Optimal"
+    assert result["food_intakes"]["boiled_egg"] == 2
+    assert result["gap"] == 0.0
+
+
+def test_solve_with_highs() -> None:
+    optimizer = NutritionOptimizer(
+        _FOOD_INFORMATION,
+        _OBJECTIVE,
+        _CONSTRAINTS,
+        SolverSettings(solver="highs"),
+    )
+    result = optimizer.solve()
+
+    assert result["status"] == "Optimal"
+    assert result["food_intakes"]["boiled_egg"] == 2
+    assert result["total_nutrient_values"]["energy"] == 134
+
+
+@mock.patch.object(EnumerationSolverBackend, "MAX_COMBINATION_COUNT", 0)
+def test_solve_reports_feasible_when_stopped_early() -> None:
+    optimizer = NutritionOptimizer(
+        _FOOD_INFORMATION,
+        _OBJECTIVE,
+        _CONSTRAINTS,
+        SolverSettings(time_limit=10),
+    )
+
+    def stop_early() -> float:
+        optimizer._problem.solve(SolverSettings().create_solver())
+        optimizer._problem.sol_status = LpSolutionIntegerFeasible
+        return 268.0
+
+    with mock.patch.object(optimizer, "_run_solver", side_effect=stop_early):
+        result = optimizer.solve()
+
+    assert result["status"] == "Feasible"
+    assert result["food_intakes"]["boiled_egg"] == 2
+    assert result["gap"] == 1.0
+
+
+def test_solve_small_problem_by_enumeration() -> None:
+    phase_timer = PhaseTimer()
+    optimizer = NutritionOptimizer(
+        _FOOD_INFORMATION, _OBJECTIVE, _CONSTRAINTS, phase_timer=phase_timer
+    )
+
+    with mock.patch.object(optimizer, "_run_solver") as run_solver:
+        result = optimizer.solve()
+
+    run_solver.assert_not_called()
+    assert "setup_variables" not in phase_timer.durations
+    assert result["status"] == "Optimal"
+    assert result["food_intakes"]["boiled_egg"] == 2
+    assert result["gap"] == 0.0
+
+
+@pytest.mark.parametrize(
+    "solver_settings, uses_enumeration",
+    [
+        (SolverSettings(), True),
+        (SolverSettings(threads=2), True),
+        (SolverSettings(solver="highs"), False),
+        (SolverSettings(time_limit=10), False),
+        (SolverSettings(relative_gap=0.1), False),
+        (SolverSettings(mode="approximate"), False),
+    ],
+)
+def test_enumeration_only_replaces_default_solver(
+    solver_settings: SolverSettings, uses_enumeration: bool
+) -> None:
+    optimizer = NutritionOptimizer(
+        _FOOD_INFORMATION, _OBJECTIVE, _CONSTRAINTS, solver_settings
+    )
+
+    with mock.patch.object(
+        EnumerationSolverBackend,
+        "solve",
+        side_effect=EnumerationSolverBackend().solve,
+    ) as enumeration_solve:
+        result = optimizer.solve()
+
+    assert enumeration_solve.called == uses_enumeration
+    assert result["status"] == "Optimal"
+    assert result["food_intakes"]["boiled_egg"] == 2
+
+
+def test_solve_in_approximate_mode() -> None:
+    optimizer = NutritionOptimizer(
+        _FOOD_INFORMATION,
+        _OBJECTIVE,
+        _CONSTRAINTS,
+        SolverSettings(mode="approximate"),
+    )
+
+    with mock.patch.object(optimizer, "_run_solver") as run_solver:
+        result = optimizer.solve()
+
+    run_solver.assert_not_called()
+    assert result["status"] == "Optimal"
+    assert result["food_intakes"]["boiled_egg"] == 2
+    assert result["gap"] == 0.0
+
+
+def test_approximate_mode_falls_back_to_exact_solve() -> None:
+    optimizer = NutritionOptimizer(
+        _FOOD_INFORMATION,
+        _OBJECTIVE,
+        _CONSTRAINTS,
+        SolverSettings(mode="approximate"),
+    )
+
+    with mock.patch.object(
+        RoundingSolverBackend,
+        "solve",
+        return_value=SolverResult(
+            status="Not Solved", food_intakes={}, gap=0.0
+        ),
+    ):
+        result = optimizer.solve()
+
+    assert result["status"] == "Optimal"
+    assert result["food_intakes"]["boiled_egg"] == 2
+
+
+def test_solve_skips_solver_for_proven_warm_start() -> None:
+    optimizer = NutritionOptimizer(
+        _FOOD_INFORMATION,
+        _OBJECTIVE,
+        [],
+        warm_start=WarmStart({"boiled_egg": 3}),
+    )
+
+    with mock.patch.object(optimizer, "_run_solver") as run_solver:
+        result = optimizer.solve()
+
+    run_solver.assert_not_called()
+    assert result["status"] == "Optimal"
+    assert result["food_intakes"] == {"boiled_egg": 3.0}
+
+
+def test_solve_with_warm_start() -> None:
+    for solver in SolverSettings.SOLVERS:
+        optimizer = NutritionOptimizer(
+            _FOOD_INFORMATION,
+            _OBJECTIVE,
+            _CONSTRAINTS,
+            SolverSettings(solver=solver),
+            warm_start=WarmStart({"boiled_egg": 1}),
+        )
+        result = optimizer.solve()
+
+        assert result["status"] == "Optimal"
+        assert result["food_intakes"]["boiled_egg"] == 2
+
+
+def test_solve_with_zero_intakes() -> None:
+    food_information = [
+        FoodInformation(
+            name="broccoli",
+            energy=30,
+            protein=3.9,
+            fat=0.4,
+            carbohydrates=5.2,
+            grams_per_unit=15,
+            minimum_intake=0,
+            maximum_intake=9,
+        ),
+    ]
+    optimizer = NutritionOptimizer(
+        food_information, Objective(sense="minimize", nutrient="energy"), []
+    )
+    result = optimizer.solve()
+
+    assert result["status"] == "Optimal"
+    assert result["total_nutrient_values"]["energy"] == 0
+    assert result["pfc_ratio"] == {
+        "protein": 0.0,
+        "fat": 0.0,
+        "carbohydrates": 0.0,
+    }
+
+
+def test_solve_skips_solver_when_presolve_fixes_all_foods() -> None:
+    optimizer = NutritionOptimizer(
+        _FOOD_INFORMATION,
+        _OBJECTIVE,
+        [
+            Constraint(
+                min_max="max", nutrient="energy", unit="energy", value=100
+            ),
+            Constraint(
+                min_max="max", nutrient="energy", unit="energy", value=5000
+            ),
+        ],
+    )
+
+    with mock.patch.object(optimizer, "_run_solver") as run_solver:
+        result = optimizer.solve()
+
+    run_solver.assert_not_called()
+    assert result["status"] == "Optimal"
+    assert result["food_intakes"] == {"boiled_egg": 1.0}
+    assert result["presolve"] == {
+        "infeasible_reason": None,
+        "removed_constraints": [0, 1],
+        "fixed_foods": ["boiled_egg"],
+        "tightened_foods": [],
+    }
 
 
 def test_infeasible() -> None:
@@ -68,3 +322,6 @@ def test_infeasible() -> None:
         result["message"] == "Please review the constraints,"
         " the grams per unit, or the intake values."
     )
+    assert result["presolve"]["infeasible_reason"].startswith(
+        "Constraint max_energy_energy cannot be satisfied"
+    )
@@ -0,0 +1,201 @@
+import os
+from unittest import mock
+
+import pytest
+
+from src.constraint import Constraint
+from src.food_information import FoodInformation
+from src.objective import Objective
+from src.pareto_optimizer import ParetoOptimizer
+from src.solver_backend import SolverResult
+from src.solver_settings import SolverSettings
+
+_FOOD_INFORMATION = [
+    FoodInformation(
+        name="boiled_egg",
+        energy=134,
+        protein=12.5,
+        fat=10.4,
+        carbohydrates=0.3,
+        grams_per_unit=50,
+        minimum_intake=0,
+        maximum_intake=3,
+    ),
+    FoodInformation(
+        name="chicken_breast",
+        energy=105,
+        protein=23.3,
+        fat=1.9,
+        carbohydrates=0.1,
+        grams_per_unit=100,
+        minimum_intake=0,
+        maximum_intake=2,
+    ),
+    FoodInformation(
+        name="natto",
+        energy=190,
+        protein=16.5,
+        fat=10.0,
+        carbohydrates=12.1,
+        grams_per_unit=45,
+        minimum_intake=0,
+        maximum_intake=2,
+    ),
+]
+
+_OBJECTIVES = [
+    Objective(sense="maximize", nutrient="protein"),
+    Objective(sense="minimize", nutrient="energy"),
+]
+
+_CONSTRAINTS = [
+    Constraint(min_max="min", nutrient="protein", unit="amount", value=20),
+]
+
+
+@pytest.mark.parametrize("solver", ["cbc", "highs"])
+def test_solve(solver: str) -> None:
+    result = ParetoOptimizer(2, 10).solve(
+        _FOOD_INFORMATION,
+        _OBJECTIVES,
+        _CONSTRAINTS,
+        5,
+        SolverSettings(solver=solver),
+    )
+
+    assert result["status"] == "Optimal"
+    assert result["solve_time"] >= 0
+
+    points = [
+        (
+            point["total_nutrient_values"]["protein"],
+            point["total_nutrient_values"]["energy"],
+        )
+        for point in result["points"]
+    ]
+    assert points[0] == (80.2, 582.0)
+    assert points[-1] == (23.3, 105.0)
+    assert points == sorted(points, reverse=True)
+    assert all(
+        point["total_nutrient_values"]["protein"] >= 20
+        for point in result["points"]
+    )
+
+
+def test_solve_infeasible() -> None:
+    result = ParetoOptimizer(2, 10).solve(
+        _FOOD_INFORMATION,
+        _OBJECTIVES,
+        [
+            Constraint(
+                min_max="min", nutrient="protein", unit="amount", value=1e6
+            )
+        ],
+        5,
+    )
+
+    assert result["status"] == "Infeasible"
+    assert result["points"] == []
+
+
+@pytest.mark.parametrize("solver", ["cbc", "highs"])
+def test_solve_anchors_primary_optimum_lexicographically(solver: str) -> None:
+    food_information = [
+        FoodInformation(
+            name=name,
+            energy=energy,
+            protein=10,
+            fat=0,
+            carbohydrates=0,
+            grams_per_unit=100,
+            minimum_intake=0,
+            maximum_intake=1,
+        )
+        for name, energy in [("rich", 200), ("lean", 100)]
+    ]
+    constraints = [
+        Constraint(min_max="max", nutrient="protein", unit="amount", value=10)
+    ]
+
+    result = ParetoOptimizer(2, 10).solve(
+        food_information,
+        _OBJECTIVES,
+        constraints,
+        2,
+        SolverSettings(solver=solver),
+    )
+
+    assert result["points"][0]["food_intakes"] == {"rich": 0, "lean": 1}
+
+
+def test_solve_reports_unsolved_points() -> None:
+    pareto_optimizer = ParetoOptimizer(2, 10)
+    solve_points = pareto_optimizer._solve_points
+    not_solved = SolverResult(status="Not Solved", food_intakes={}, gap=0.0)
+
+    with mock.patch.object(
+        pareto_optimizer,
+        "_solve_points",
+        side_effect=lambda *args: [*solve_points(*args), not_solved],
+    ):
+        result = pareto_optimizer.solve(
+            _FOOD_INFORMATION, _OBJECTIVES, _CONSTRAINTS, 5
+        )
+
+    assert result["status"] == "Feasible"
+    assert result["points"]
+
+    with mock.patch.object(
+        pareto_optimizer, "_solve_points", return_value=[not_solved]
+    ):
+        result = pareto_optimizer.solve(
+            _FOOD_INFORMATION, _OBJECTIVES, _CONSTRAINTS, 5
+        )
+
+    assert result["status"] == "Not Solved"
+    assert result["points"] == []
+
+
+@pytest.mark.parametrize(
+    "objectives, point_count, message",
+    [
+        (_OBJECTIVES[:1], 5, "Exactly 2 objectives are required."),
+        (
+            [_OBJECTIVES[0], Objective(sense="minimize", nutrient="protein")],
+            5,
+            "Objectives must target different nutrients.",
+        ),
+        (_OBJECTIVES, 1, "Point count must be between 2 and 10."),
+        (_OBJECTIVES, 11, "Point count must be between 2 and 10."),
+    ],
+)
+def test_solve_with_invalid_problem(
+    objectives: list[Objective], point_count: int, message: str
+) -> None:
+    with pytest.raises(ValueError, match=message):
+        ParetoOptimizer(2, 10).solve(
+            _FOOD_INFORMATION, objectives, _CONSTRAINTS, point_count
+        )
+
+
+def test_get_worker_count() -> None:
+    pareto_optimizer = ParetoOptimizer(2, 10)
+
+    assert pareto_optimizer.get_worker_count(1) == 1
+    assert pareto_optimizer.get_worker_count(5) == 2
+
+
+@pytest.mark.parametrize("max_workers, max_points", [(0, 10), (2, 1)])
+def test_invalid_settings(max_workers: int, max_points: int) -> None:
+    with pytest.raises(ValueError):
+        ParetoOptimizer(max_workers, max_points)
+
+
+def test_from_environment() -> None:
+    environment = {"PARETO_MAX_WORKERS": "1", "PARETO_MAX_POINTS": "3"}
+
+    with mock.patch.dict(os.environ, environment):
+        pareto_optimizer = ParetoOptimizer.from_environment()
+
+    with pytest.raises(ValueError, match="between 2 and 3"):
+        pareto_optimizer.solve(_FOOD_INFORMATION, _OBJECTIVES, _CONSTRAINTS, 4)
@@ -0,0 +1,38 @@
+from src.phase_timer import PhaseTimer
+
+
+def test_measure() -> None:
+    phase_timer = PhaseTimer()
+
+    with phase_timer.measure("parse"):
+        pass
+    with phase_timer.measure("solve"):
+        pass
+
+    assert list(phase_timer.durations) == ["parse", "solve"]
+    assert all(seconds >= 0 for seconds in phase_timer.durations.values())
+
+
+def test_measure_accumulates_repeated_phases() -> None:
+    phase_timer = PhaseTimer()
+
+    with phase_timer.measure("solve"):
+        pass
+    first_duration = phase_timer.durations["solve"]
+    with phase_timer.measure("solve"):
+        pass
+
+    assert phase_timer.durations["solve"] >= first_duration
+
+
+def test_to_server_timing() -> None:
+    phase_timer = PhaseTimer()
+    with phase_timer.measure("parse"):
+        pass
+    with phase_timer.measure("solve"):
+        pass
+
+    server_timing = phase_timer.to_server_timing()
+
+    assert server_timing.startswith("parse;dur=")
+    assert ", solve;dur=" in server_timing
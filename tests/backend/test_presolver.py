@@ -0,0 +1,171 @@
+import math
+
+import numpy as np
+import pytest
+
+from src.constraint import Constraint
+from src.food_information import FoodInformation
+from src.model_builder import LinearModel, ModelBuilder
+from src.objective import Objective
+from src.presolver import Presolver
+
+_FOOD_INFORMATION = [
+    FoodInformation(
+        name="boiled_egg",
+        energy=134,
+        protein=12.5,
+        fat=10.4,
+        carbohydrates=0.3,
+        grams_per_unit=50,
+        minimum_intake=1,
+        maximum_intake=3,
+    ),
+    FoodInformation(
+        name="chicken_breast",
+        energy=105,
+        protein=23.3,
+        fat=1.9,
+        carbohydrates=0.1,
+        grams_per_unit=100,
+        minimum_intake=0,
+        maximum_intake=2,
+    ),
+    FoodInformation(
+        name="rice",
+        energy=156,
+        protein=2.5,
+        fat=0.3,
+        carbohydrates=37.1,
+        grams_per_unit=150,
+        minimum_intake=2,
+        maximum_intake=2,
+    ),
+]
+
+
+def _build_linear_model(constraints: list[Constraint]) -> LinearModel:
+    return ModelBuilder(_FOOD_INFORMATION).build_linear_model(
+        Objective(sense="maximize", nutrient="protein"), constraints
+    )
+
+
+def test_calculate_activity_bounds() -> None:
+    activity_lower, activity_upper = Presolver.calculate_activity_bounds(
+        np.array([[1.0, -2.0]]), np.array([0.0, 1.0]), np.array([3.0, 2.0])
+    )
+
+    assert activity_lower.tolist() == [-4.0]
+    assert activity_upper.tolist() == [1.0]
+
+
+@pytest.mark.parametrize(
+    "constraint, reason",
+    [
+        (
+            Constraint(
+                min_max="min", nutrient="energy", unit="energy", value=5000
+            ),
+            "Constraint min_energy_energy cannot be satisfied within the"
+            " intake ranges. The achievable range is 535.0 to 879.0.",
+        ),
+        (
+            Constraint(
+                min_max="max", nutrient="energy", unit="energy", value=500
+            ),
+            "Constraint max_energy_energy cannot be satisfied within the"
+            " intake ranges. The achievable range is 535.0 to 879.0.",
+        ),
+    ],
+)
+def test_presolve_rejects_impossible_constraint(
+    constraint: Constraint, reason: str
+) -> None:
+    presolve_result = Presolver().presolve(_build_linear_model([constraint]))
+
+    assert presolve_result.is_infeasible
+    assert presolve_result.infeasible_reason == reason
+
+
+def test_presolve_tightens_bounds_and_drops_redundant_constraints() -> None:
+    presolve_result = Presolver().presolve(
+        _build_linear_model(
+            [
+                Constraint(
+                    min_max="max", nutrient="energy", unit="energy", value=700
+                ),
+                Constraint(
+                    min_max="max", nutrient="energy", unit="energy", value=5000
+                ),
+            ]
+        )
+    )
+    linear_model = presolve_result.linear_model
+
+    assert not presolve_result.is_infeasible
+    assert linear_model.intake_lower.tolist() == [1.0, 0.0, 2.0]
+    assert linear_model.intake_upper.tolist() == [3.0, 1.0, 2.0]
+    assert linear_model.constraint_names == ["max_energy_energy"]
+    assert linear_model.constraint_upper.tolist() == [700.0]
+    assert presolve_result.report() == {
+        "infeasible_reason": None,
+        "removed_constraints": [1],
+        "fixed_foods": ["rice"],
+        "tightened_foods": ["chicken_breast"],
+    }
+    assert not presolve_result.is_fully_fixed
+
+
+@pytest.mark.parametrize(
+    "constraints",
+    [
+        [],
+        [
+            Constraint(
+                min_max="min", nutrient="protein", unit="amount", value=13
+            )
+        ],
+    ],
+)
+def test_presolve_fixes_all_foods(constraints: list[Constraint]) -> None:
+    presolve_result = Presolver().presolve(
+        _build_linear_model(
+            [
+                Constraint(
+                    min_max="max", nutrient="energy", unit="energy", value=600
+                ),
+                *constraints,
+            ]
+        )
+    )
+
+    linear_model = presolve_result.linear_model
+    assert presolve_result.is_fully_fixed
+    assert linear_model.intake_upper.tolist() == [1.0, 0.0, 2.0]
+    assert linear_model.intake_lower.tolist() == [1.0, 0.0, 2.0]
+    assert all(
+        math.copysign(1, value) == 1
+        for value in linear_model.intake_lower.tolist()
+    )
+    assert presolve_result.removed_constraint_indices[0] == 0
+
+
+def test_presolve_detects_empty_intake_range() -> None:
+    presolve_result = Presolver().presolve(
+        _build_linear_model(
+            [
+                Constraint(
+                    min_max="max", nutrient="energy", unit="energy", value=700
+                ),
+                Constraint(
+                    min_max="min", nutrient="protein", unit="amount", value=50
+                ),
+            ]
+        )
+    )
+
+    assert presolve_result.is_infeasible
+
+
+def test_invalid_max_passes() -> None:
+    with pytest.raises(ValueError):
+        Presolver(0)
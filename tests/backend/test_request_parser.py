@@ -0,0 +1,200 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from src.constraint import Constraint
+from src.food_catalog import FoodCatalog
+from src.food_information import FoodInformation
+from src.objective import Objective
+from src.request_parser import RequestParser, RequestValidationError
+
+_FOOD_INFORMATION_DATA = {
+    "name": "boiled_egg",
+    "energy": 134,
+    "protein": 12.5,
+    "fat": 10.4,
+    "carbohydrates": 0.3,
+    "gramsPerUnit": 50,
+    "minimumIntake": 1,
+    "maximumIntake": 3,
+}
+
+_OBJECTIVE_DATA = {"sense": "maximize", "nutrient": "energy"}
+
+_CONSTRAINT_DATA = {
+    "minMax": "max",
+    "nutrient": "energy",
+    "unit": "energy",
+    "value": 1800,
+}
+
+
+def _create_request_data(**overrides: object) -> dict:
+    return {
+        "foodInformation": [_FOOD_INFORMATION_DATA],
+        "objective": _OBJECTIVE_DATA,
+        "constraints": [_CONSTRAINT_DATA],
+        **overrides,
+    }
+
+
+def test_field_maps_accept_camel_and_snake_case() -> None:
+    field_map = RequestParser.FIELD_MAPS[FoodInformation]
+
+    assert field_map["gramsPerUnit"] == "grams_per_unit"
+    assert field_map["grams_per_unit"] == "grams_per_unit"
+    assert RequestParser.FIELD_MAPS[Constraint]["minMax"] == "min_max"
+
+
+def test_parse_problem_data() -> None:
+    food_information, objective, constraints = (
+        RequestParser.parse_problem_data(_create_request_data())
+    )
+
+    assert food_information == [
+        FoodInformation(
+            name="boiled_egg",
+            energy=134,
+            protein=12.5,
+            fat=10.4,
+            carbohydrates=0.3,
+            grams_per_unit=50,
+            minimum_intake=1,
+            maximum_intake=3,
+        )
+    ]
+    assert objective == Objective(sense="maximize", nutrient="energy")
+    assert constraints == [
+        Constraint(min_max="max", nutrient="energy", unit="energy", value=1800)
+    ]
+
+
+def test_parse_problem_data_collects_all_errors() -> None:
+    data = _create_request_data(
+        foodInformation=[
+            _FOOD_INFORMATION_DATA,
+            {**_FOOD_INFORMATION_DATA, "energy": -1},
+            {**_FOOD_INFORMATION_DATA, "unknownField": 1},
+        ],
+        objective={"sense": "invalid", "nutrient": "energy"},
+        constraints="invalid",
+    )
+
+    with pytest.raises(RequestValidationError) as exception_info:
+        RequestParser.parse_problem_data(data)
+
+    errors = exception_info.value.errors
+    assert len(errors) == 4
+    assert errors[0].startswith("foodInformation[1]: Invalid values")
+    assert errors[1] == "foodInformation[2]: unknown field 'unknownField'."
+    assert errors[2].startswith("objective: Invalid sense")
+    assert errors[3] == "constraints must be a list."
+
+
+def test_parse_problem_data_limits_reported_errors() -> None:
+    data = _create_request_data(foodInformation=[None] * 25)
+
+    with pytest.raises(ValueError, match="and 5 more errors$"):
+        RequestParser.parse_problem_data(data)
+
+
+def test_parse_problem_data_rejects_non_object() -> None:
+    with pytest.raises(ValueError, match="request must be an object."):
+        RequestParser.parse_problem_data([])
+
+
+def test_parse_problem_data_with_food_catalog(tmp_path: Path) -> None:
+    food_catalog = FoodCatalog(os.path.join(tmp_path, "food_catalog.sqlite3"))
+    food_catalog.upsert(
+        [
+            {
+                "food_id": "egg",
+                "name": "boiled_egg",
+                "energy": 134,
+                "protein": 12.5,
+                "fat": 10.4,
+                "carbohydrates": 0.3,
+                "grams_per_unit": 50,
+            }
+        ]
+    )
+    data = _create_request_data(
+        foodInformation=[
+            {"foodId": "egg", "minimumIntake": 1, "maximumIntake": 3}
+        ]
+    )
+
+    food_information, _, _ = RequestParser.parse_problem_data(
+        data, food_catalog
+    )
+    assert food_information[0].name == "boiled_egg"
+
+    data["foodInformation"] = [
+        {"foodId": "unknown", "minimumIntake": 1, "maximumIntake": 3}
+    ]
+    with pytest.raises(ValueError, match="Unknown food id: unknown."):
+        RequestParser.parse_problem_data(data, food_catalog)
+
+
+def test_decode_json() -> None:
+    assert RequestParser.decode_json(b'{"sense": "maximize"}') == {
+        "sense": "maximize"
+    }
+
+    with pytest.raises(ValueError):
+        RequestParser.decode_json(b"{invalid")
+
+
+def test_parse_pareto_problem_data() -> None:
+    data = _create_request_data(
+        objectives=[_OBJECTIVE_DATA, {"sense": "minimize", "nutrient": "fat"}],
+        pointCount=10,
+    )
+
+    _, objectives, _, point_count = RequestParser.parse_pareto_problem_data(
+        data
+    )
+
+    assert objectives[1] == Objective(sense="minimize", nutrient="fat")
+    assert point_count == 10
+
+    data["pointCount"] = "10"
+    with pytest.raises(ValueError, match="pointCount must be an integer."):
+        RequestParser.parse_pareto_problem_data(data)
+
+
+def test_parse_meal_plan_data() -> None:
+    data = _create_request_data(
+        planConstraints=[{**_CONSTRAINT_DATA, "value": 12000}],
+        dayCount=7,
+        maxDaysPerFood=3,
+    )
+
+    _, _, constraints, plan_constraints, day_count, max_days_per_food = (
+        RequestParser.parse_meal_plan_data(data)
+    )
+
+    assert constraints[0].value == 1800
+    assert plan_constraints[0].value == 12000
+    assert day_count == 7
+    assert max_days_per_food == 3
+
+    data["maxDaysPerFood"] = "3"
+    with pytest.raises(ValueError, match="maxDaysPerFood must be an integer."):
+        RequestParser.parse_meal_plan_data(data)
+
+
+def test_parse_alternatives_problem_data() -> None:
+    data = _create_request_data(alternativeCount=3)
+
+    _, _, _, alternative_count, min_difference = (
+        RequestParser.parse_alternatives_problem_data(data)
+    )
+
+    assert alternative_count == 3
+    assert min_difference == 1
+
+    data["minDifference"] = "2"
+    with pytest.raises(ValueError, match="minDifference must be a number."):
+        RequestParser.parse_alternatives_problem_data(data)
@@ -0,0 +1,98 @@
+import gzip
+import json
+
+import pytest
+from flask import Request
+
+from src.response_encoder import ResponseEncoder
+
+_RESULT = {
+    "status": "Optimal",
+    "food_intakes": {"boiled_egg": 3, "natto_rice": 1},
+    "total_nutrient_values": {"energy": 500.0},
+    "solve_time": 0.01,
+}
+
+
+def _create_request(headers: dict | None = None) -> Request:
+    return Request.from_values(method="POST", headers=headers or {})
+
+
+def test_convert_keys_to_camel_case_recursively() -> None:
+    converted = ResponseEncoder.convert_keys_to_camel_case(
+        {"results": [_RESULT], "job_id": "abc"}
+    )
+
+    assert converted == {
+        "results": [
+            {
+                "status": "Optimal",
+                "foodIntakes": {"boiled_egg": 3, "natto_rice": 1},
+                "totalNutrientValues": {"energy": 500.0},
+                "solveTime": 0.01,
+            }
+        ],
+        "jobId": "abc",
+    }
+
+
+def test_create_response_without_compression() -> None:
+    response = ResponseEncoder().create_response(
+        _create_request({"Accept-Encoding": "gzip"}), _RESULT
+    )
+
+    assert response.status_code == 200
+    assert response.content_encoding is None
+    assert json.loads(response.get_data())["foodIntakes"]["boiled_egg"] == 3
+    assert "Accept-Encoding" in response.vary
+
+
+def test_create_response_with_gzip() -> None:
+    response = ResponseEncoder(compression_min_size=0).create_response(
+        _create_request({"Accept-Encoding": "gzip"}), _RESULT, etag="hash"
+    )
+
+    assert response.content_encoding == "gzip"
+    assert json.loads(gzip.decompress(response.get_data()))["status"] == (
+        "Optimal"
+    )
+    assert response.get_etag() == ("hash", True)
+
+
+def test_create_response_when_encoding_is_not_accepted() -> None:
+    response = ResponseEncoder(compression_min_size=0).create_response(
+        _create_request(), _RESULT
+    )
+
+    assert response.content_encoding is None
+
+
+def test_not_modified() -> None:
+    request = _create_request({"If-None-Match": 'W/"hash"'})
+
+    assert ResponseEncoder.is_not_modified(request, "hash")
+    assert not ResponseEncoder.is_not_modified(request, "other")
+    assert not ResponseEncoder.is_not_modified(_create_request(), "hash")
+
+    response = ResponseEncoder.create_not_modified_response("hash")
+    assert response.status_code == 304
+    assert response.get_etag() == ("hash", True)
+
+
+@pytest.mark.parametrize(
+    "compression_min_size, gzip_level", [(-1, 6), (1024, 0), (1024, 10)]
+)
+def test_invalid_settings(compression_min_size: int, gzip_level: int) -> None:
+    with pytest.raises(ValueError):
+        ResponseEncoder(compression_min_size, gzip_level)
+
+
+def test_from_environment(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("RESPONSE_COMPRESSION_MIN_SIZE", "0")
+    monkeypatch.setenv("RESPONSE_GZIP_LEVEL", "1")
+
+    response = ResponseEncoder.from_environment().create_response(
+        _create_request({"Accept-Encoding": "gzip"}), _RESULT
+    )
+
+    assert response.content_encoding == "gzip"
@@ -0,0 +1,93 @@
+import threading
+import time
+
+from src.single_flight import SingleFlight
+
+
+def _run_concurrently(
+    single_flight: SingleFlight,
+    solve_started: threading.Event,
+    release: threading.Event,
+    count: int,
+) -> list[dict]:
+    solve_count = 0
+
+    def solve() -> dict:
+        nonlocal solve_count
+        solve_count += 1
+        solve_started.set()
+        release.wait()
+        return {"status": "Optimal", "solve_count": solve_count}
+
+    results: list[dict] = []
+
+    def request() -> None:
+        results.append(single_flight.do("problem", solve))
+
+    threads = [threading.Thread(target=request) for _ in range(count)]
+    threads[0].start()
+    solve_started.wait()
+    for thread in threads[1:]:
+        thread.start()
+    while single_flight.stats()["coalesced"] < count - 1:
+        time.sleep(0.001)
+    release.set()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def test_do_coalesces_concurrent_requests() -> None:
+    single_flight = SingleFlight()
+
+    results = _run_concurrently(
+        single_flight, threading.Event(), threading.Event(), 5
+    )
+
+    assert results == [{"status": "Optimal", "solve_count": 1}] * 5
+    assert results[0] is not results[1]
+    assert single_flight.stats() == {"leader": 1, "coalesced": 4}
+
+
+def test_do_solves_again_after_completion() -> None:
+    single_flight = SingleFlight()
+
+    single_flight.do("problem", lambda: {"status": "Optimal"})
+    single_flight.do("problem", lambda: {"status": "Optimal"})
+    single_flight.do("other", lambda: {"status": "Optimal"})
+
+    assert single_flight.stats() == {"leader": 3, "coalesced": 0}
+
+
+def test_do_shares_exception() -> None:
+    single_flight = SingleFlight()
+    solve_started = threading.Event()
+    release = threading.Event()
+    errors: list[Exception] = []
+
+    def solve() -> dict:
+        solve_started.set()
+        release.wait()
+        raise RuntimeError("Solver failed")
+
+    def request() -> None:
+        try:
+            single_flight.do("problem", solve)
+        except RuntimeError as e:
+            errors.append(e)
+
+    leader = threading.Thread(target=request)
+    leader.start()
+    solve_started.wait()
+    follower = threading.Thread(target=request)
+    follower.start()
+    while single_flight.stats()["coalesced"] < 1:
+        time.sleep(0.001)
+    release.set()
+    leader.join()
+    follower.join()
+
+    assert [str(error) for error in errors] == ["Solver failed"] * 2
+    assert single_flight.do("problem", lambda: {"status": "Optimal"}) == {
+        "status": "Optimal"
+    }
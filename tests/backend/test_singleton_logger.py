@@ -1,8 +1,15 @@
 import logging
+import multiprocessing
+import os
+import queue
 from logging import Logger, StreamHandler
 from logging.handlers import RotatingFileHandler
+from pathlib import Path
+from typing import Generator
 
-from src.singleton_logger import SingletonLogger
+import pytest
+
+from src.singleton_logger import DroppingQueueHandler, SingletonLogger
 
 
 def test_singleton_logger_instance() -> None:
@@ -74,3 +81,104 @@ def test_rotating_file_handler_settings() -> None:
         rotating_file_handler.formatter._fmt
         == "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     )
+
+
+def _create_log_record(message: str) -> logging.LogRecord:
+    return logging.makeLogRecord({"msg": message, "levelno": logging.INFO})
+
+
+def test_dropping_queue_handler_drops_newest_record() -> None:
+    record_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(1)
+    handler = DroppingQueueHandler(record_queue, "newest")
+
+    handler.enqueue(_create_log_record("first"))
+    handler.enqueue(_create_log_record("second"))
+
+    assert handler.dropped_records == 1
+    assert record_queue.get_nowait().msg == "first"
+
+
+def test_dropping_queue_handler_drops_oldest_record() -> None:
+    record_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(1)
+    handler = DroppingQueueHandler(record_queue, "oldest")
+
+    handler.enqueue(_create_log_record("first"))
+    handler.enqueue(_create_log_record("second"))
+
+    assert handler.dropped_records == 1
+    assert record_queue.get_nowait().msg == "second"
+
+
+def test_invalid_drop_policy() -> None:
+    with pytest.raises(ValueError, match="Invalid log queue drop policy"):
+        DroppingQueueHandler(queue.Queue(1), "invalid")
+
+
+@pytest.fixture
+def queued_logger(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> Generator[Logger, None, None]:
+    logger = SingletonLogger.get_logger()
+    original_handlers = logger.handlers[:]
+
+    monkeypatch.setenv("LOG_QUEUE", "true")
+    monkeypatch.setenv("LOG_PATH", os.path.join(tmp_path, "app.log"))
+    monkeypatch.setattr(SingletonLogger, "_logger", None)
+    logger.handlers.clear()
+    try:
+        yield SingletonLogger.get_logger()
+    finally:
+        SingletonLogger.shutdown()
+        for handler in logger.handlers:
+            handler.close()
+        logger.handlers[:] = original_handlers
+
+
+def test_queued_logger_writes_records_on_shutdown(
+    queued_logger: Logger, tmp_path: Path
+) -> None:
+    queued_logger.critical("queued message")
+    SingletonLogger.shutdown()
+
+    assert [type(handler) for handler in queued_logger.handlers] == [
+        DroppingQueueHandler
+    ]
+    assert SingletonLogger.get_dropped_record_count() == 0
+    with open(os.path.join(tmp_path, "app.log"), encoding="utf-8") as log:
+        assert "queued message" in log.read()
+
+
+def _log_critical(message: str) -> None:
+    SingletonLogger.get_logger().critical(message)
+
+
+def test_queued_logger_writes_records_from_forked_process(
+    queued_logger: Logger, tmp_path: Path
+) -> None:
+    process = multiprocessing.get_context("fork").Process(
+        target=_log_critical, args=("forked message",)
+    )
+    process.start()
+    process.join()
+
+    assert process.exitcode == 0
+    with open(os.path.join(tmp_path, "app.log"), encoding="utf-8") as log:
+        assert "forked message" in log.read()
+
+
+def test_queued_logger_writes_records_from_forked_worker(
+    queued_logger: Logger, tmp_path: Path
+) -> None:
+    pid = os.fork()
+    if pid == 0:  # pragma: no cover
+        try:
+            SingletonLogger.get_logger().critical("worker message")
+            SingletonLogger.shutdown()
+        finally:
+            os._exit(0)
+
+    _, status = os.waitpid(pid, 0)
+
+    assert os.waitstatus_to_exitcode(status) == 0
+    with open(os.path.join(tmp_path, "app.log"), encoding="utf-8") as log:
+        assert "worker message" in log.read()
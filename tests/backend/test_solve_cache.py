@@ -0,0 +1,343 @@
+import os
+import socketserver
+import threading
+import time
+from pathlib import Path
+from typing import BinaryIO, Callable, Generator
+from unittest import mock
+
+import pytest
+
+from src.constraint import Constraint
+from src.food_information import FoodInformation
+from src.objective import Objective
+from src.solve_cache import (
+    InMemoryCacheBackend,
+    RedisCacheBackend,
+    SolveCache,
+    SQLiteCacheBackend,
+)
+
+_FOOD_INFORMATION = [
+    FoodInformation(
+        name="boiled_egg",
+        energy=134,
+        protein=12.5,
+        fat=10.4,
+        carbohydrates=0.3,
+        grams_per_unit=50,
+        minimum_intake=1,
+        maximum_intake=3,
+    ),
+]
+
+_OBJECTIVE = Objective(sense="maximize", nutrient="energy")
+
+_CONSTRAINTS = [
+    Constraint(
+        min_max="max",
+        nutrient="energy",
+        unit="energy",
+        value=200,
+    ),
+]
+
+_OPTIMAL_RESULT = {"status": "Optimal", "food_intakes": {"boiled_egg": 2.0}}
+
+
+def test_compute_key_is_stable() -> None:
+    key1 = SolveCache.compute_key(_FOOD_INFORMATION, _OBJECTIVE, _CONSTRAINTS)
+    key2 = SolveCache.compute_key(
+        list(_FOOD_INFORMATION), _OBJECTIVE, list(_CONSTRAINTS)
+    )
+
+    assert key1 == key2
+
+
+def test_compute_key_ignores_int_float_difference() -> None:
+    float_food_information = [
+        FoodInformation(
+            name="boiled_egg",
+            energy=134.0,
+            protein=12.5,
+            fat=10.4,
+            carbohydrates=0.3,
+            grams_per_unit=50,
+            minimum_intake=1,
+            maximum_intake=3,
+        ),
+    ]
+
+    assert SolveCache.compute_key(
+        _FOOD_INFORMATION, _OBJECTIVE, _CONSTRAINTS
+    ) == SolveCache.compute_key(
+        float_food_information, _OBJECTIVE, _CONSTRAINTS
+    )
+
+
+def test_compute_key_differs_for_different_problems() -> None:
+    minimize_objective = Objective(sense="minimize", nutrient="energy")
+
+    assert SolveCache.compute_key(
+        _FOOD_INFORMATION, _OBJECTIVE, _CONSTRAINTS
+    ) != SolveCache.compute_key(
+        _FOOD_INFORMATION, minimize_objective, _CONSTRAINTS
+    )
+
+
+def test_in_memory_backend_evicts_least_recently_used() -> None:
+    backend = InMemoryCacheBackend(max_size=2, ttl=60)
+    backend.set("a", "1")
+    backend.set("b", "2")
+    backend.get("a")
+    backend.set("c", "3")
+
+    assert backend.get("a") == "1"
+    assert backend.get("b") is None
+    assert backend.get("c") == "3"
+
+
+def test_in_memory_backend_expires_entries() -> None:
+    backend = InMemoryCacheBackend(max_size=2, ttl=60)
+    with mock.patch("src.solve_cache.time.monotonic", return_value=0):
+        backend.set("a", "1")
+    with mock.patch("src.solve_cache.time.monotonic", return_value=61):
+        assert backend.get("a") is None
+
+
+def test_sqlite_backend(tmp_path: Path) -> None:
+    path = os.path.join(tmp_path, "solve_cache.sqlite3")
+    backend = SQLiteCacheBackend(path, max_size=2, ttl=60)
+    backend.set("a", "1")
+    backend.set("b", "2")
+    backend.set("c", "3")
+
+    assert backend.get("a") is None
+    assert backend.get("b") == "2"
+    assert backend.get("c") == "3"
+
+    backend.clear()
+    assert backend.get("b") is None
+
+
+class _FakeRedisServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), _FakeRedisHandler)
+        self.values: dict[str, tuple[str, float]] = {}
+        self.index: dict[str, float] = {}
+        self.commands: list[list[str]] = []
+        self.error: str | None = None
+        self.connection_count = 0
+
+    @property
+    def url(self) -> str:
+        return "redis://%s:%d/1" % self.server_address
+
+    def _get(self, key: str) -> str | None:
+        value, expires_at = self.values.get(key, (None, 0.0))
+        return value if time.monotonic() < expires_at else None
+
+    def _set(self, key: str, value: str, _: str, milliseconds: str) -> str:
+        self.values[key] = (value, time.monotonic() + int(milliseconds) / 1000)
+        return "OK"
+
+    def _zadd(self, _: str, score: str, key: str) -> int:
+        self.index[key] = float(score)
+        return 1
+
+    def _zrem(self, _: str, key: str) -> int:
+        return int(self.index.pop(key, None) is not None)
+
+    def _zcard(self, _: str) -> int:
+        return len(self.index)
+
+    def _zrange(self, *_: str) -> list[str]:
+        return sorted(self.index, key=self.index.__getitem__)
+
+    def _zpopmin(self, _: str, count: str) -> list[str]:
+        popped = self._zrange()[: int(count)]
+        for key in popped:
+            del self.index[key]
+        return [item for key in popped for item in (key, "0")]
+
+    def _delete(self, *keys: str) -> int:
+        for key in keys:
+            self.values.pop(key, None)
+            self.index.pop(key, None)
+        return len(keys)
+
+    def execute(self, command: list[str]) -> object:
+        handlers: dict[str, Callable[..., object]] = {
+            "GET": self._get,
+            "SET": self._set,
+            "ZADD": self._zadd,
+            "ZREM": self._zrem,
+            "ZCARD": self._zcard,
+            "ZRANGE": self._zrange,
+            "ZPOPMIN": self._zpopmin,
+            "DEL": self._delete,
+        }
+        name, *args = command
+        handler = handlers.get(name)
+        return "OK" if handler is None else handler(*args)
+
+
+class _FakeRedisHandler(socketserver.StreamRequestHandler):
+    server: _FakeRedisServer
+
+    def _read_command(self) -> list[str] | None:
+        line = self.rfile.readline()
+        if not line:
+            return None
+        command = []
+        for _ in range(int(line[1:])):
+            length = int(self.rfile.readline()[1:])
+            command.append(self.rfile.read(length + 2)[:-2].decode())
+        return command
+
+    @staticmethod
+    def _write_reply(wfile: BinaryIO, reply: object) -> None:
+        if reply is None:
+            wfile.write(b"$-1\r\n")
+        elif isinstance(reply, int):
+            wfile.write(b":%d\r\n" % reply)
+        elif isinstance(reply, list):
+            wfile.write(b"*%d\r\n" % len(reply))
+            for item in reply:
+                _FakeRedisHandler._write_reply(wfile, item)
+        else:
+            encoded_reply = str(reply).encode()
+            wfile.write(b"$%d\r\n%s\r\n" % (len(encoded_reply), encoded_reply))
+
+    def handle(self) -> None:
+        self.server.connection_count += 1
+        while (command := self._read_command()) is not None:
+            self.server.commands.append(command)
+            if self.server.error == "disconnect":
+                self.server.error = None
+                return
+            if self.server.error is not None:
+                self.wfile.write(b"-%s\r\n" % self.server.error.encode())
+                self.server.error = None
+                continue
+            self._write_reply(self.wfile, self.server.execute(command))
+
+
+@pytest.fixture
+def redis_server() -> Generator[_FakeRedisServer, None, None]:
+    redis_server = _FakeRedisServer()
+    thread = threading.Thread(
+        target=redis_server.serve_forever, args=(0.01,), daemon=True
+    )
+    thread.start()
+    try:
+        yield redis_server
+    finally:
+        redis_server.shutdown()
+        redis_server.server_close()
+
+
+def test_redis_backend(redis_server: _FakeRedisServer) -> None:
+    backend = RedisCacheBackend(redis_server.url, max_size=2, ttl=60)
+
+    assert backend.get("a") is None
+    backend.set("a", "1")
+    backend.set("b", "2")
+    backend.set("c", "3")
+
+    assert backend.get("a") is None
+    assert backend.get("b") == "2"
+    assert backend.get("c") == "3"
+    assert redis_server.commands[0] == ["SELECT", "1"]
+    assert [
+        "SET",
+        "nutrition_optimizer:solve:a",
+        "1",
+        "PX",
+        "60000",
+    ] in redis_server.commands
+
+    backend.clear()
+    assert backend.get("b") is None
+    assert redis_server.index == {}
+
+
+def test_redis_backend_expires_entries(redis_server: _FakeRedisServer) -> None:
+    backend = RedisCacheBackend(redis_server.url, max_size=2, ttl=0.001)
+    backend.set("a", "1")
+    time.sleep(0.01)
+
+    assert backend.get("a") is None
+    assert redis_server.commands[-1] == [
+        "ZREM",
+        "nutrition_optimizer:solve_index",
+        "nutrition_optimizer:solve:a",
+    ]
+    assert redis_server.index == {}
+
+
+def test_redis_backend_raises_error_reply(
+    redis_server: _FakeRedisServer,
+) -> None:
+    backend = RedisCacheBackend(redis_server.url, max_size=2, ttl=60)
+    backend.set("a", "1")
+    redis_server.error = "ERR out of memory"
+
+    with pytest.raises(RuntimeError, match="Redis error: ERR out of memory"):
+        backend.get("a")
+
+    assert backend.get("a") == "1"
+    assert redis_server.connection_count == 2
+
+
+def test_redis_backend_reconnects(redis_server: _FakeRedisServer) -> None:
+    solve_cache = SolveCache(
+        RedisCacheBackend(redis_server.url, max_size=2, ttl=60)
+    )
+    key = SolveCache.compute_key(_FOOD_INFORMATION, _OBJECTIVE, _CONSTRAINTS)
+    solve_cache.set(key, _OPTIMAL_RESULT)
+    redis_server.error = "disconnect"
+
+    assert solve_cache.get(key) is None
+    assert solve_cache.get(key) == _OPTIMAL_RESULT
+    assert redis_server.connection_count == 2
+    assert solve_cache.stats() == {"hits": 1, "misses": 1}
+
+
+def test_get_or_solve_counts_hits_and_misses() -> None:
+    solve_cache = SolveCache(InMemoryCacheBackend(max_size=2, ttl=60))
+    solve = mock.Mock(return_value=_OPTIMAL_RESULT)
+
+    for _ in range(3):
+        result = solve_cache.get_or_solve(
+            _FOOD_INFORMATION, _OBJECTIVE, _CONSTRAINTS, solve
+        )
+        assert result == _OPTIMAL_RESULT
+
+    solve.assert_called_once()
+    assert solve_cache.stats() == {"hits": 2, "misses": 1}
+
+
+def test_non_cacheable_status_is_not_stored() -> None:
+    solve_cache = SolveCache(InMemoryCacheBackend(max_size=2, ttl=60))
+    solve = mock.Mock(return_value={"status": "Not Solved"})
+
+    for _ in range(2):
+        solve_cache.get_or_solve(
+            _FOOD_INFORMATION, _OBJECTIVE, _CONSTRAINTS, solve
+        )
+
+    assert solve.call_count == 2
+
+
+def test_from_environment_invalid_backend() -> None:
+    with mock.patch.dict(os.environ, {"SOLVE_CACHE_BACKEND": "invalid"}):
+        with pytest.raises(ValueError, match="Invalid solve cache backend"):
+            SolveCache.from_environment()
+
+
+def test_from_environment_disabled() -> None:
+    with mock.patch.dict(os.environ, {"SOLVE_CACHE_BACKEND": "none"}):
+        assert SolveCache.from_environment() is None
@@ -0,0 +1,342 @@
+from dataclasses import replace
+from unittest import mock
+
+import numpy as np
+import pytest
+
+from src.constraint import Constraint
+from src.food_information import FoodInformation
+from src.model_builder import LinearModel, ModelBuilder
+from src.objective import Objective
+from src.solver_backend import (
+    CbcSolverBackend,
+    EnumerationSolverBackend,
+    HighsSolverBackend,
+    RoundingSolverBackend,
+    SolverBackend,
+)
+from src.solver_settings import SolverSettings
+
+_FOOD_INFORMATION = [
+    FoodInformation(
+        name="boiled_egg",
+        energy=134,
+        protein=12.5,
+        fat=10.4,
+        carbohydrates=0.3,
+        grams_per_unit=50,
+        minimum_intake=1,
+        maximum_intake=3,
+    ),
+]
+
+_OBJECTIVE = Objective(sense="maximize", nutrient="energy")
+
+_CONSTRAINTS = [
+    Constraint(
+        min_max="max",
+        nutrient="energy",
+        unit="energy",
+        value=200,
+    ),
+    Constraint(
+        min_max="min",
+        nutrient="fat",
+        unit="ratio",
+        value=20,
+    ),
+]
+
+_INFEASIBLE_CONSTRAINTS = [
+    Constraint(
+        min_max="max",
+        nutrient="energy",
+        unit="energy",
+        value=1,
+    ),
+]
+
+
+def test_highs_solver_backend() -> None:
+    linear_model = ModelBuilder(_FOOD_INFORMATION).build_linear_model(
+        _OBJECTIVE, _CONSTRAINTS
+    )
+
+    result = HighsSolverBackend().solve(
+        linear_model, SolverSettings(solver="highs")
+    )
+
+    assert result.status == "Optimal"
+    assert result.food_intakes == {"boiled_egg": 2.0}
+    assert result.gap == 0.0
+
+
+def test_highs_solver_backend_reports_unknown_gap() -> None:
+    linear_model = ModelBuilder(_FOOD_INFORMATION).build_linear_model(
+        _OBJECTIVE, _CONSTRAINTS
+    )
+    highs_solver_backend = HighsSolverBackend()
+    highs = mock.Mock()
+    highs.getSolution.return_value.col_value = [2.0]
+    highs.getInfo.return_value.mip_gap = float("inf")
+
+    with mock.patch.object(
+        highs_solver_backend, "_get_status", return_value="Feasible"
+    ):
+        result = highs_solver_backend._read_result(highs, linear_model)
+
+    assert result.status == "Feasible"
+    assert result.gap == 1.0
+
+
+def test_highs_solver_backend_infeasible() -> None:
+    linear_model = ModelBuilder(_FOOD_INFORMATION).build_linear_model(
+        _OBJECTIVE, _INFEASIBLE_CONSTRAINTS
+    )
+
+    result = HighsSolverBackend().solve(
+        linear_model, SolverSettings(solver="highs")
+    )
+
+    assert result.status == "Infeasible"
+    assert result.food_intakes == {}
+
+
+@pytest.mark.parametrize(
+    "solver_backend", [CbcSolverBackend(), HighsSolverBackend()]
+)
+def test_solver_backends_agree(solver_backend: SolverBackend) -> None:
+    linear_model = ModelBuilder(_FOOD_INFORMATION).build_linear_model(
+        _OBJECTIVE, _CONSTRAINTS
+    )
+
+    result = solver_backend.solve(
+        linear_model, SolverSettings(), np.array([1.0])
+    )
+    infeasible_result = solver_backend.solve(
+        ModelBuilder(_FOOD_INFORMATION).build_linear_model(
+            _OBJECTIVE, _INFEASIBLE_CONSTRAINTS
+        ),
+        SolverSettings(),
+    )
+
+    assert result.status == "Optimal"
+    assert result.food_intakes == {"boiled_egg": 2.0}
+    assert infeasible_result.status == "Infeasible"
+
+
+@pytest.mark.parametrize(
+    "solver_backend", [CbcSolverBackend(), HighsSolverBackend()]
+)
+def test_solve_row_bound_sequence(solver_backend: SolverBackend) -> None:
+    linear_model = ModelBuilder(_FOOD_INFORMATION).build_linear_model(
+        _OBJECTIVE, _CONSTRAINTS
+    )
+
+    results = solver_backend.solve_row_bound_sequence(
+        linear_model,
+        SolverSettings(),
+        0,
+        [(-np.inf, 1000.0), (-np.inf, 140.0), (-np.inf, 1.0)],
+    )
+
+    assert [result.food_intakes for result in results] == [
+        {"boiled_egg": 3.0},
+        {"boiled_egg": 2.0},
+        {},
+    ]
+    assert results[2].status == "Infeasible"
+
+
+def test_solve_row_bound_sequence_reuses_optimal_solution() -> None:
+    linear_model = ModelBuilder(_FOOD_INFORMATION).build_linear_model(
+        _OBJECTIVE, _CONSTRAINTS
+    )
+    solver_backend = CbcSolverBackend()
+
+    with mock.patch.object(
+        solver_backend, "solve", wraps=solver_backend.solve
+    ) as solve:
+        results = solver_backend.solve_row_bound_sequence(
+            linear_model,
+            SolverSettings(),
+            0,
+            [(-np.inf, 150.0), (-np.inf, 140.0), (-np.inf, 135.0)],
+        )
+
+    assert solve.call_count == 1
+    assert all(
+        result.food_intakes == {"boiled_egg": 2.0} for result in results
+    )
+
+
+@pytest.mark.parametrize(
+    "solver_backend", [CbcSolverBackend(), HighsSolverBackend()]
+)
+def test_solve_alternatives(solver_backend: SolverBackend) -> None:
+    linear_model = ModelBuilder(_FOOD_INFORMATION).build_linear_model(
+        _OBJECTIVE, _CONSTRAINTS
+    )
+
+    results = solver_backend.solve_alternatives(
+        linear_model, SolverSettings(), 5, 1
+    )
+
+    assert [result.food_intakes for result in results] == [
+        {"boiled_egg": 2.0},
+        {"boiled_egg": 1.0},
+        {},
+    ]
+    assert results[2].status == "Infeasible"
+
+    results = solver_backend.solve_alternatives(
+        linear_model, SolverSettings(), 5, 2
+    )
+
+    assert [result.status for result in results] == ["Optimal", "Infeasible"]
+
+
+def test_rounding_solver_backend() -> None:
+    food_information = [
+        *_FOOD_INFORMATION,
+        FoodInformation(
+            name="chicken_breast",
+            energy=105,
+            protein=23.3,
+            fat=1.9,
+            carbohydrates=0.1,
+            grams_per_unit=100,
+            minimum_intake=0,
+            maximum_intake=2,
+        ),
+    ]
+    linear_model = ModelBuilder(food_information).build_linear_model(
+        Objective(sense="maximize", nutrient="protein"), _CONSTRAINTS
+    )
+
+    result = RoundingSolverBackend().solve(linear_model, SolverSettings())
+    exact_result = HighsSolverBackend().solve(linear_model, SolverSettings())
+    values = SolverBackend.to_vector(linear_model, result)
+
+    assert result.status in ["Optimal", "Feasible"]
+    assert np.all(
+        linear_model.constraint_matrix @ values
+        >= linear_model.constraint_lower - 1e-6
+    )
+    assert np.all(
+        linear_model.constraint_matrix @ values
+        <= linear_model.constraint_upper + 1e-6
+    )
+    assert linear_model.objective_coefficients @ values <= (
+        linear_model.objective_coefficients
+        @ SolverBackend.to_vector(linear_model, exact_result)
+    )
+    assert result.gap >= 0.0
+
+
+def test_rounding_solver_backend_reports_tiny_gap_as_feasible() -> None:
+    linear_model = ModelBuilder(_FOOD_INFORMATION).build_linear_model(
+        _OBJECTIVE, _CONSTRAINTS
+    )
+    rounding_solver_backend = RoundingSolverBackend()
+
+    with (
+        mock.patch.object(
+            rounding_solver_backend,
+            "_solve_relaxation",
+            return_value=("Optimal", np.array([2.00001])),
+        ),
+        mock.patch.object(
+            rounding_solver_backend, "_round", return_value=np.array([2.0])
+        ),
+    ):
+        result = rounding_solver_backend.solve(linear_model, SolverSettings())
+
+    assert result.status == "Feasible"
+    assert result.gap == 0.0
+
+
+def test_rounding_solver_backend_infeasible() -> None:
+    linear_model = ModelBuilder(_FOOD_INFORMATION).build_linear_model(
+        _OBJECTIVE, _INFEASIBLE_CONSTRAINTS
+    )
+
+    result = RoundingSolverBackend().solve(linear_model, SolverSettings())
+
+    assert result.status == "Infeasible"
+    assert result.food_intakes == {}
+
+
+def _create_random_linear_model(seed: int) -> LinearModel:
+    random = np.random.default_rng(seed)
+    food_information = []
+    for index in range(int(random.integers(1, 10))):
+        minimum_intake = int(random.integers(0, 3))
+        food_information.append(
+            FoodInformation(
+                name=f"food_{index}",
+                energy=float(random.integers(50, 400)),
+                protein=float(random.uniform(0, 30)),
+                fat=float(random.uniform(0, 30)),
+                carbohydrates=float(random.uniform(0, 60)),
+                grams_per_unit=float(random.integers(20, 150)),
+                minimum_intake=minimum_intake,
+                maximum_intake=minimum_intake + int(random.integers(0, 4)),
+            )
+        )
+    constraints = [
+        Constraint(
+            min_max="max",
+            nutrient="energy",
+            unit="energy",
+            value=float(random.integers(800, 2500)),
+        ),
+        Constraint(
+            min_max="min",
+            nutrient="protein",
+            unit="amount",
+            value=float(random.integers(10, 80)),
+        ),
+        Constraint(
+            min_max=str(random.choice(["min", "max"])),
+            nutrient="fat",
+            unit="ratio",
+            value=float(random.integers(15, 40)),
+        ),
+    ]
+    objective = Objective(
+        sense=str(random.choice(["maximize", "minimize"])),
+        nutrient=str(random.choice(FoodInformation.NUTRIENTS)),
+    )
+    return ModelBuilder(food_information).build_linear_model(
+        objective, constraints
+    )
+
+
+@pytest.mark.parametrize("seed", range(30))
+def test_enumeration_solver_backend_matches_cbc(seed: int) -> None:
+    linear_model = _create_random_linear_model(seed)
+
+    result = EnumerationSolverBackend().solve(linear_model, SolverSettings())
+    cbc_result = CbcSolverBackend().solve(linear_model, SolverSettings())
+
+    assert result.status == cbc_result.status
+    if result.status == "Optimal":
+        assert linear_model.objective_coefficients @ (
+            SolverBackend.to_vector(linear_model, result)
+        ) == pytest.approx(
+            linear_model.objective_coefficients
+            @ SolverBackend.to_vector(linear_model, cbc_result)
+        )
+
+
+def test_enumeration_solver_backend_rejects_large_problem() -> None:
+    linear_model = ModelBuilder(
+        [replace(_FOOD_INFORMATION[0], maximum_intake=10**7)]
+    ).build_linear_model(_OBJECTIVE, _CONSTRAINTS)
+
+    assert not EnumerationSolverBackend.supports(linear_model)
+    assert (
+        EnumerationSolverBackend().solve(linear_model, SolverSettings()).status
+        == "Not Solved"
+    )
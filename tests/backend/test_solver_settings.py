@@ -0,0 +1,101 @@
+import os
+import re
+from unittest import mock
+
+import pytest
+
+from src.solver_settings import SolverSettings
+
+
+def test_default_solver_settings() -> None:
+    solver_settings = SolverSettings()
+
+    assert solver_settings.solver == "cbc"
+    assert solver_settings.time_limit is None
+    assert solver_settings.is_exact
+    assert solver_settings.is_default
+    assert SolverSettings(threads=4).is_default
+    assert not SolverSettings(solver="highs").is_default
+
+
+def test_invalid_solver() -> None:
+    with pytest.raises(
+        ValueError,
+        match=re.escape(
+            "Invalid solver: invalid_solver."
+            " Valid solvers are ['cbc', 'highs']."
+        ),
+    ):
+        SolverSettings(solver="invalid_solver")
+
+
+def test_non_positive_time_limit() -> None:
+    with pytest.raises(
+        ValueError, match="Time limit must be greater than zero. Got 0."
+    ):
+        SolverSettings(time_limit=0)
+
+
+def test_negative_gap() -> None:
+    with pytest.raises(
+        ValueError,
+        match="Both relative_gap and absolute_gap must be non-negative.",
+    ):
+        SolverSettings(relative_gap=-0.1)
+
+
+def test_non_positive_threads() -> None:
+    with pytest.raises(
+        ValueError, match="Threads must be greater than zero. Got 0."
+    ):
+        SolverSettings(threads=0)
+
+
+def test_invalid_mode() -> None:
+    with pytest.raises(
+        ValueError,
+        match=re.escape(
+            "Invalid mode: fast. Valid modes are ['exact', 'approximate']."
+        ),
+    ):
+        SolverSettings(mode="fast")
+
+
+def test_approximate_mode_is_not_exact() -> None:
+    assert not SolverSettings(mode="approximate").is_exact
+
+
+def test_merge() -> None:
+    solver_settings = SolverSettings(time_limit=10).merge(
+        {"relative_gap": 0.01}
+    )
+
+    assert solver_settings.time_limit == 10
+    assert solver_settings.relative_gap == 0.01
+    assert not solver_settings.is_exact
+    assert not solver_settings.is_default
+
+
+def test_from_environment() -> None:
+    environment = {
+        "SOLVER": "highs",
+        "SOLVER_TIME_LIMIT": "5",
+        "SOLVER_RELATIVE_GAP": "",
+        "SOLVER_THREADS": "2",
+        "SOLVER_MODE": "approximate",
+    }
+    with mock.patch.dict(os.environ, environment):
+        solver_settings = SolverSettings.from_environment()
+
+    assert solver_settings.solver == "highs"
+    assert solver_settings.time_limit == 5.0
+    assert solver_settings.relative_gap is None
+    assert solver_settings.threads == 2
+    assert solver_settings.mode == "approximate"
+
+
+def test_create_solver() -> None:
+    solver = SolverSettings(time_limit=5, threads=2).create_solver()
+
+    assert solver.name == "PULP_CBC_CMD"
+    assert solver.timeLimit == 5
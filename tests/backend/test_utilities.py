@@ -1,11 +1,15 @@
+import os
+from pathlib import Path
 from unittest.mock import MagicMock
 
 import pytest
 from flask import Request
 
 from src.constraint import Constraint
+from src.food_catalog import FoodCatalog
 from src.food_information import FoodInformation
 from src.objective import Objective
+from src.solver_settings import SolverSettings
 from src.utilities import Utilities
 
 _FOOD_INFORMATION_DATA = [
@@ -83,6 +87,176 @@ def test_parse_invalid_request_data() -> None:
         Utilities.parse_request_data(mock_request)
 
 
+def test_load_request_json() -> None:
+    request = Request.from_values(
+        method="POST",
+        data=b'{"objective": {"sense": "maximize"}}',
+        content_type="application/json",
+    )
+
+    assert Utilities.load_request_json(request) == {
+        "objective": {"sense": "maximize"}
+    }
+
+
+def test_load_invalid_request_json() -> None:
+    request = Request.from_values(
+        method="POST", data=b"{invalid", content_type="application/json"
+    )
+    with pytest.raises(ValueError, match="Error processing request data"):
+        Utilities.load_request_json(request)
+
+    request = Request.from_values(method="POST", data=b"{}")
+    with pytest.raises(
+        ValueError, match="Error processing request data: InvalidRequest"
+    ):
+        Utilities.load_request_json(request)
+
+
+def test_parse_solver_settings() -> None:
+    data = {"solverSettings": {"timeLimit": 5, "relativeGap": 0.01}}
+
+    solver_settings = Utilities.parse_solver_settings(
+        data, SolverSettings(threads=2)
+    )
+
+    assert solver_settings.time_limit == 5
+    assert solver_settings.relative_gap == 0.01
+    assert solver_settings.threads == 2
+
+
+def test_parse_missing_solver_settings() -> None:
+    default_solver_settings = SolverSettings(threads=2)
+
+    solver_settings = Utilities.parse_solver_settings(
+        {}, default_solver_settings
+    )
+
+    assert solver_settings == default_solver_settings
+
+
+def test_parse_invalid_solver_settings() -> None:
+    data = {"solverSettings": {"unknownSetting": 1}}
+
+    with pytest.raises(ValueError, match="Error processing solver settings"):
+        Utilities.parse_solver_settings(data, SolverSettings())
+
+
+def test_parse_warm_start() -> None:
+    data = {"previousFoodIntakes": {"boiled_egg": 2}}
+
+    warm_start = Utilities.parse_warm_start(data)
+
+    assert warm_start is not None
+    assert Utilities.parse_warm_start({}) is None
+
+
+def test_parse_invalid_warm_start() -> None:
+    data = {"previousFoodIntakes": {"boiled_egg": "invalid"}}
+
+    with pytest.raises(
+        ValueError, match="Error processing previous food intakes"
+    ):
+        Utilities.parse_warm_start(data)
+
+
+def test_parse_session_id() -> None:
+    assert Utilities.parse_session_id({"sessionId": "abc"}) == "abc"
+    assert Utilities.parse_session_id({}) is None
+
+    with pytest.raises(ValueError, match="sessionId must be a string."):
+        Utilities.parse_session_id({"sessionId": 1})
+
+
+def test_parse_diagnose() -> None:
+    assert Utilities.parse_diagnose({"diagnose": True})
+    assert not Utilities.parse_diagnose({})
+
+    with pytest.raises(ValueError, match="diagnose must be a boolean."):
+        Utilities.parse_diagnose({"diagnose": "true"})
+
+
+def test_parse_request_data_with_food_catalog(tmp_path: Path) -> None:
+    food_catalog = FoodCatalog(os.path.join(tmp_path, "food_catalog.sqlite3"))
+    food_catalog.upsert(
+        [
+            {
+                "food_id": "egg",
+                "name": "boiled_egg",
+                "energy": 134,
+                "protein": 12.5,
+                "fat": 10.4,
+                "carbohydrates": 0.3,
+                "grams_per_unit": 50,
+            }
+        ]
+    )
+    mock_request = MagicMock(spec=Request)
+    mock_request.json = {
+        "foodInformation": [
+            {"foodId": "egg", "minimumIntake": 1, "maximumIntake": 3}
+        ],
+        "objective": _OBJECTIVE_DATA,
+        "constraints": _CONSTRAINTS_DATA,
+    }
+
+    food_information, _, _ = Utilities.parse_request_data(
+        mock_request, food_catalog
+    )
+
+    assert food_information == [
+        FoodInformation(
+            name="boiled_egg",
+            energy=134,
+            protein=12.5,
+            fat=10.4,
+            carbohydrates=0.3,
+            grams_per_unit=50,
+            minimum_intake=1,
+            maximum_intake=3,
+        )
+    ]
+
+
+def test_parse_food_catalog_request_data() -> None:
+    mock_request = MagicMock(spec=Request)
+    mock_request.json = {"foods": [{"foodId": "egg", "gramsPerUnit": 50}]}
+
+    foods = Utilities.parse_food_catalog_request_data(mock_request)
+
+    assert foods == [{"food_id": "egg", "grams_per_unit": 50}]
+
+
+def test_parse_invalid_food_catalog_request_data() -> None:
+    mock_request = MagicMock(spec=Request)
+    mock_request.json = {"foods": "invalid"}
+
+    with pytest.raises(ValueError, match="foods must be a list."):
+        Utilities.parse_food_catalog_request_data(mock_request)
+
+
+def test_parse_batch_request_data() -> None:
+    problem = {
+        "foodInformation": _FOOD_INFORMATION_DATA,
+        "objective": _OBJECTIVE_DATA,
+        "constraints": _CONSTRAINTS_DATA,
+    }
+    mock_request = MagicMock(spec=Request)
+    mock_request.json = {"problems": [problem, problem]}
+
+    problems = Utilities.parse_batch_request_data(mock_request)
+
+    assert problems == [problem, problem]
+
+
+def test_parse_invalid_batch_request_data() -> None:
+    mock_request = MagicMock(spec=Request)
+    mock_request.json = {"problems": "invalid"}
+
+    with pytest.raises(ValueError, match="problems must be a list."):
+        Utilities.parse_batch_request_data(mock_request)
+
+
 def test_convert_keys_to_camel_case() -> None:
     response = {"status": "Optimal", "food_intake": {"boiled_egg": 3}}
     result = Utilities.convert_keys_to_camel_case(response)
@@ -0,0 +1,145 @@
+import pytest
+
+from src.constraint import Constraint
+from src.food_information import FoodInformation
+from src.model_builder import LinearModel, ModelBuilder
+from src.objective import Objective
+from src.warm_start import WarmStart, WarmStartSessionStore
+
+_FOOD_INFORMATION = [
+    FoodInformation(
+        name="boiled_egg",
+        energy=134,
+        protein=12.5,
+        fat=10.4,
+        carbohydrates=0.3,
+        grams_per_unit=50,
+        minimum_intake=1,
+        maximum_intake=3,
+    ),
+    FoodInformation(
+        name="broccoli",
+        energy=30,
+        protein=3.9,
+        fat=0.4,
+        carbohydrates=5.2,
+        grams_per_unit=15,
+        minimum_intake=0,
+        maximum_intake=9,
+    ),
+]
+
+_OBJECTIVE = Objective(sense="maximize", nutrient="protein")
+
+_CONSTRAINTS = [
+    Constraint(min_max="max", nutrient="energy", unit="energy", value=208),
+]
+
+_TIGHTER_CONSTRAINTS = [
+    Constraint(min_max="max", nutrient="energy", unit="energy", value=206),
+    Constraint(min_max="min", nutrient="protein", unit="amount", value=15),
+]
+
+_PREVIOUS_FOOD_INTAKES = {"boiled_egg": 3.0, "broccoli": 1.0}
+
+
+def _build_linear_model(constraints: list[Constraint]) -> LinearModel:
+    return ModelBuilder(_FOOD_INFORMATION).build_linear_model(
+        _OBJECTIVE, constraints
+    )
+
+
+def test_negative_previous_food_intakes() -> None:
+    with pytest.raises(
+        ValueError, match="Previous food intakes must be non-negative."
+    ):
+        WarmStart({"boiled_egg": -1})
+
+
+def test_initial_values() -> None:
+    warm_start = WarmStart({"boiled_egg": 5.0})
+
+    initial_values = warm_start.initial_values(
+        _build_linear_model(_CONSTRAINTS)
+    )
+
+    assert initial_values.tolist() == [3.0, 0.0]
+
+
+def test_proven_optimum_for_restricted_model() -> None:
+    warm_start = WarmStart(
+        _PREVIOUS_FOOD_INTAKES, _build_linear_model(_CONSTRAINTS)
+    )
+
+    proven_optimum = warm_start.find_proven_optimum(
+        _build_linear_model(_TIGHTER_CONSTRAINTS)
+    )
+
+    assert proven_optimum == _PREVIOUS_FOOD_INTAKES
+
+
+def test_no_proven_optimum_for_relaxed_model() -> None:
+    warm_start = WarmStart(
+        _PREVIOUS_FOOD_INTAKES, _build_linear_model(_TIGHTER_CONSTRAINTS)
+    )
+
+    proven_optimum = warm_start.find_proven_optimum(
+        _build_linear_model(_CONSTRAINTS)
+    )
+
+    assert proven_optimum is None
+
+
+def test_no_proven_optimum_when_infeasible() -> None:
+    warm_start = WarmStart({"boiled_egg": 3.0, "broccoli": 9.0})
+
+    proven_optimum = warm_start.find_proven_optimum(
+        _build_linear_model(_CONSTRAINTS)
+    )
+
+    assert proven_optimum is None
+
+
+def test_proven_optimum_at_relaxation_bound() -> None:
+    warm_start = WarmStart({"boiled_egg": 3.0, "broccoli": 9.0})
+
+    proven_optimum = warm_start.find_proven_optimum(_build_linear_model([]))
+
+    assert proven_optimum == {"boiled_egg": 3.0, "broccoli": 9.0}
+
+
+def test_session_store() -> None:
+    session_store = WarmStartSessionStore(max_sessions=1)
+    session_store.save(
+        "first",
+        _FOOD_INFORMATION,
+        _OBJECTIVE,
+        _CONSTRAINTS,
+        _PREVIOUS_FOOD_INTAKES,
+    )
+    session_store.save(
+        "second",
+        _FOOD_INFORMATION,
+        _OBJECTIVE,
+        _CONSTRAINTS,
+        _PREVIOUS_FOOD_INTAKES,
+    )
+
+    warm_start = session_store.get("second")
+
+    assert session_store.get("first") is None
+    assert warm_start is not None
+    assert (
+        warm_start.find_proven_optimum(
+            _build_linear_model(_TIGHTER_CONSTRAINTS)
+        )
+        == _PREVIOUS_FOOD_INTAKES
+    )
+
+
+def test_session_store_from_environment(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("WARM_START_SESSIONS", "0")
+
+    assert WarmStartSessionStore.from_environment() is None
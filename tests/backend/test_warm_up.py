@@ -0,0 +1,40 @@
+import os
+from unittest import mock
+
+from src.solver_backend import CbcSolverBackend
+from src.warm_up import WarmUp
+
+
+def test_warm_up() -> None:
+    warm_up = WarmUp(True)
+
+    assert not warm_up.is_complete
+    assert warm_up.duration is None
+
+    warm_up.start()
+    warm_up.start()
+
+    assert warm_up.wait(30)
+    assert warm_up.duration is not None
+    assert warm_up.duration > 0
+
+
+def test_warm_up_completes_when_solve_fails() -> None:
+    warm_up = WarmUp(True)
+
+    with mock.patch.object(
+        CbcSolverBackend, "solve", side_effect=RuntimeError("No solver")
+    ):
+        warm_up.run()
+
+    assert warm_up.is_complete
+
+
+def test_disabled_warm_up() -> None:
+    with mock.patch.dict(os.environ, {"WARM_UP": "false"}):
+        warm_up = WarmUp.from_environment()
+
+    warm_up.start()
+
+    assert warm_up.is_complete
+    assert warm_up.duration is None
@@ -485,6 +485,44 @@ describe("Nutrition Optimizer", () => {
       expect(pfcRatioChart.innerHTML).not.toBe("");
     });
 
+    test("should send the previous solution when optimizing again", async () => {
+      // Arrange
+      (global.fetch as jest.Mock)
+        .mockResolvedValueOnce({
+          ok: true,
+          json: () =>
+            Promise.resolve({
+              status: "Optimal",
+              pfcRatio: { protein: 34.5, fat: 64.6, carbohydrates: 0.8 },
+              totalNutrientValues: {
+                energy: 134,
+                protein: 12.5,
+                fat: 10.4,
+                carbohydrates: 0.3,
+              },
+              foodIntakes: { boiled_egg: 1 },
+              message: "",
+              sessionId: "test-session",
+            }),
+        } as never)
+        .mockResolvedValueOnce({
+          ok: true,
+          json: () =>
+            Promise.resolve({ status: "Infeasible", message: "" }),
+        } as never);
+
+      // Act
+      await optimize();
+      await optimize();
+
+      // Assert
+      const [, request] = (global.fetch as jest.Mock).mock.calls[1];
+      const body = JSON.parse(request.body);
+
+      expect(body.sessionId).toBe("test-session");
+      expect(body.previousFoodIntakes).toEqual({ boiled_egg: 1 });
+    });
+
     test("should handle infeasible optimization result and display an alert", async () => {
       // Arrange
       (global.fetch as jest.Mock).mockResolvedValueOnce({